@@ -14,20 +14,33 @@ paths_store = {
     # Raw
     "raw-data": Path('data/raw/data1.csv'),
     # "raw": Path('data/raw/data1_sample.csv'),
+    # The raw file read untyped, as the input of schema ingestion
+    "raw-source": Path('data/raw/data1.csv'),
+
+    # Schema ingestion (``Config.schema_ingestion``): clean rows, rejected rows and counts
+    "ingested-data": Path('data/processed/ingested.csv'),
+    "quarantine": Path('data/quarantine/quarantine.csv'),
+    "ingestion-report": Path('reports/analysis/ingestion_report.json'),
 
     # Processed
     "processed-data": Path('data/processed/processed.csv'),
     "transformed-data": Path('data/processed/transformed.csv'),
     "feature-eng": Path('data/processed/feature_eng.csv'),
+    # Sorted uint64 hashes of processed rows, one .npy per source file (``Config.dedup_index``)
+    "dedup-index": Path('data/processed/dedup_index/'),
 
     # Raw EDA
     "raw-data-metadata": Path('reports/analysis/raw_metadata_log.txt'),
+    "raw-data-profile": Path('reports/analysis/raw_profile.json'),
     "raw-data-skew-kurt": Path('reports/analysis/raw_skew_kurt.json'),
+    "raw-data-sketches": Path('reports/analysis/raw_sketches.json'),
     "raw-quality-report": Path('reports/analysis/raw_profiling_report.html'),
 
     # processed EDA
     "transformed-data-metadata": Path('reports/analysis/processed_metadata_log.txt'),
+    "transformed-data-profile": Path('reports/analysis/processed_profile.json'),
     "transformed-data-skew-kurt": Path('reports/analysis/processed_skew_kurt.json'),
+    "transformed-data-sketches": Path('reports/analysis/processed_sketches.json'),
     "transformed-data-quality-report": Path('reports/analysis/processed_profiling_report.html'),
 
     # Model data
@@ -43,12 +56,49 @@ paths_store = {
 
     "y-test-pred": Path('data/model/y_test_pred.npy'),
 
+    # Step result cache manifest
+    "step-cache": Path('.cache/step_cache.json'),
+    "state-spill": Path('.cache/state_spill/'),
+
+    # Per-step resource records, one JSON line per step
+    "run-metrics": Path('log/run_metrics.jsonl'),
+
+    # SQLite history of runs and step timings, read by `main.py report`
+    "run-history": Path('log/run_history.db'),
+
+    # Opt-in Chrome trace and collapsed-stack profile of a run
+    "trace": Path('log/trace.json'),
+    "profile": Path('log/profile.collapsed'),
+
+    # Unix socket of the warm pipeline daemon (`main.py serve` / `main.py submit`)
+    "daemon-socket": Path('.cache/pipeline.sock'),
+
     # Figures
     "raw_figures": Path('reports/analysis/'),
     "transformed_figures": Path('reports/processed_eda/'),
     "evaluation_figures": Path('reports/evaluation/'),
 }
 
+# Intermediate tabular artifacts whose on-disk format follows ``Config.checkpoint_format``
+checkpoint_keys = [
+    "ingested-data",
+    "processed-data",
+    "transformed-data",
+    "feature-eng",
+    "x-train-selected",
+    "x-test-selected",
+    "x-train",
+    "x-test",
+    "y-train",
+    "y-test",
+]
+
+checkpoint_suffixes = {
+    "csv": ".csv",
+    "parquet": ".parquet",
+    "feather": ".feather",
+}
+
 
 @attr.s
 class Paths:
@@ -64,3 +114,15 @@ class Paths:
         if isinstance(key, Path):
             return key
         return self.paths.get(key)
+
+    def get_checkpoint_path(self, key: str, checkpoint_format: str) -> Optional[Path]:
+        """Resolves a checkpoint key to its path in the requested storage format."""
+        path = self.get_path(key)
+        if path is None or key not in checkpoint_keys:
+            return path
+        if checkpoint_format not in checkpoint_suffixes:
+            raise ValueError(
+                f"Unknown checkpoint format: {checkpoint_format}. "
+                f"Valid options are: {list(checkpoint_suffixes)}"
+            )
+        return path.with_suffix(checkpoint_suffixes[checkpoint_format])
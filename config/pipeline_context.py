@@ -5,6 +5,10 @@ import attr
 from config.paths import Paths
 from config.settings import Settings
 from config.states import States
+from src.core.data_handling.artifact_cache import ArtifactCache
+from src.core.data_handling.checkpoint_writer import CheckpointWriter
+from src.core.step_handling.run_selection import RunSelection
+from src.core.step_handling.worker_pool import WorkerPool
 
 
 @attr.s
@@ -14,7 +18,24 @@ class PipelineContext:
         paths: Paths
         settings: Settings
         states: States
+        writer: CheckpointWriter
+        cache: ArtifactCache
+        processes: WorkerPool
+        selection: RunSelection
     """
     paths: Paths = attr.ib(factory=Paths)
     settings: Settings = attr.ib(factory=Settings)
     states: States = attr.ib(factory=States)
+    selection: RunSelection = attr.ib(factory=RunSelection)
+    writer: CheckpointWriter = attr.ib(init=False)
+    cache: ArtifactCache = attr.ib(init=False)
+    processes: WorkerPool = attr.ib(init=False)
+
+    def __attrs_post_init__(self):
+        config = self.settings.config
+        self.writer = CheckpointWriter(max_workers=config.checkpoint_writers)
+        self.cache = ArtifactCache(budget_bytes=config.artifact_cache_mb * 2**20)
+        self.processes = WorkerPool(max_workers=config.process_workers)
+        for state in (self.states.data, self.states.model):
+            state.budget_bytes = config.state_budget_mb * 2**20
+            state.spill_dir = self.paths.get_path("state-spill")
@@ -1,17 +1,18 @@
 from __future__ import annotations
 
+import importlib
 import logging
+import os
 from pprint import pformat
+from typing import Any
+from typing import Optional
 
 import attr
-from imblearn.over_sampling import SMOTE
-from imblearn.under_sampling import RandomUnderSampler
-from lightgbm import LGBMClassifier
-from sklearn.ensemble import RandomForestClassifier
-from xgboost import XGBClassifier
 
 
 class Factory:
+    """Model and sampler classes are named by import path and imported on first use."""
+
     def __init__(self):
         attr_dict = attr.asdict(self)
         logging.debug(f"Factory:\n{pformat(attr_dict)}\n")
@@ -20,12 +21,12 @@ class Factory:
     def create_sampler(sampling_type: str, sampling_params: dict):
         """Creates and returns an instance of the requested sampler."""
         samplers = {
-            "smote": SMOTE,
-            "undersampling": RandomUnderSampler,
+            "smote": "imblearn.over_sampling.SMOTE",
+            "undersampling": "imblearn.under_sampling.RandomUnderSampler",
         }
         if sampling_type not in samplers:
             raise ValueError(f"Unknown sampling technique: {sampling_type}")
-        return samplers[sampling_type](**sampling_params)
+        return Factory.resolve(samplers[sampling_type])(**sampling_params)
 
     @staticmethod
     def create_model(
@@ -34,13 +35,19 @@ class Factory:
     ):
         """Creates and returns an instance of the requested model."""
         models = {
-            "xgb": XGBClassifier,
-            "lgbm": LGBMClassifier,
-            "rf": RandomForestClassifier,
+            "xgb": "xgboost.XGBClassifier",
+            "lgbm": "lightgbm.LGBMClassifier",
+            "rf": "sklearn.ensemble.RandomForestClassifier",
         }
         if model_type not in models:
             raise ValueError(f"Unsupported model type: {model_type}. Add to Factory.")
-        return models[model_type](**model_params)
+        return Factory.resolve(models[model_type])(**model_params)
+
+    @staticmethod
+    def resolve(dotted_name: str) -> Any:
+        """Imports `package.module.Class` and returns the class."""
+        module_name, _, class_name = dotted_name.rpartition(".")
+        return getattr(importlib.import_module(module_name), class_name)
 
 
 def col_types():
@@ -69,8 +76,19 @@ def col_types():
     }
 
 
+def process_workers():
+    """One worker per core up to 4, leaving a core for the parent process."""
+    return min(4, (os.cpu_count() or 1) - 1)
+
+
 @attr.s
 class Config:
+    # Fields that only affect how a run executes, excluded from step fingerprints
+    runtime_fields = (
+        "step_cache", "handoff", "checkpoint_writers", "artifact_cache_mb", "state_budget_mb",
+        "chunk_size", "show_fig", "max_parallel_steps", "process_workers", "ingest_workers",
+    )
+
     random_state: int = attr.ib(default=42)
 
     # Output settings
@@ -79,10 +97,59 @@ class Config:
     save_fig: bool = attr.ib(default=True)
     show_fig: bool = attr.ib(default=False)
 
+    # Checkpoint storage: csv, parquet or feather. Overrides are keyed by path key.
+    checkpoint_format: str = attr.ib(default='parquet')
+    checkpoint_format_overrides: dict = attr.ib(factory=dict)
+
+    # Hand step outputs to downstream steps in memory and persist them in the background
+    handoff: bool = attr.ib(default=True)
+    checkpoint_writers: int = attr.ib(default=4)
+
+    # Worker pool width for running independent steps of a stage concurrently, 1 runs in order
+    max_parallel_steps: int = attr.ib(default=4)
+
+    # Worker processes for steps defined with executor="process", 0 runs them in-process
+    process_workers: int = attr.ib(factory=process_workers)
+
+    # Memory budget for artifacts shared across pipelines, 0 disables the cache
+    artifact_cache_mb: int = attr.ib(default=2048)
+
+    # Resident budget per state store before LRU entries spill to disk, 0 keeps all in memory
+    state_budget_mb: int = attr.ib(default=2048)
+
+    # Skip steps whose inputs, settings and source are unchanged since their last run
+    step_cache: bool = attr.ib(default=True)
+
+    # Streaming ingestion: rows per chunk for stream-capable steps, None loads whole files
+    chunk_size: Optional[int] = attr.ib(default=None)
+
+    # Schema ingestion: validate raw rows against RawDataDict, quarantine failures
+    # and feed the clean rows to every consumer of `raw-data`
+    schema_ingestion: bool = attr.ib(default=False)
+    ingest_workers: int = attr.ib(default=4)
+
+    # Approximate statistics: HyperLogLog distinct and duplicate counts and KLL
+    # quartiles in bounded memory, saved next to the skew/kurt report. Value counts
+    # are dropped for columns with more than `sketch_max_categories` values
+    approximate_stats: bool = attr.ib(default=False)
+    sketch_precision: int = attr.ib(default=14)
+    sketch_k: int = attr.ib(default=200)
+    sketch_max_categories: int = attr.ib(default=1000)
+
+    # Keep the hashes of processed rows in the `dedup-index` directory, per source
+    # file, so runs over other files drop rows already processed. Rerunning the
+    # same file replaces its own hashes rather than dropping its rows
+    dedup_index: bool = attr.ib(default=False)
+
     # Data settings
     target_col: str = attr.ib(default='target')
     col_types: dict = attr.ib(factory=col_types)
 
+    # Compact representation: downcast floats and integer flags/codes at load,
+    # after feature building and before the model matrix is built
+    compact_dtypes: bool = attr.ib(default=False)
+    compact_float_dtype: str = attr.ib(default='float32')
+
     # Feature Engineering & Data Processing
     log_skew_threshold: float = attr.ib(default=1)
     kurtosis_threshold: float = attr.ib(default=3)
@@ -91,6 +158,9 @@ class Config:
     iqr_upper: float = attr.ib(default=0.01)
     iqr_lower: float = attr.ib(default=0.99)
 
+    def get_checkpoint_format(self, path_key: str) -> str:
+        return self.checkpoint_format_overrides.get(path_key, self.checkpoint_format)
+
 
 @attr.s
 class Params:
@@ -140,3 +210,20 @@ class Settings:
     def __attrs_post_init__(self):
         attr_dict = attr.asdict(self)
         logging.debug(f"{self.__class__.__name__}:\n{pformat(attr_dict)}\n")
+
+    def with_overrides(self, overrides: dict) -> Settings:
+        """
+        Copy with `section.field` values replaced, e.g. {"config.chunk_size": 50000}.
+        Raises ValueError on unknown sections or fields.
+        """
+        sections = {}
+        for key, value in overrides.items():
+            section, _, field = key.partition(".")
+            target = getattr(self, section, None) if section in attr.fields_dict(Settings) else None
+            if target is None or field not in attr.fields_dict(type(target)):
+                valid = list(attr.fields_dict(Settings))
+                raise ValueError(f"Unknown setting `{key}`. Use `section.field` with section in {valid}")
+            sections.setdefault(section, {})[field] = value
+        return attr.evolve(self, **{
+            section: attr.evolve(getattr(self, section), **fields) for section, fields in sections.items()
+        })
@@ -1,56 +1,115 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
 
 import attr
+import joblib
+
+from utils.memory_utils import approx_nbytes
 
 
 @attr.s
-class DataState:
+class BudgetedState:
     """
     In-memory state get/set/clear
+    Tracks the approximate size of each entry. Once over `budget_bytes`, the
+    least-recently-used entries are spilled to joblib files in `spill_dir` and
+    memory-mapped back on `get`. A budget of 0 keeps everything resident.
     """
-    _state: dict = attr.ib(factory=dict, init=False)
+    budget_bytes: int = attr.ib(default=0)
+    spill_dir: Optional[Path] = attr.ib(default=None)
+    _state: OrderedDict = attr.ib(factory=OrderedDict, init=False)
+    _sizes: dict = attr.ib(factory=dict, init=False)
+    _spilled: dict = attr.ib(factory=dict, init=False)
+    _lock: threading.RLock = attr.ib(factory=threading.RLock, init=False, repr=False)
 
     def set(self, key, value):
         """Store a value in the state"""
         logging.getLogger("file_access").file_track(
             f"SAVING ``{key}`` to {self.__class__.__name__} in memory")
-        self._state[key] = value
+        with self._lock:
+            self._discard(key)
+            self._state[key] = value
+            self._sizes[key] = approx_nbytes(value)
+            self._enforce_budget()
 
     def get(self, key):
-        """Retrieve a value from the state"""
+        """Retrieve a value from the state, reloading spilled entries memory-mapped"""
         logging.getLogger("file_access").file_track(
             f"LOADING ``{key}`` from {self.__class__.__name__} in memory")
-        return self._state.get(key)
+        with self._lock:
+            if key in self._state:
+                self._state.move_to_end(key)
+                return self._state[key]
+            spill_path = self._spilled.get(key)
+        if spill_path is None:
+            return None
+        logging.getLogger("file_access").file_track(f"Reloading spilled ``{key}`` from ``{spill_path}``")
+        return joblib.load(spill_path, mmap_mode="r")
+
+    def has(self, key):
+        """Check whether a value is stored under key"""
+        with self._lock:
+            return key in self._state or key in self._spilled
 
     def clear(self):
         """Clear all state"""
-        self._state = {}
+        with self._lock:
+            for key in list(self._spilled):
+                self._discard(key)
+            self._state = OrderedDict()
+            self._sizes = {}
+
+    @property
+    def resident_bytes(self) -> int:
+        with self._lock:
+            return sum(self._sizes.values())
+
+    def _enforce_budget(self):
+        if not self.budget_bytes:
+            return
+        # Keep the newest entry resident even if it alone exceeds the budget
+        while self.resident_bytes > self.budget_bytes and len(self._state) > 1:
+            key, value = self._state.popitem(last=False)
+            self._spill(key, value)
+
+    def _spill(self, key, value):
+        spill_dir = Path(self.spill_dir or ".cache/state_spill")
+        spill_dir.mkdir(parents=True, exist_ok=True)
+        safe_key = re.sub(r"[^A-Za-z0-9_-]", "_", str(key))
+        digest = hashlib.blake2b(str(key).encode(), digest_size=4).hexdigest()
+        spill_path = spill_dir / f"{self.__class__.__name__}-{safe_key}-{digest}.joblib"
+        joblib.dump(value, spill_path)
+        self._spilled[key] = spill_path
+        n_bytes = self._sizes.pop(key)
+        logging.debug(f"Spilled ``{key}`` ({n_bytes / 1e6:.1f} MB) from {self.__class__.__name__} to ``{spill_path}``")
+
+    def _discard(self, key):
+        self._state.pop(key, None)
+        self._sizes.pop(key, None)
+        spill_path = self._spilled.pop(key, None)
+        if spill_path is not None and spill_path.exists():
+            spill_path.unlink()
 
 
 @attr.s
-class ModelState:
+class DataState(BudgetedState):
     """
     In-memory state get/set/clear
     """
-    _state: dict = attr.ib(factory=dict, init=False)
-
-    def set(self, key, value):
-        """Store a value in the state"""
-        logging.getLogger("file_access").file_track(
-            f"SAVING ``{key}`` to {self.__class__.__name__} in memory")
-        self._state[key] = value
 
-    def get(self, key):
-        """Retrieve a value from the state"""
-        logging.getLogger("file_access").file_track(
-            f"LOADING ``{key}`` from {self.__class__.__name__} in memory")
-        return self._state.get(key)
 
-    def clear(self):
-        """Clear all state"""
-        self._state = {}
+@attr.s
+class ModelState(BudgetedState):
+    """
+    In-memory state get/set/clear
+    """
 
 
 @attr.s
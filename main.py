@@ -1,38 +1,154 @@
 from __future__ import annotations
 
+import argparse
+import json
 import logging
+import os
+import sys
+from pathlib import Path
 
+from config.paths import Paths
 from config.pipeline_context import PipelineContext
+from src.core.step_handling.run_selection import RunSelection
 from src.core.step_handling.step_factory import StepFactory
 from src.pipelines.data_pipeline import DataPipeline
 from src.pipelines.eda_pipeline import EDAPipeline
 from src.pipelines.model_pipeline import ModelPipeline
-from src.pipelines.steps.steps_debugger import debug_steps
 from src.pipelines.validation_pipeline import ValidationPipeline
 from utils.project_setup import initialise_project_configs
+from utils.run_history import RunHistory
+from utils.tracing import trace_span
 
 
 class MainPipeline:
     def __init__(self, ctx: PipelineContext):
         self.ctx = ctx
 
+    def stages(self):
+        return {
+            "validate": ValidationPipeline(self.ctx).validate_names,
+            "initial-eda": EDAPipeline(self.ctx).initial_exploration,
+            "process": DataPipeline(self.ctx).process,
+            "further-eda": EDAPipeline(self.ctx).further_exploration,
+            "train": ModelPipeline(self.ctx).train,
+            "evaluate": ModelPipeline(self.ctx).evaluate,
+        }
+
     def run(self):
-        """ETL pipeline main entry point."""
+        """ETL pipeline main entry point. Partial runs resume from existing checkpoints."""
+        stages = self.stages()
+        selection = self.ctx.selection
+        if selection.is_partial:
+            selection.prepare(stages)
         steps = [
-            ValidationPipeline(self.ctx).validate_names,
-            EDAPipeline(self.ctx).initial_exploration,
-            DataPipeline(self.ctx).process,
-            EDAPipeline(self.ctx).further_exploration,
-            ModelPipeline(self.ctx).train,
-            ModelPipeline(self.ctx).evaluate
+            selection.stage(name, stage) for name, stage in stages.items()
+            if selection.runs_stage(name)
         ]
-        StepFactory(self.ctx).run_main(steps)
+        with trace_span("MainPipeline.run"):
+            StepFactory(self.ctx).run_main(steps)
+
+
+def report(ctx: PipelineContext, args) -> int:
+    """Prints the latest (or `--run`) run against its rolling baseline; 1 if any step regressed or there is no such run."""
+    history = RunHistory(ctx.paths.get_path("run-history"))
+    try:
+        comparisons = history.compare(run_id=args.run, window=args.window, threshold=args.threshold)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    run_id = args.run or history.latest_run()["run_id"]
+    print(history.format_report(comparisons, run_id))
+    return int(any(c.regressions for c in comparisons))
+
+
+def parse_overrides(args_overrides: list) -> dict:
+    """`--set SECTION.FIELD=VALUE` options as Settings overrides; values parse as JSON, else strings."""
+    overrides = {}
+    for override in args_overrides:
+        key, sep, value = override.partition("=")
+        if not sep:
+            raise ValueError(f"Expected SECTION.FIELD=VALUE, got `{override}`")
+        try:
+            overrides[key] = json.loads(value)
+        except json.JSONDecodeError:
+            overrides[key] = value
+    return overrides
+
+
+def submit_request(args) -> dict:
+    """Builds a daemon request from the command line."""
+    if args.shutdown:
+        return {"command": "shutdown"}
+    return {"start": args.start, "stop": args.stop, "only": args.only, "overrides": parse_overrides(args.overrides)}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run the pipeline, or part of it from existing checkpoints. "
+                    "`report` compares the latest run's step timings with previous runs.",
+        epilog="Selectors: a stage (validate, initial-eda, process, further-eda, train, evaluate), "
+               "`stage:step`, or a step name unique across stages.",
+    )
+    parser.add_argument(
+        "command", nargs="?", default="run", choices=["run", "report", "serve", "submit"],
+        help="run in this process (default), report on run history, serve a warm daemon "
+             "or submit a run to it",
+    )
+    parser.add_argument("--from", dest="start", metavar="SELECTOR", help="First stage/step to run")
+    parser.add_argument("--until", dest="stop", metavar="SELECTOR", help="Last stage/step to run")
+    parser.add_argument("--only", metavar="SELECTOR", help="Run a single stage/step")
+    parser.add_argument("--trace", action="store_true", help="Write a Chrome trace of the run to log/trace.json")
+    parser.add_argument(
+        "--profile", action="store_true", help="Write sampled per-step collapsed stacks to log/profile.collapsed"
+    )
+    parser.add_argument(
+        "--dump-steps", action="store_true", help="Write the step registry to src/pipelines/steps/steps_metadata.json"
+    )
+    parser.add_argument(
+        "--set", dest="overrides", action="append", default=[], metavar="SECTION.FIELD=VALUE",
+        help="Settings override for the run, the daemon's defaults or a submitted run, "
+             "e.g. config.chunk_size=50000 (JSON values)",
+    )
+    daemon = parser.add_argument_group("serve / submit")
+    daemon.add_argument("--socket", type=Path, default=None, help="Daemon socket (default: .cache/pipeline.sock)")
+    daemon.add_argument("--shutdown", action="store_true", help="Stop the daemon")
+    reporting = parser.add_argument_group("report")
+    reporting.add_argument("--run", metavar="RUN_ID", help="Run to report on (default: latest)")
+    reporting.add_argument("--window", type=int, default=5, help="Previous successful runs in the baseline")
+    reporting.add_argument(
+        "--threshold", type=float, default=0.25, help="Relative increase over the baseline median to flag"
+    )
+    args = parser.parse_args(argv)
+    if args.overrides and args.command == "report":
+        parser.error("--set does not apply to `report`")
+    return args
 
 
 if __name__ == "__main__":
-    ctx = initialise_project_configs()
-    debug_steps()
+    args = parse_args()
+    socket_path = args.socket or Paths().get_path("daemon-socket")
+    if args.command == "submit":
+        # Thin client: no project setup, the daemon holds the context
+        from src.core.pipeline_daemon import submit
+        sys.exit(submit(socket_path, submit_request(args)))
+    # Set before setup so spawned workers inherit them
+    if args.trace:
+        os.environ["PIPELINE_TRACE"] = "1"
+    if args.profile:
+        os.environ["PIPELINE_PROFILE"] = "1"
+    ctx = initialise_project_configs(overrides=parse_overrides(args.overrides))
+    if args.command == "report":
+        sys.exit(report(ctx, args))
+    if args.command == "serve":
+        from src.core.pipeline_daemon import PipelineDaemon
+        PipelineDaemon(ctx, lambda job_ctx: MainPipeline(job_ctx).run(), socket_path).serve()
+        sys.exit(0)
+    if args.dump_steps:
+        # Imports every step module, so only on request
+        from src.pipelines.steps.steps_debugger import debug_steps
+        debug_steps()
     try:
+        ctx.selection = RunSelection(start=args.start, stop=args.stop, only=args.only)
         logging.info(f"Beginning Top-Level Pipeline from ``main.py``...\n{"=" * 125}")
         MainPipeline(ctx).run()
     except Exception as e:
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Tuple
+
+from utils.memory_utils import approx_nbytes
+
+
+class ArtifactCache:
+    """
+    Summary
+    ----------
+    Context-scoped, memory-budgeted cache of loaded artifacts
+    Shared by every DataModuleHandler built from the same PipelineContext,
+    so each artifact is parsed at most once per run.
+
+    Extended Summary
+    ----------
+    - Entries keyed by path (plus load options) and validated against the
+      file version (mtime, size) on every hit
+    - Invalidated on save
+    - Least-recently-used entries evicted once over `budget_bytes`
+    - Concurrent loads of the same key wait on a single read
+    - pandas objects are served as shallow copies; copy-on-write (pandas>=3,
+      as required) keeps in-place edits by a reader out of the cached entry
+
+    Parameters
+    ----------
+    budget_bytes : int
+        Memory budget for cached artifacts. 0 disables caching
+    """
+
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self._entries: OrderedDict[Hashable, Tuple[Tuple[int, int], Any, int]] = OrderedDict()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, path: Path, loader: Callable[[], Any], options: Tuple = ()) -> Any:
+        """Returns the cached artifact for the current file version, loading it on a miss."""
+        if not self.budget_bytes:
+            return loader()
+        key = (str(path), options)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            version = self._version(path)
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] == version:
+                    self._entries.move_to_end(key)
+                    logging.getLogger("file_access").file_track(f"Cache HIT: ``{path}``")
+                    return self._share(entry[1])
+
+            data = loader()
+            self._put(key, version, data)
+            return self._share(data)
+
+    def invalidate(self, path: Path):
+        """Drops every cached entry loaded from `path`."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == str(path)]:
+                self.used_bytes -= self._entries.pop(key)[2]
+
+    def _put(self, key: Hashable, version: Tuple[int, int], data: Any):
+        n_bytes = approx_nbytes(data)
+        with self._lock:
+            if key in self._entries:
+                self.used_bytes -= self._entries.pop(key)[2]
+            if n_bytes > self.budget_bytes:
+                logging.debug(f"Not caching ``{key[0]}``: {n_bytes / 1e6:.1f} MB exceeds cache budget")
+                return
+            self._entries[key] = (version, data, n_bytes)
+            self.used_bytes += n_bytes
+            while self.used_bytes > self.budget_bytes:
+                evicted_key, (_, _, evicted_bytes) = self._entries.popitem(last=False)
+                self.used_bytes -= evicted_bytes
+                logging.debug(f"Evicted ``{evicted_key[0]}`` from artifact cache")
+
+    @staticmethod
+    def _version(path: Path) -> Tuple[int, int]:
+        stat = Path(path).stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _share(data: Any) -> Any:
+        """Shallow copy of pandas objects; pandas>=3 copy-on-write keeps the cached entry intact."""
+        if hasattr(data, "copy") and hasattr(data, "memory_usage"):
+            return data.copy(deep=False)
+        return data
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from utils.tracing import trace_span
+
+
+class CheckpointWriter:
+    """
+    Summary
+    ----------
+    Concurrent write-behind persistence for checkpoint artifacts
+    Runs DataModule saves on a bounded thread pool so the pipeline can hand
+    live objects to the next step while artifacts are written to disk.
+
+    Extended Summary
+    ----------
+    - Writes land atomically (temp file, then rename) via DataModule.save
+    - Writes to the same path are chained so the latest submission wins
+    - Records bytes written and latency per artifact in `stats`
+    - Tracks the pending write per path for `wait_for` and `when_written`
+    - `flush` blocks until all writes complete and re-raises the first failure
+    - Awaited at the end of the top-level pipeline run
+
+    Outputs
+    ----------
+    Initialized writer with an idle background thread pool
+
+    Parameters
+    ----------
+    max_workers : int
+        Number of concurrent writer threads
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="checkpoint-writer")
+        self.stats: List[Dict[str, Any]] = []
+        self._pending: Dict[str, Future] = {}
+        self._errors: List[Exception] = []
+        self._callbacks: List[Future] = []
+        self._lock = threading.Lock()
+
+    def submit(self, dm: Any, data: Any) -> Future:
+        """Queues `dm.save(data)` in the background."""
+        key = str(dm.data_path)
+        with self._lock:
+            previous = self._pending.get(key)
+            future = self._executor.submit(self._write, dm, data, previous)
+            self._pending[key] = future
+        future.add_done_callback(lambda f: self._release(key, f))
+        return future
+
+    def submit_all(self, dm_data_pairs: List[Tuple[Any, Any]]) -> List[Future]:
+        """Queues several artifacts to be written concurrently."""
+        return [self.submit(dm, data) for dm, data in dm_data_pairs]
+
+    def _write(self, dm: Any, data: Any, previous: Optional[Future]):
+        if previous is not None:
+            previous.exception()  # Preserve submission order for the same path
+        start = time.perf_counter()
+        n_bytes = dm.save(data)
+        seconds = time.perf_counter() - start
+        with self._lock:
+            self.stats.append({"path": str(dm.data_path), "bytes": n_bytes, "seconds": seconds})
+        logging.getLogger("file_access").file_track(
+            f"Wrote ``{dm.data_path}``: {n_bytes / 1e6:.2f} MB in {seconds:.3f}s")
+        return n_bytes
+
+    def is_pending(self, path: Path) -> bool:
+        with self._lock:
+            return str(path) in self._pending
+
+    def wait_for(self, path: Path):
+        """Blocks until any pending write to `path` has completed."""
+        with self._lock:
+            future = self._pending.get(str(path))
+        if future is not None:
+            with trace_span("CheckpointWriter.wait_for", cat="wait", path=path):
+                future.result()
+
+    def when_written(self, paths: List[Path], fn: Callable[[], Any]):
+        """Calls `fn` once every pending write among `paths` has completed successfully."""
+        with self._lock:
+            futures = [self._pending[str(p)] for p in paths if str(p) in self._pending]
+        if not futures:
+            fn()
+            return
+
+        remaining = [len(futures)]
+        failed = [False]
+        counter_lock = threading.Lock()
+        called = Future()
+        with self._lock:
+            self._callbacks.append(called)
+
+        def on_done(future):
+            with counter_lock:
+                remaining[0] -= 1
+                failed[0] = failed[0] or future.exception() is not None
+                ready = remaining[0] == 0
+            if ready:
+                try:
+                    if not failed[0]:
+                        fn()
+                except Exception as e:
+                    logging.error(f"Post-write callback failed: {e}")
+                finally:
+                    called.set_result(None)
+
+        for future in futures:
+            future.add_done_callback(on_done)
+
+    def flush(self):
+        """Waits for all queued writes and their callbacks, re-raising the first write failure."""
+        with self._lock:
+            futures = list(self._pending.values())
+        if futures:
+            logging.debug(f"Flushing {len(futures)} pending checkpoint writes")
+        for future in futures:
+            future.exception()
+        with self._lock:
+            callbacks, self._callbacks = self._callbacks, []
+        for called in callbacks:
+            called.result()
+        with self._lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise errors[0]
+
+    def _release(self, key: str, future: Future):
+        error = future.exception()
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+            if error is not None:
+                self._errors.append(error)
+        if error is not None:
+            logging.error(f"Background write to ``{key}`` failed: {error}")
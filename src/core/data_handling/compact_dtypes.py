@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import logging
+
+import pandas as pd
+
+from config.pipeline_context import PipelineContext
+from config.settings import Config
+
+
+class CompactDtypes:
+    """
+    Summary
+    ----------
+    Config-driven compact dtype policy
+    Downcasts numeric columns when ``Config.compact_dtypes`` is enabled and
+    reports the memory saved per pipeline stage.
+
+    Extended Summary
+    ----------
+    - Continuous features: ``Config.compact_float_dtype`` (float32 by default)
+    - Integer columns, including 0/1 flags, encoded `loc` and `target`:
+      smallest integer dtype that holds the values (int8 for flags and codes)
+    - Bool and non-numeric columns are left unchanged
+
+    Parameters
+    ----------
+    ctx : PipelineContext
+        Contains the Config toggling the policy
+    """
+
+    def __init__(self, ctx: PipelineContext):
+        self.config: Config = ctx.settings.config
+
+    def apply(self, df, stage: str):
+        if not self.config.compact_dtypes or not isinstance(df, pd.DataFrame):
+            return df
+        before = df.memory_usage(deep=True).sum()
+        df = df.apply(self.compact_column)
+        after = df.memory_usage(deep=True).sum()
+        logging.info(
+            f"Compact dtypes [{stage}]: {before / 1e6:.2f} MB -> {after / 1e6:.2f} MB "
+            f"(saved {(before - after) / 1e6:.2f} MB)"
+        )
+        return df
+
+    def compact_column(self, col: pd.Series) -> pd.Series:
+        if pd.api.types.is_bool_dtype(col) or not pd.api.types.is_numeric_dtype(col):
+            return col
+        if pd.api.types.is_float_dtype(col):
+            return col.astype(self.config.compact_float_dtype)
+        return pd.to_numeric(col, downcast="integer")
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+import attrs
+import pandas as pd
+
+from src.core.data_handling.data_module import DataModule
+
+
+@attrs.define
+class DataChunks:
+    """
+    Re-iterable stream of bounded-size DataFrame chunks.
+    Each iteration re-opens the underlying file, so consumers may take
+    several passes while peak memory stays bounded by `chunk_size`.
+    `columns` is the default projection of each pass.
+    """
+    dm: DataModule
+    chunk_size: int
+    columns: Optional[List[str]] = None
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        return self.iter(columns=self.columns)
+
+    def iter(self, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        return self.dm.iter_chunks(self.chunk_size, columns=columns)
+
+
+def iter_frames(dataset) -> Iterator[pd.DataFrame]:
+    """Yields chunks from a DataChunks stream, or the whole frame otherwise."""
+    if isinstance(dataset, DataChunks):
+        yield from dataset
+    else:
+        yield dataset
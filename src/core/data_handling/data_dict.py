@@ -5,6 +5,9 @@ import pandas as pd
 
 
 class ApplyDataDict:
+    # File formats whose parser accepts the compiled reader arguments
+    pushdown_suffixes = (".csv",)
+
     def __init__(self):
         """Children to overwrite self.data"""
         self.data = {
@@ -12,7 +15,65 @@ class ApplyDataDict:
             "use_cols": [],
             "rename_mapping": {},
             "na_values": [],
+            "converters": {},
+        }
+
+    def source_columns(self, columns):
+        """Maps renamed column names back to their names in the source file"""
+        if columns is None:
+            return None
+        inverse_mapping = {v: k for k, v in self.data["rename_mapping"].items()}
+        return [inverse_mapping.get(col, col) for col in columns]
+
+    def reader_kwargs(self, columns=None):
+        """
+        Compiles the data dictionary into `pd.read_csv` arguments
+        dtypes, usecols, na_values and converters are keyed by source column names,
+        so the parser produces the typed frame in one pass. `columns` further
+        projects the read, using renamed column names.
+        """
+        source = {v: k for k, v in self.data["rename_mapping"].items()}
+        converters = {
+            source.get(col, col): func for col, func in self.data.get("converters", {}).items()
         }
+        dtypes = {}
+        parse_dates = []
+        for col, dtype in self.data["dtypes"].items():
+            src = source.get(col, col)
+            if src in converters:
+                continue
+            if dtype == "datetime":
+                parse_dates.append(src)
+            elif dtype == float:
+                dtypes[src] = "float64"
+            elif dtype == int:
+                dtypes[src] = "Int64"  # Nullable until `apply_post_read` checks for NAs
+            elif dtype == str:
+                dtypes[src] = object
+            elif isinstance(dtype, str):
+                dtypes[src] = dtype
+
+        kwargs = {"dtype": dtypes}
+        if self.data.get("na_values"):
+            kwargs["na_values"] = self.data["na_values"]
+        if converters:
+            kwargs["converters"] = converters
+        if parse_dates:
+            kwargs["parse_dates"] = parse_dates
+
+        selected = [set(self.source_columns(cols)) for cols in (self.data["use_cols"], columns) if cols]
+        if selected:
+            keep = set.intersection(*selected)
+            kwargs["usecols"] = lambda col: col in keep
+        return kwargs
+
+    def apply_post_read(self, df):
+        """Renames, and narrows NA-free nullable int columns, after a pushed-down read"""
+        df = self.apply_rename_mapping(df)
+        for col, dtype in self.data["dtypes"].items():
+            if dtype == int and col in df.columns and not df[col].isna().any():
+                df[col] = df[col].astype(int)
+        return df
 
     def apply_rename_mapping(self, df):
         return df.rename(columns=self.data["rename_mapping"])
@@ -67,6 +128,7 @@ class NoDataDict(ApplyDataDict):
             "dtypes": {},
             "use_cols": [],
             "na_values": [],
+            "converters": {},
         }
 
 
@@ -110,4 +172,12 @@ class RawDataDict(ApplyDataDict):
             },
             "use_cols": [],
             "na_values": [],
+            "converters": {},
         }
+
+
+class RawSourceDataDict(RawDataDict):
+    """Raw file with every column read as strings, for schema ingestion to type row by row"""
+    def __init__(self):
+        super().__init__()
+        self.data["dtypes"] = {col: str for col in self.data["dtypes"]}
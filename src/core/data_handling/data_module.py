@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import logging
 from pathlib import Path
+from typing import List
 from typing import Optional
 
 from config.pipeline_context import PipelineContext
 from config.states import DataState
+from src.core.data_handling.compact_dtypes import CompactDtypes
 from utils.file_access import FileAccess
 
+tabular_suffixes = (".csv", ".parquet", ".feather", ".xlsx")
+
 
 class DataModule:
     """
@@ -37,6 +42,8 @@ class DataModule:
         Filesystem path for disk storage, by default None
     data_dict : dict, optional
         Data quality transformations specification, by default None
+    path_key : str, optional
+        Path config key the module was resolved from, by default None
 
     Raises
     ------
@@ -49,6 +56,7 @@ class DataModule:
         state_key: str = None,
         data_path: Path = None,
         data_dict: Optional[dict] = None,
+        path_key: Optional[str] = None,
     ):
         if not state_key and not data_path:
             raise ValueError("Either `state_key` or `data_path` must be provided.")
@@ -57,27 +65,66 @@ class DataModule:
         self.state_key = state_key
         self.data_path = data_path
         self.dd = data_dict
+        self.path_key = path_key
         self.data_state: DataState = ctx.states.data
-
-    def load(self):
-        """Load data either from the in-memory state or a local file"""
+        self.compact = CompactDtypes(ctx)
+
+    def load(self, columns: Optional[List[str]] = None, mmap_mode: Optional[str] = None):
+        """
+        Load data either from the in-memory state or a local file
+        `columns` projects the read for formats that support it.
+        `mmap_mode` memory-maps .npy/.joblib artifacts for read-only consumers.
+        """
         if self.state_key:
-            data = self._load_from_state()
+            return self.apply_data_dict(self._load_from_state())
         elif self.data_path and self.data_path.exists():
-            data = self._load_from_file()
+            data = self._load_from_file(columns, mmap_mode)
+            if self.data_path.suffix in tabular_suffixes:
+                if columns is not None:
+                    data = data[columns]  # csv `usecols` keeps file order
+                data = self.compact.apply(data, f"load {self.path_key}")
+            return data
         else:
             raise ValueError(
                 f"Unable to load data. `state_key`: {self.state_key}, `data_path`: {self.data_path}"
             )
-        data = self.apply_data_dict(data)
-        return data
 
-    def save(self, data):
-        """Persists data to either in-memory state or disk"""
+    def iter_chunks(self, chunk_size: int, columns: Optional[List[str]] = None):
+        """
+        Stream a local file in bounded row chunks
+        Data dictionary transformations are applied per chunk.
+        """
+        if self.state_key or not (self.data_path and self.data_path.exists()):
+            raise ValueError(
+                f"Unable to stream data. `state_key`: {self.state_key}, `data_path`: {self.data_path}"
+            )
+        n_yielded = 0
+        if self._can_push_down():
+            try:
+                for chunk in FileAccess.iter_file(
+                    self.data_path, chunk_size, **self.dd.reader_kwargs(columns)
+                ):
+                    chunk = self.dd.apply_post_read(chunk)
+                    yield self.compact.apply(chunk if columns is None else chunk[columns], f"load {self.path_key}")
+                    n_yielded += 1
+                return
+            except (ValueError, TypeError) as e:
+                self._log_fallback(e)
+
+        source_columns = self.dd.source_columns(columns) if self.dd else columns
+        chunks = FileAccess.iter_file(self.data_path, chunk_size, columns=source_columns)
+        for i, chunk in enumerate(chunks):
+            if i >= n_yielded:  # Resume after chunks already served by the pushed-down read
+                chunk = self.apply_data_dict(chunk)
+                yield self.compact.apply(chunk if columns is None else chunk[columns], f"load {self.path_key}")
+
+    def save(self, data) -> int:
+        """Persists data to either in-memory state or disk. Returns bytes written to disk."""
         if self.state_key:
             self._save_to_state(data)
+            return 0
         elif self.data_path:
-            self._save_to_file(data)
+            return self._save_to_file(data)
         else:
             raise ValueError(
                 f"Unable to save data. `state_key`: {self.state_key}, `data_path`: {self.data_path}"
@@ -92,11 +139,31 @@ class DataModule:
             df = func(df)
         return df
 
-    def _load_from_file(self):
-        return FileAccess.load_file(self.data_path)
-
-    def _save_to_file(self, data):
-        FileAccess.save_file(data, self.data_path)
+    def _load_from_file(self, columns: Optional[List[str]] = None, mmap_mode: Optional[str] = None):
+        """
+        Pushes the data dictionary down into the parser where the format allows,
+        falling back to post-load transforms otherwise.
+        """
+        if self._can_push_down():
+            try:
+                df = FileAccess.load_file(self.data_path, **self.dd.reader_kwargs(columns))
+                return self.dd.apply_post_read(df)
+            except (ValueError, TypeError) as e:
+                self._log_fallback(e)
+        source_columns = self.dd.source_columns(columns) if self.dd else columns
+        data = FileAccess.load_file(self.data_path, columns=source_columns, mmap_mode=mmap_mode)
+        return self.apply_data_dict(data)
+
+    def _can_push_down(self) -> bool:
+        return bool(self.dd) and self.data_path.suffix in self.dd.pushdown_suffixes
+
+    def _log_fallback(self, e: Exception):
+        logging.warning(
+            f"Typed read of ``{self.data_path}`` failed ({e}). Falling back to post-load transforms."
+        )
+
+    def _save_to_file(self, data) -> int:
+        return FileAccess.save_file_atomic(data, self.data_path)
 
     def _load_from_state(self):
         return self.data_state.get(self.state_key)
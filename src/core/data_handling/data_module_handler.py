@@ -2,16 +2,22 @@ from __future__ import annotations
 
 from typing import Any
 from typing import Dict
+from typing import List
+from typing import Optional
 
 import pandas as pd
 
 from config.pipeline_context import PipelineContext
+from src.core.data_handling.data_chunks import DataChunks
 from src.core.data_handling.data_dict import RawDataDict
+from src.core.data_handling.data_dict import RawSourceDataDict
 from src.core.data_handling.data_module import DataModule
+from src.core.data_handling.data_module import tabular_suffixes
 
 
 module_map: Dict[str, dict] = {
     "raw-data": RawDataDict(),
+    "raw-source": RawSourceDataDict(),
 }
 
 
@@ -26,7 +32,12 @@ class DataModuleHandler:
     ----------
     - Maintains mapping between path keys and DataModule configurations
     - Caches DataModule instances for reuse
-    - Coordinates bulk save operations
+    - Shares loaded artifacts across pipelines through the context's ArtifactCache
+    - Coordinates bulk, concurrent save operations
+    - Hands saved outputs to downstream loads in memory (``Config.handoff``),
+      persisting them through the context's background CheckpointWriter.
+      Frames are handed over as shallow copies, which pandas>=3 copy-on-write
+      keeps from mutating the original
     - Implements error handling for data operations
 
     Outputs
@@ -50,35 +61,110 @@ class DataModuleHandler:
         """
         Retrieves DataModule instance
         Implements caching to avoid redundant initialisations.
+        Checkpoint keys resolve to the configured columnar/csv format.
         """
+        path_key = self.resolve_key(path_key)
         data_dict = self.module_map.get(path_key)
+        checkpoint_format = self.ctx.settings.config.get_checkpoint_format(path_key)
         dm = DataModule(
             self.ctx,
-            data_path=self.ctx.paths.get_path(path_key),
-            data_dict=data_dict
+            data_path=self.ctx.paths.get_checkpoint_path(path_key, checkpoint_format),
+            data_dict=data_dict,
+            path_key=path_key,
         )
         if path_key not in self.modules:
             self.modules[path_key] = dm
         return self.modules[path_key]
 
+    def resolve_key(self, path_key: str) -> str:
+        """With schema ingestion enabled, consumers of `raw-data` read the ingested clean rows."""
+        if path_key == "raw-data" and self.ctx.settings.config.schema_ingestion:
+            return "ingested-data"
+        return path_key
+
     def save_data(self, path_data_pair: Dict[str, pd.DataFrame]):
-        """Handles multiple data persistence operations in single call."""
-        try:
+        """
+        Handles multiple data persistence operations in single call.
+        All artifacts are written concurrently on the context's CheckpointWriter.
+        With handoff enabled, outputs are kept live for downstream steps and the
+        writes complete in the background; otherwise this blocks until written.
+        """
+        dm_data_pairs = [(self.get_dm(path_key), data) for path_key, data in path_data_pair.items()]
+        for dm, _ in dm_data_pairs:
+            self.ctx.cache.invalidate(dm.data_path)
+        if self.ctx.settings.config.handoff:
             for path_key, data in path_data_pair.items():
-                dm = self.get_dm(path_key)
-                return dm.save(data)
-        except TypeError:
-            raise TypeError(f"Unsupported data type: {type(data)} for path: {path_key}")
+                self.ctx.states.data.set(path_key, data)
+        futures = self.ctx.writer.submit_all(dm_data_pairs)
+        if self.ctx.settings.config.handoff:
+            return
+        for (dm, data), future in zip(dm_data_pairs, futures):
+            try:
+                future.result()
+            except TypeError:
+                raise TypeError(f"Unsupported data type: {type(data)} for path: {dm.path_key}")
 
-    def load_dm(self, dm: DataModule) -> Any:
-        """Safe load data from a specified DataModule."""
+    def load_dm(
+        self, dm: DataModule,
+        mmap_mode: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Any:
+        """
+        Safe load data from a specified DataModule.
+        Served from the handoff store, then the context's ArtifactCache, then disk.
+        `mmap_mode` maps .npy/.joblib artifacts read-only from disk, so
+        concurrent processes share pages rather than holding private copies.
+        `columns` projects the read down to the storage reader.
+        """
         if dm is None:
             raise AttributeError('NoneType: Verify module path keys, and path config keys')
+        handed_off = self.load_handoff(dm, columns)
+        if handed_off is not None:
+            return handed_off
+        self.ctx.writer.wait_for(dm.data_path)
         try:
-            if not hasattr(dm, "_loaded_data"):
-                dm._loaded_data = dm.load()
-                if dm._loaded_data is None:
-                    raise ValueError(f"Dataset at {dm.data_path} is empty.")
-            return dm._loaded_data
+            data = self.ctx.cache.get_or_load(
+                dm.data_path,
+                lambda: dm.load(columns=columns, mmap_mode=mmap_mode),
+                options=(("mmap_mode", mmap_mode), ("columns", tuple(columns or ()))),
+            )
+            if data is None:
+                raise ValueError(f"Dataset at {dm.data_path} is empty.")
+            return data
         except Exception as e:
             raise ValueError(f"Failed to load data from {dm.data_path}: {e}")
+
+    def load_handoff(self, dm: DataModule, columns: Optional[List[str]] = None) -> Any:
+        """
+        Returns a live output saved earlier in the run, shaped as a disk
+        round trip would return it, or None.
+        """
+        if not self.ctx.settings.config.handoff or dm.path_key is None:
+            return None
+        if not self.ctx.states.data.has(dm.path_key):
+            return None
+        data = self.ctx.states.data.get(dm.path_key)
+        suffix = dm.data_path.suffix
+        if suffix in tabular_suffixes and isinstance(data, (pd.Series, pd.DataFrame)):
+            if isinstance(data, pd.Series):
+                data = data.to_frame()
+            if columns is not None:
+                data = data[columns]
+            # A lazy copy: under copy-on-write (pandas>=3) in-place edits downstream
+            # copy first, so they never reach the queued original
+            return data.reset_index(drop=True)
+        if suffix == ".json" and isinstance(data, dict):
+            return pd.DataFrame.from_dict(data, orient="index")
+        return data
+
+    def stream_dm(self, dm: DataModule, columns: Optional[List[str]] = None) -> Any:
+        """
+        Streams a DataModule in bounded chunks when `chunk_size` is configured.
+        Falls back to a full load otherwise.
+        """
+        chunk_size = self.ctx.settings.config.chunk_size
+        if not chunk_size or self.load_handoff(dm) is not None:
+            return self.load_dm(dm, columns=columns)
+        if dm is None:
+            raise AttributeError('NoneType: Verify module path keys, and path config keys')
+        return DataChunks(dm=dm, chunk_size=chunk_size, columns=columns)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from typing import List
+from typing import Optional
+
 import attrs
 
 from src.core.data_handling.data_module import DataModule
 from src.core.data_handling.data_module_handler import DataModuleHandler
+from utils.tracing import trace_span
 
 
 @attrs.define
@@ -12,13 +16,23 @@ class LazyLoad:
     A lightweight marker/wrapper that says:
     "When the pipeline is dispatched, call `data_module_handler.load_data_module(data_module)`.
     Provide the result as the argument."
+    Set `stream` for consumers that accept a DataChunks iterator.
+    Set `mmap_mode` (e.g. "r") for read-only consumers of .npy/.joblib artifacts.
+    Set `columns` to read only those columns; columnar checkpoints then read
+    only the bytes of the projected columns.
     """
     dm: DataModule
+    stream: bool = False
+    mmap_mode: Optional[str] = None
+    columns: Optional[List[str]] = None
 
     def load(self, dm_handler: DataModuleHandler):
         if self.dm is None:
             raise AttributeError("`NoneType` object. Verify module path keys, and path config keys")
         try:
-            return dm_handler.load_dm(self.dm)
+            with trace_span("LazyLoad.load", cat="io", path_key=self.dm.path_key, stream=self.stream):
+                if self.stream:
+                    return dm_handler.stream_dm(self.dm, columns=self.columns)
+                return dm_handler.load_dm(self.dm, mmap_mode=self.mmap_mode, columns=self.columns)
         except Exception as e:
             raise ValueError(f"Failed to load data from {self.dm.data_path}: {e}")
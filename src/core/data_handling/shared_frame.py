@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+from typing import Any
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import attrs
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+
+@attrs.define
+class SharedFrame:
+    """
+    Summary
+    ----------
+    Picklable handle to a DataFrame/Series held in shared memory
+    The frame is written once as an Arrow IPC stream into a shared memory
+    block; only this handle crosses the process boundary.
+
+    Extended Summary
+    ----------
+    - The receiver copies the stream out of the block before decoding, so the
+      returned frame never references memory that is later unlinked
+    - Dtypes Arrow does not round trip exactly (e.g. object strings) are restored
+    - The creator hands ownership of the block to whoever calls `release`
+
+    Parameters
+    ----------
+    shm_name : str
+        Name of the shared memory block
+    size : int
+        Length of the Arrow IPC stream in bytes
+    dtypes : list
+        Column dtypes of the original frame, in column order
+    is_series : bool
+        Whether the original object was a Series
+    series_name : Hashable, optional
+        Name of the original Series
+    """
+    shm_name: str
+    size: int
+    dtypes: List[str]
+    is_series: bool = False
+    series_name: Optional[Hashable] = None
+
+    @classmethod
+    def create(cls, data) -> SharedFrame:
+        is_series = isinstance(data, pd.Series)
+        df = data.to_frame() if is_series else data
+        table = pa.Table.from_pandas(df, preserve_index=None)
+
+        sink = pa.MockOutputStream()
+        cls._write_stream(sink, table)
+        size = sink.size()
+
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            buffer = pa.py_buffer(shm.buf)
+            cls._write_stream(pa.FixedSizeBufferWriter(buffer), table)
+            del buffer
+        finally:
+            shm.close()
+        series_name = data.name if is_series else None
+        return cls(shm.name, size, [str(dtype) for dtype in df.dtypes], is_series, series_name)
+
+    def load(self):
+        shm = shared_memory.SharedMemory(name=self.shm_name)
+        try:
+            with shm.buf[:self.size] as view:
+                stream = bytes(view)
+        finally:
+            shm.close()
+        df = pa.ipc.open_stream(pa.py_buffer(stream)).read_all().to_pandas()
+        restore = {
+            col: dtype for col, dtype in zip(df.columns, self.dtypes) if str(df[col].dtype) != dtype
+        }
+        if restore:
+            df = df.astype(restore)
+        return df.iloc[:, 0].rename(self.series_name) if self.is_series else df
+
+    def release(self):
+        _unlink(self.shm_name)
+
+    @staticmethod
+    def _write_stream(sink, table: pa.Table):
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+@attrs.define
+class SharedArray:
+    """Picklable handle to a numeric numpy array copied into a shared memory block"""
+    shm_name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+    @classmethod
+    def create(cls, array: np.ndarray) -> SharedArray:
+        shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        try:
+            shared = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+            shared[...] = array
+            del shared
+        finally:
+            shm.close()
+        return cls(shm.name, array.shape, array.dtype.str)
+
+    def load(self) -> np.ndarray:
+        shm = shared_memory.SharedMemory(name=self.shm_name)
+        try:
+            shared = np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf)
+            array = shared.copy()
+            del shared
+        finally:
+            shm.close()
+        return array
+
+    def release(self):
+        _unlink(self.shm_name)
+
+
+def share(obj: Any) -> Any:
+    """
+    Moves frames and numeric arrays (also inside dicts) into shared memory,
+    returning picklable handles in their place. Other objects pass through.
+    """
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return SharedFrame.create(obj)
+    if isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+        return SharedArray.create(obj)
+    if isinstance(obj, dict):
+        return {k: share(v) for k, v in obj.items()}
+    return obj
+
+
+def materialise(obj: Any, release: bool = False) -> Any:
+    """Inverse of `share`. With `release`, blocks are unlinked once read."""
+    if isinstance(obj, (SharedFrame, SharedArray)):
+        data = obj.load()
+        if release:
+            obj.release()
+        return data
+    if isinstance(obj, dict):
+        return {k: materialise(v, release) for k, v in obj.items()}
+    return obj
+
+
+def release_all(obj: Any):
+    """Unlinks every shared memory block referenced by `obj`."""
+    if isinstance(obj, (SharedFrame, SharedArray)):
+        obj.release()
+    elif isinstance(obj, dict):
+        for v in obj.values():
+            release_all(v)
+
+
+def _unlink(shm_name: str):
+    try:
+        shm = shared_memory.SharedMemory(name=shm_name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import TextIO
+
+from config.pipeline_context import PipelineContext
+from src.core.step_handling.run_selection import RunSelection
+from src.core.step_handling.step_handler import StepHandler
+from utils.run_metrics import RunMetrics
+
+
+class JobStream(logging.Handler):
+    """
+    Streams one job's events to its client as JSON lines
+    Forwards log records and RunMetrics step records emitted in the daemon
+    process. A client that disconnects does not stop the job.
+    """
+
+    def __init__(self, conn: socket.socket, level: int = logging.INFO):
+        super().__init__(level)
+        self.conn = conn
+        self.connected = True
+        self._send_lock = threading.Lock()
+
+    def send(self, event: Dict[str, Any]):
+        line = (json.dumps(event, default=str) + "\n").encode()
+        with self._send_lock:
+            if not self.connected:
+                return
+            try:
+                self.conn.sendall(line)
+            except OSError:
+                self.connected = False
+
+    def emit(self, record: logging.LogRecord):
+        self.send({"event": "log", "level": record.levelname, "message": record.getMessage()})
+
+    def step(self, record: Dict[str, Any]):
+        if record.get("step"):
+            self.send({"event": "step", **record})
+
+
+class PipelineDaemon:
+    """
+    Summary
+    ----------
+    Long-lived local pipeline server on a Unix socket
+    Holds one warm PipelineContext, so libraries, settings, the artifact cache
+    (including loaded models), checkpoint writers and worker processes stay
+    resident between runs.
+
+    Extended Summary
+    ----------
+    - A request is one JSON line: ``{"start", "stop", "only", "overrides"}``,
+      selectors as for ``main.py --from/--until/--only`` and overrides as
+      ``{"config.chunk_size": 50000}``; ``{"command": "shutdown"}`` stops the daemon
+    - Log records and per-step metrics stream back as JSON lines, ending
+      with a ``done`` event carrying the status and run id
+    - Jobs run one at a time; further clients wait in the socket backlog
+    - Each job gets fresh settings and selection, an empty data state and its
+      own run id. Pool widths (``checkpoint_writers``, ``process_workers``) are
+      fixed when the daemon starts
+
+    Parameters
+    ----------
+    ctx : PipelineContext
+        Warm context shared by all jobs
+    run_job : Callable[[PipelineContext], None]
+        Runs the pipeline for a prepared context
+    socket_path : Path
+        Unix socket to listen on
+    """
+
+    def __init__(self, ctx: PipelineContext, run_job: Callable[[PipelineContext], None], socket_path: Path):
+        self.ctx = ctx
+        self.run_job = run_job
+        self.socket_path = Path(socket_path)
+        self.base_settings = ctx.settings
+        self.ctx.processes.persistent = True
+        self.jobs = 0
+
+    def serve(self):
+        self.warm_up()
+        server = self._bind()
+        logging.info(f"Pipeline daemon listening on ``{self.socket_path}``")
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    if not self.handle(conn):
+                        break
+        finally:
+            server.close()
+            self.socket_path.unlink(missing_ok=True)
+            self.ctx.processes.shutdown()
+            self.ctx.writer.flush()
+            logging.info(f"Pipeline daemon stopped after {self.jobs} jobs")
+
+    def warm_up(self):
+        """Imports every step module and the configured model and sampler ahead of the first job."""
+        start = time.perf_counter()
+        for func_path in StepHandler._step_to_func.values():
+            importlib.import_module(func_path.rpartition(".")[0])
+        params = self.base_settings.params
+        params.get_model()
+        params.get_sampler()
+        logging.info(f"Daemon warm-up imports took {time.perf_counter() - start:.2f}s")
+
+    def handle(self, conn: socket.socket) -> bool:
+        """Serves one request; returns False on shutdown."""
+        with conn.makefile("r", encoding="utf-8") as reader:
+            line = reader.readline()
+        if not line.strip():
+            # Liveness probe or client gone
+            return True
+        stream = JobStream(conn)
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            stream.send({"event": "done", "status": "error", "error": f"Invalid request: {e}"})
+            return True
+        if request.get("command") == "shutdown":
+            stream.send({"event": "done", "status": "ok", "message": "shutting down"})
+            return False
+        self.run(request, stream)
+        return True
+
+    def run(self, request: Dict[str, Any], stream: JobStream):
+        start = time.perf_counter()
+        status, error = "error", None
+        root = logging.getLogger()
+        root.addHandler(stream)
+        RunMetrics.listeners.append(stream.step)
+        run_id = RunMetrics.new_run()
+        try:
+            self.ctx.settings = self.base_settings.with_overrides(request.get("overrides") or {})
+            self.ctx.selection = RunSelection(
+                start=request.get("start"), stop=request.get("stop"), only=request.get("only")
+            )
+            self.ctx.states.data.clear()
+            logging.info(f"Daemon job {self.jobs + 1} (run `{run_id}`): {request}")
+            self.run_job(self.ctx)
+            status = "ok"
+        except Exception as e:
+            error = str(e)
+            logging.error(f"Daemon job failed: {e}")
+        finally:
+            self.jobs += 1
+            root.removeHandler(stream)
+            RunMetrics.listeners.remove(stream.step)
+            self.ctx.settings = self.base_settings
+            self.ctx.selection = RunSelection()
+            stream.send({
+                "event": "done",
+                "status": status,
+                "error": error,
+                "run_id": run_id,
+                "wall_s": round(time.perf_counter() - start, 3),
+            })
+
+    def _bind(self) -> socket.socket:
+        if self.socket_path.exists():
+            if _is_listening(self.socket_path):
+                raise RuntimeError(f"A daemon is already listening on ``{self.socket_path}``")
+            self.socket_path.unlink()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(self.socket_path))
+        server.listen()
+        return server
+
+
+def submit(socket_path: Path, request: Dict[str, Any], out: Optional[TextIO] = None) -> int:
+    """
+    Client side: sends a request and prints the streamed events.
+    Returns 0 if the job succeeded, 1 otherwise.
+    """
+    out = out or sys.stdout
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(str(socket_path))
+    except OSError as e:
+        print(f"No pipeline daemon at {socket_path} ({e}); start one with `python main.py serve`", file=out)
+        return 1
+    with conn, conn.makefile("r", encoding="utf-8") as reader:
+        conn.sendall((json.dumps(request) + "\n").encode())
+        for line in reader:
+            event = json.loads(line)
+            if event["event"] == "log":
+                print(f"{event['level']:<8} {event['message']}", file=out)
+            elif event["event"] == "step":
+                print(f"STEP     {event['step']}: {event['status']} in {event['wall_s']:.2f}s", file=out)
+            elif event["event"] == "done":
+                detail = event.get("error") or event.get("message") or f"run `{event.get('run_id')}`"
+                print(f"DONE     {event['status']} ({detail}) in {event.get('wall_s', 0):.2f}s", file=out)
+                return int(event["status"] != "ok")
+    print("Daemon closed the connection before the job finished", file=out)
+    return 1
+
+
+def _is_listening(socket_path: Path) -> bool:
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(socket_path))
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
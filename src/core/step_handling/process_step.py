@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import attrs
+
+from config.paths import Paths
+from config.pipeline_context import PipelineContext
+from config.settings import Settings
+from src.core.data_handling.data_chunks import DataChunks
+from src.core.data_handling.data_module_handler import DataModuleHandler
+from src.core.data_handling.shared_frame import materialise
+from src.core.data_handling.shared_frame import share
+from utils.logging_utils import log_step
+from utils.run_metrics import RunMetrics
+from utils.tracing import Tracer
+from utils.tracing import trace_span
+
+
+@attrs.define
+class ChunkSource:
+    """
+    Picklable stand-in for a DataChunks stream
+    The worker re-opens the file itself, so chunks never cross the process boundary.
+    """
+    path_key: str
+    chunk_size: int
+    columns: Optional[List[str]] = None
+
+    def open(self, dm_handler: DataModuleHandler) -> DataChunks:
+        return DataChunks(dm=dm_handler.get_dm(self.path_key), chunk_size=self.chunk_size, columns=self.columns)
+
+
+def pack_args(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Replaces resolved step inputs with shared memory handles or chunk sources."""
+    packed = {}
+    for k, v in args.items():
+        if isinstance(v, DataChunks):
+            packed[k] = ChunkSource(v.dm.path_key, v.chunk_size, v.columns)
+        else:
+            packed[k] = share(v)
+    return packed
+
+
+def run_step_in_worker(
+    step_name: str,
+    paths: Paths,
+    settings: Settings,
+    step_class: Any,
+    method_name: str,
+    args: Dict[str, Any],
+    outputs: Optional[List[Path]] = None,
+    run_id: Optional[str] = None,
+    label: Optional[str] = None,
+) -> Any:
+    """
+    Worker-side entry point
+    Rebuilds a lightweight context from the parent's paths and settings, maps the
+    inputs out of shared memory and returns the step result through shared memory.
+    Input blocks stay owned by the parent; result blocks pass to the parent.
+    `run_id` tags the step's metrics with the parent's current run, as a
+    persistent worker outlives the run it was started for; `label` is the
+    step's run-history label, which depends on the parent's current stage.
+    """
+    if run_id is not None:
+        RunMetrics.run_id = run_id
+    try:
+        with trace_span(f"worker {step_name}", cat="dispatch", step=step_name):
+            ctx = PipelineContext(paths=paths, settings=settings)
+            dm_handler = DataModuleHandler(ctx)
+            resolved_args = {
+                k: v.open(dm_handler) if isinstance(v, ChunkSource) else materialise(v)
+                for k, v in args.items()
+            }
+            instance = step_class(ctx=ctx, **resolved_args)
+            method = getattr(instance, method_name)
+            logged = log_step(step=step_name, input_data=resolved_args, outputs=outputs, label=label)(method)
+            return share(logged())
+    finally:
+        Tracer.flush_part()
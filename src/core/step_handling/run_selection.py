@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import logging
+from functools import wraps
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import attr
+
+
+@attr.s
+class PlannedStep:
+    """A step as recorded by a planning pass: where it runs and what it reads/writes"""
+    stage: str = attr.ib()
+    step: str = attr.ib()
+    inputs: Dict[str, Path] = attr.ib(factory=dict)
+    outputs: Dict[str, Path] = attr.ib(factory=dict)
+    cached: bool = attr.ib(default=False)
+
+
+@attr.s
+class RunSelection:
+    """
+    Summary
+    ----------
+    Partial-run selection of stages and steps (``--from``/``--until``/``--only``)
+    Selectors are a stage name, ``stage:step``, or a step name that is unique
+    across stages. With no selectors every step runs.
+
+    Extended Summary
+    ----------
+    - A planning pass runs each stage with ``planning`` set, so StepFactory
+      records its steps instead of executing them
+    - Selectors resolve against the plan to a contiguous range of steps
+    - Preflight refuses to start if an input of the selected steps is produced
+      by a skipped step and its checkpoint is missing or stale
+    - Stages are entered through `stage`, which tells StepFactory which stage's
+      steps it is filtering
+
+    Parameters
+    ----------
+    start : str, optional
+        First stage/step to run
+    stop : str, optional
+        Last stage/step to run
+    only : str, optional
+        Single stage/step to run; exclusive with `start`/`stop`
+
+    Raises
+    ------
+    ValueError
+        On unknown or ambiguous selectors, an empty range, or failed preflight
+    """
+    start: Optional[str] = attr.ib(default=None)
+    stop: Optional[str] = attr.ib(default=None)
+    only: Optional[str] = attr.ib(default=None)
+    planning: bool = attr.ib(default=False, init=False)
+    current_stage: Optional[str] = attr.ib(default=None, init=False)
+    plan: List[PlannedStep] = attr.ib(factory=list, init=False)
+    selected: Optional[List[Tuple[str, str]]] = attr.ib(default=None, init=False)
+
+    def __attrs_post_init__(self):
+        if self.only and (self.start or self.stop):
+            raise ValueError("`--only` cannot be combined with `--from`/`--until`.")
+
+    @property
+    def is_partial(self) -> bool:
+        return bool(self.start or self.stop or self.only)
+
+    def stage(self, name: str, fn: Callable) -> Callable:
+        """Wraps a stage entry point so StepFactory knows which stage is running."""
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            self.current_stage = name
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.current_stage = None
+        return wrapper
+
+    def prepare(self, stages: Dict[str, Callable]):
+        """Plans every stage, resolves the selectors and runs the preflight checks."""
+        self.planning = True
+        try:
+            for name, fn in stages.items():
+                self.stage(name, fn)()
+        finally:
+            self.planning = False
+        self.resolve()
+        self.preflight()
+
+    def record(self, step: PlannedStep):
+        self.plan.append(step)
+
+    def resolve(self):
+        order = [(planned.stage, planned.step) for planned in self.plan]
+        if self.only:
+            first, last = self._locate(self.only)
+        else:
+            first = self._locate(self.start)[0] if self.start else 0
+            last = self._locate(self.stop)[1] if self.stop else len(order) - 1
+        if first > last:
+            raise ValueError(f"`--from {self.start}` comes after `--until {self.stop}`.")
+        self.selected = order[first:last + 1]
+        logging.info(f"Partial run of {len(self.selected)} steps: {[':'.join(s) for s in self.selected]}")
+
+    def runs_stage(self, stage: str) -> bool:
+        return self.selected is None or any(s == stage for s, _ in self.selected)
+
+    def select_steps(self, step_order: List[str]) -> List[str]:
+        if self.selected is None:
+            return step_order
+        return [step for step in step_order if (self.current_stage, step) in self.selected]
+
+    def preflight(self):
+        """
+        Inputs of the selected steps that no earlier selected step produces are
+        rehydrated from checkpoints, so each must exist and be current.
+        """
+        producers = {key: planned for planned in self.plan for key in planned.outputs}
+        produced, checked, problems = set(), set(), []
+        for planned in self.plan:
+            if (planned.stage, planned.step) not in self.selected:
+                continue
+            for key, path in planned.inputs.items():
+                if key in produced or key in checked:
+                    continue
+                checked.add(key)
+                if not path.exists():
+                    problems.append(f"`{key}` ({path}) required by `{planned.stage}:{planned.step}` is missing")
+                elif (upstream := self._stale_source(key, producers, set())) is not None:
+                    problems.append(
+                        f"`{key}` ({path}) required by `{planned.stage}:{planned.step}` is stale; "
+                        f"rerun from `{upstream.stage}:{upstream.step}`"
+                    )
+            produced.update(planned.outputs)
+        if problems:
+            raise ValueError("Cannot start partial run:\n  " + "\n  ".join(problems))
+
+    def _stale_source(self, key: str, producers: Dict[str, PlannedStep], seen: set) -> Optional[PlannedStep]:
+        """
+        Returns the earliest step whose checkpoint is older than one of its inputs,
+        tracing `key` upstream, or None if `key` is current. When the step cache
+        confirms a step's stored outputs against its current inputs, only
+        upstream staleness counts for it.
+        """
+        producer = producers.get(key)
+        if producer is None or key in seen:
+            return None
+        seen.add(key)
+        path = producer.outputs[key]
+        if not path.exists():
+            return None
+        mtime = path.stat().st_mtime
+        newer = False
+        for input_key, input_path in producer.inputs.items():
+            if not input_path.exists():
+                continue
+            upstream = self._stale_source(input_key, producers, seen)
+            if upstream is not None:
+                return upstream
+            newer = newer or (not producer.cached and input_path.stat().st_mtime > mtime)
+        return producer if newer else None
+
+    def _locate(self, selector: str) -> Tuple[int, int]:
+        """Index range of the plan covered by a stage, `stage:step` or step selector."""
+        stage, _, step = selector.partition(":")
+        if not step:
+            stages = {planned.stage for planned in self.plan}
+            if stage in stages:
+                indices = [i for i, planned in enumerate(self.plan) if planned.stage == stage]
+                return indices[0], indices[-1]
+            stage, step = None, selector
+        matches = [
+            i for i, planned in enumerate(self.plan)
+            if planned.step == step and (stage is None or planned.stage == stage)
+        ]
+        if not matches:
+            stages = list(dict.fromkeys(planned.stage for planned in self.plan))
+            raise ValueError(f"Unknown stage or step `{selector}`. Stages: {stages}")
+        if len(matches) > 1:
+            options = [f"{self.plan[i].stage}:{step}" for i in matches]
+            raise ValueError(f"Step `{step}` is ambiguous, use one of {options}")
+        return matches[0], matches[0]
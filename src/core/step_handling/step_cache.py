@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import logging
+import pickle
+import threading
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import attr
+
+from config.pipeline_context import PipelineContext
+from config.settings import Settings
+from src.core.data_handling.lazy_load import LazyLoad
+from utils.file_access import FileAccess
+
+
+def settings_fingerprint(settings: Settings) -> str:
+    """Digest of all Settings fields that can change step results."""
+    attr_dict = attr.asdict(settings)
+    for field in settings.config.runtime_fields:
+        attr_dict["config"].pop(field, None)
+    payload = json.dumps(attr_dict, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class StepCache:
+    """
+    Summary
+    ----------
+    Content-addressed record of completed pipeline steps
+    Fingerprints a step from its input artifact hashes, the Settings and the
+    source of the module defining the step class. A step whose fingerprint is
+    recorded, and whose outputs still match their recorded hashes, is skipped.
+
+    Extended Summary
+    ----------
+    - Manifest persisted as JSON at the `step-cache` path
+    - File digests memoised by (mtime, size) to avoid rehashing large inputs
+    - Steps are only recorded once all their outputs have been persisted
+    - Manifest updates are locked and merged with the file on disk, as records
+      land from the checkpoint writer thread and several instances share one manifest
+
+    Parameters
+    ----------
+    ctx : PipelineContext
+        Contains path configurations and settings
+    """
+
+    # Shared by all instances: each pipeline's StepFactory holds its own StepCache
+    _lock = threading.RLock()
+
+    def __init__(self, ctx: PipelineContext):
+        self.ctx = ctx
+        self.path: Path = ctx.paths.get_path("step-cache")
+        self.manifest: Dict[str, Any] = self._read_manifest()
+
+    def fingerprint(self, step_name: str, step_class: Any, method_name: str, args: dict) -> Optional[str]:
+        """Returns None when an input artifact is missing, i.e. the step is not cacheable."""
+        inputs = {}
+        for k, v in sorted(args.items()):
+            if isinstance(v, LazyLoad):
+                digest = self.file_digest(v.dm.data_path)
+                if digest is None:
+                    return None
+                inputs[k] = digest if v.columns is None else [digest, v.columns]
+            else:
+                inputs[k] = self._arg_digest(v)
+
+        payload = json.dumps({
+            "step": step_name,
+            "method": method_name,
+            "source": self._source_digest(step_class),
+            "inputs": inputs,
+            "settings": settings_fingerprint(self.ctx.settings),
+        }, sort_keys=True)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def is_fresh(self, fingerprint: str) -> bool:
+        """True if the fingerprint is recorded and its outputs are unchanged on disk."""
+        record = self.manifest["steps"].get(fingerprint)
+        if record is None:
+            return False
+        return all(
+            digest is not None and self.file_digest(Path(path)) == digest
+            for path, digest in record["outputs"].items()
+        )
+
+    def store(self, fingerprint: str, output_paths: List[Path]):
+        with self._lock:
+            self.manifest["steps"][fingerprint] = {
+                "outputs": {str(path): self.file_digest(path) for path in output_paths}
+            }
+            self._write_manifest()
+
+    def file_digest(self, path: Optional[Path]) -> Optional[str]:
+        if path is None or not path.exists():
+            return None
+        stat = path.stat()
+        with self._lock:
+            memo = self.manifest["files"].get(str(path))
+        if memo and memo[0] == stat.st_mtime_ns and memo[1] == stat.st_size:
+            return memo[2]
+
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        digest = h.hexdigest()
+        with self._lock:
+            self.manifest["files"][str(path)] = [stat.st_mtime_ns, stat.st_size, digest]
+        return digest
+
+    @classmethod
+    def _arg_digest(cls, value: Any) -> str:
+        """
+        Estimators are hashed by their deep parameters, as sklearn truncates
+        long reprs; other arguments by their pickle, or repr if unpicklable.
+        """
+        if hasattr(value, "get_params") and not isinstance(value, type):
+            params = {
+                k: cls._arg_digest(v) for k, v in value.get_params(deep=True).items()
+            }
+            payload = json.dumps([type(value).__qualname__, params], sort_keys=True).encode()
+        else:
+            try:
+                payload = pickle.dumps(value)
+            except Exception:
+                payload = repr(value).encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    @staticmethod
+    def _source_digest(step_class: Any) -> str:
+        source = inspect.getsource(inspect.getmodule(step_class))
+        return hashlib.blake2b(source.encode(), digest_size=16).hexdigest()
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        if self.path.exists():
+            return FileAccess.load_json(self.path)
+        return {"steps": {}, "files": {}}
+
+    def _write_manifest(self):
+        """Merges into the manifest on disk, which other StepCache instances may have updated."""
+        on_disk = self._read_manifest()
+        for section in ("steps", "files"):
+            on_disk[section].update(self.manifest[section])
+        self.manifest = on_disk
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        logging.debug(f"Updating step cache manifest ``{self.path}``")
+        FileAccess.save_json(self.manifest, self.path, overwrite=True)
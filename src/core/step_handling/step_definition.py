@@ -1,14 +1,32 @@
 from __future__ import annotations
 
+from typing import Optional
 from typing import Type
 
 import attrs
 
+from src.core.data_handling.lazy_load import LazyLoad
+
 
 @attrs.define
 class StepDefinition:
+    """
+    `columns` optionally maps an argument name to the columns the step reads
+    from it. The projection is pushed down to that argument's LazyLoad.
+    `executor` is "thread" (in-process) or "process", which runs the step in a
+    worker process with frames transported through shared memory.
+    """
     name: str
     step_class: Type
     args: dict
     method_name: str = "run"
     outputs: list[str] = attrs.field(factory=list)
+    columns: Optional[dict[str, list[str]]] = attrs.field(factory=dict)
+    executor: str = attrs.field(default="thread", validator=attrs.validators.in_(("thread", "process")))
+
+    def __attrs_post_init__(self):
+        for arg_name, cols in self.columns.items():
+            lazy = self.args.get(arg_name)
+            if not isinstance(lazy, LazyLoad):
+                raise ValueError(f"Step `{self.name}`: column projection on non-LazyLoad argument `{arg_name}`")
+            self.args[arg_name] = attrs.evolve(lazy, columns=list(cols))
@@ -1,12 +1,30 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from pathlib import Path
 from typing import Callable
+from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Set
 
 from src.core.base_pipeline import BasePipeline
+from src.core.data_handling.data_chunks import DataChunks
 from src.core.data_handling.lazy_load import LazyLoad
+from src.core.data_handling.shared_frame import materialise
+from src.core.data_handling.shared_frame import release_all
+from src.core.step_handling.process_step import pack_args
+from src.core.step_handling.process_step import run_step_in_worker
+from src.core.step_handling.run_selection import PlannedStep
+from src.core.step_handling.step_cache import StepCache
+from src.core.step_handling.step_cache import settings_fingerprint
 from utils.logging_utils import log_step
+from utils.run_history import RunHistory
+from utils.run_metrics import RunMetrics
+from utils.tracing import trace_span
 
 
 class StepFactory(BasePipeline):
@@ -23,6 +41,10 @@ class StepFactory(BasePipeline):
     - Maintains a registry of step configurations (classes, arguments, and methods)
     - Handles lazy-loaded argument resolution through DataModuleHandler
     - Supports runtime argument injection via **runtime_extra
+    - Schedules steps as a dependency graph of LazyLoad inputs and declared
+      outputs, running ready steps concurrently (``Config.max_parallel_steps``)
+    - Runs steps defined with ``executor="process"`` on the context's WorkerPool
+    - Honours the context's RunSelection for partial runs
 
     Outputs
     ----------
@@ -34,13 +56,14 @@ class StepFactory(BasePipeline):
         Container for paths, settings, and pipeline states
     step_map : dict, optional
         Preconfigured step definitions mapping step names to
-        (StepClass, base_args, method_name) tuples
+        (StepClass, base_args, method_name, outputs, executor) tuples
     """
 
     def __init__(self, ctx, step_map=None):
         super().__init__(ctx)
         self.ctx = ctx
         self.step_map: dict = step_map or {}
+        self.step_cache = StepCache(ctx)
 
     def dispatch_step(self, step_name: str, **runtime_extra):
         """
@@ -48,8 +71,12 @@ class StepFactory(BasePipeline):
         Looks up step configuration, resolves lazy-loaded dependencies,
         instantiates the step class, and executes the target method.
         """
+        with trace_span(f"dispatch {step_name}", cat="dispatch", step=step_name):
+            return self._dispatch_step(step_name, **runtime_extra)
+
+    def _dispatch_step(self, step_name: str, **runtime_extra):
         try:
-            StepClass, base_args, method_name = self.step_map[step_name]
+            StepClass, base_args, method_name, _, executor = self.step_map[step_name]
         except KeyError:
             raise ValueError(f"Unknown step `{step_name}`. Check step definitions.")
 
@@ -61,24 +88,260 @@ class StepFactory(BasePipeline):
                 resolved_args[k] = v
 
         all_args = {**resolved_args, **runtime_extra}
+        if executor == "process" and self.ctx.processes.max_workers > 0:
+            return self.dispatch_to_worker(step_name, StepClass, method_name, all_args)
         instance = StepClass(ctx=self.ctx, **all_args)
         method = getattr(instance, method_name)
-        return log_step()(method)()
+        return log_step(
+            step=step_name, input_data=all_args, outputs=self.output_paths(step_name),
+            label=self.step_label(step_name),
+        )(method)()
+
+    def step_label(self, step_name: str) -> str:
+        """
+        Step name qualified by the running stage and the step's `path_key`, e.g.
+        ``further-eda:collect-metadata[transformed-data]``; steps shared by
+        several stages or datasets are then told apart in the run history.
+        """
+        label = step_name
+        if self.ctx.selection.current_stage:
+            label = f"{self.ctx.selection.current_stage}:{label}"
+        path_key = self.step_map[step_name][1].get("path_key")
+        if isinstance(path_key, str):
+            label = f"{label}[{path_key}]"
+        return label
+
+    def dispatch_to_worker(self, step_name: str, StepClass, method_name: str, args: dict):
+        """
+        Runs a step in a worker process
+        Frames and arrays travel through shared memory rather than pickles; chunked
+        inputs are re-opened by the worker. Input blocks are unlinked once the step
+        returns, result blocks once they are read back.
+        """
+        for v in args.values():
+            if isinstance(v, DataChunks):
+                self.ctx.writer.wait_for(v.dm.data_path)
+        packed_args = pack_args(args)
+        try:
+            future = self.ctx.processes.submit(
+                run_step_in_worker,
+                step_name,
+                self.ctx.paths,
+                self.ctx.settings,
+                StepClass,
+                method_name,
+                packed_args,
+                self.output_paths(step_name),
+                RunMetrics.run_id,
+                self.step_label(step_name),
+            )
+            result = materialise(future.result(), release=True)
+            logging.info(f"Step `{step_name}` completed in a worker process")
+            return result
+        finally:
+            release_all(packed_args)
 
     def run_pipeline(self, step_order: List[str], checkpoints: List[str] = None):
         """
         Executes a sequence of pipeline steps with checkpoint support
         Processes steps in specified order, saving intermediate results
         at designated checkpoints using DataModuleHandler.
+        With ``max_parallel_steps`` above 1 the steps are scheduled by data
+        dependency instead, independent steps running concurrently.
+        Only steps in the context's RunSelection run.
         """
         checkpoints = checkpoints or []
+        if self.ctx.selection.planning:
+            return self.plan_steps(step_order)
+        step_order = self.ctx.selection.select_steps(step_order)
+        if self.config.max_parallel_steps > 1 and len(step_order) > 1:
+            return self.run_graph(step_order, checkpoints)
+        for step_name in step_order:
+            self.run_step(step_name, checkpoints)
+
+    def plan_steps(self, step_order: List[str]):
+        """Records the stage's steps, inputs and outputs for a partial run instead of executing them."""
+        for step_name in step_order:
+            _, base_args, _, outputs, _ = self.step_map[step_name]
+            fingerprint = self.cache_fingerprint(step_name) if self.config.step_cache else None
+            self.ctx.selection.record(PlannedStep(
+                stage=self.ctx.selection.current_stage,
+                step=step_name,
+                inputs={
+                    v.dm.path_key: v.dm.data_path
+                    for v in base_args.values() if isinstance(v, LazyLoad) and v.dm is not None
+                },
+                outputs={path_key: self.dm_handler.get_dm(path_key).data_path for path_key in outputs},
+                cached=bool(fingerprint) and self.step_cache.is_fresh(fingerprint),
+            ))
+
+    def run_step(self, step_name: str, checkpoints: List[str]):
+        """
+        Executes one step, saving its outputs if it is a checkpoint.
+        Steps are recorded in the step cache once their checkpoints are on disk.
+        """
+        cacheable = self.is_cacheable(step_name, checkpoints)
+        if cacheable and self.cache_hit(step_name):
+            logging.info(f"Step cache HIT: `{step_name}`. Reusing stored outputs.")
+            return
+
+        result = self.dispatch_step(step_name)
+        if step_name in checkpoints:
+            logging.debug(f"SAVING at checkpoint: {step_name}")
+            self.dm_handler.save_data(result)
+        if cacheable:
+            written = self.input_paths(step_name) + self.output_paths(step_name)
+            self.ctx.writer.when_written(written, lambda name=step_name: self.record_step(name))
+
+    def run_graph(self, step_order: List[str], checkpoints: List[str]):
+        """
+        Runs steps on a worker pool as soon as the steps producing their inputs
+        have completed. `step_order` breaks ties between ready steps.
+        The graph is validated before any step starts.
+        """
+        remaining = {name: set(deps) for name, deps in self.build_graph(step_order).items()}
+        running = {}
+        width = self.config.max_parallel_steps
+        with ThreadPoolExecutor(max_workers=width, thread_name_prefix="step") as pool:
+            while remaining or running:
+                for step_name in [n for n in step_order if n in remaining and not remaining[n]]:
+                    del remaining[step_name]
+                    running[pool.submit(self.run_step, step_name, checkpoints)] = step_name
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step_name = running.pop(future)
+                    future.result()
+                    for deps in remaining.values():
+                        deps.discard(step_name)
+
+    def build_graph(self, step_order: List[str]) -> Dict[str, Set[str]]:
+        """
+        Maps each step to the steps producing its inputs.
+
+        Raises
+        ------
+        ValueError
+            On unknown steps, outputs declared by two steps, inputs that no step
+            produces and that are not yet available, or dependency cycles
+        """
+        unknown = [name for name in step_order if name not in self.step_map]
+        if unknown:
+            raise ValueError(f"Unknown steps {unknown}. Check step definitions.")
+
+        producers: Dict[str, str] = {}
+        for step_name in step_order:
+            for path_key in self.step_map[step_name][3]:
+                if path_key in producers:
+                    raise ValueError(
+                        f"`{path_key}` is an output of both `{producers[path_key]}` and `{step_name}`."
+                    )
+                producers[path_key] = step_name
+
+        graph: Dict[str, Set[str]] = {}
         for step_name in step_order:
-            result = self.dispatch_step(step_name)
-            if step_name in checkpoints:
-                logging.debug(f"SAVING at checkpoint: {step_name}")
-                self.dm_handler.save_data(result)
+            graph[step_name] = set()
+            for lazy in self.step_map[step_name][1].values():
+                if not isinstance(lazy, LazyLoad) or lazy.dm is None:
+                    continue
+                producer = producers.get(lazy.dm.path_key)
+                if producer is not None and producer != step_name:
+                    graph[step_name].add(producer)
+                elif producer is None and not self.is_available(lazy):
+                    raise ValueError(
+                        f"Step `{step_name}` reads `{lazy.dm.path_key}`, which no step produces "
+                        f"and is not available at {lazy.dm.data_path}."
+                    )
+        self.check_acyclic(graph)
+        return graph
+
+    @staticmethod
+    def check_acyclic(graph: Dict[str, Set[str]]):
+        remaining = {name: set(deps) for name, deps in graph.items()}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Dependency cycle between steps {sorted(remaining)}.")
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def is_available(self, lazy: LazyLoad) -> bool:
+        """True if an input is handed off, being written, or on disk."""
+        dm = lazy.dm
+        if dm.state_key:
+            return self.ctx.states.data.has(dm.state_key)
+        return (
+            (dm.path_key is not None and self.ctx.states.data.has(dm.path_key))
+            or self.ctx.writer.is_pending(dm.data_path)
+            or dm.data_path.exists()
+        )
+
+    def is_cacheable(self, step_name: str, checkpoints: List[str]) -> bool:
+        """
+        Only steps whose outputs are all persisted at a checkpoint can be reused.
+        Steps without outputs (figures, reports) always run, as there is nothing
+        to check their freshness against.
+        """
+        outputs = self.step_map[step_name][3]
+        return self.config.step_cache and bool(outputs) and step_name in checkpoints
+
+    def cache_hit(self, step_name: str) -> bool:
+        if any(self.ctx.writer.is_pending(path) for path in self.input_paths(step_name)):
+            logging.info(f"Step cache MISS: `{step_name}`. Upstream outputs rebuilt this run.")
+            return False
+        fingerprint = self.cache_fingerprint(step_name)
+        if fingerprint and self.step_cache.is_fresh(fingerprint):
+            return True
+        logging.info(f"Step cache MISS: `{step_name}`.")
+        return False
+
+    def cache_fingerprint(self, step_name: str) -> Optional[str]:
+        StepClass, base_args, method_name, _, _ = self.step_map[step_name]
+        return self.step_cache.fingerprint(step_name, StepClass, method_name, base_args)
+
+    def record_step(self, step_name: str):
+        fingerprint = self.cache_fingerprint(step_name)
+        if fingerprint:
+            self.step_cache.store(fingerprint, self.output_paths(step_name))
+
+    def input_paths(self, step_name: str) -> List[Path]:
+        base_args = self.step_map[step_name][1]
+        return [v.dm.data_path for v in base_args.values() if isinstance(v, LazyLoad)]
+
+    def output_paths(self, step_name: str) -> List[Path]:
+        outputs = self.step_map[step_name][3]
+        return [self.dm_handler.get_dm(path_key).data_path for path_key in outputs]
 
     def run_main(self, steps: List[Callable]):
-        """Applies log_step decorator to each step and executes in sequence."""
-        for step in steps:
-            log_step()(step)()
+        """
+        Applies log_step decorator to each step and executes in sequence.
+        Pending background checkpoint writes are awaited and worker processes
+        released before returning, then the run is added to the run history.
+        """
+        status = "error"
+        try:
+            for step in steps:
+                log_step()(step)()
+            status = "ok"
+        finally:
+            self.ctx.processes.release()
+            self.ctx.writer.flush()
+            self.record_run(status)
+
+    def record_run(self, status: str):
+        """Stores this run's metrics records in the run history database."""
+        if RunMetrics.run_id is None:
+            return
+        selection = self.ctx.selection
+        try:
+            RunHistory(self.ctx.paths.get_path("run-history")).record(
+                run_id=RunMetrics.run_id,
+                records=RunMetrics.records(),
+                settings_fingerprint=settings_fingerprint(self.ctx.settings),
+                status=status,
+                selection=f"from={selection.start} until={selection.stop} only={selection.only}"
+                if selection.is_partial else None,
+            )
+        except Exception as e:
+            logging.warning(f"Could not record run history: {e}")
@@ -1,16 +1,11 @@
 from __future__ import annotations
 
+import importlib
 from typing import Any
-from typing import Callable
 from typing import Dict
 from typing import List
 
 from src.core.step_handling.step_definition import StepDefinition
-from src.pipelines.steps import checks_steps
-from src.pipelines.steps import evaluation_steps
-from src.pipelines.steps import exploration_steps
-from src.pipelines.steps import processing_steps
-from src.pipelines.steps import training_steps
 
 
 class StepHandler:
@@ -23,7 +18,8 @@ class StepHandler:
 
     Extended Summary
     ----------
-    - Maintains category-to-retrieval-function mapping
+    - Maintains category-to-retrieval-function mapping, by import path so a
+      category's step modules (and their dependencies) load on first use
     - Validates category requests
     - Transforms StepDefinition objects into factory configuration format
 
@@ -37,12 +33,12 @@ class StepHandler:
     ValueError
         When requesting undefined category
     """
-    _step_to_func: Dict[str, Callable] = {
-        "validation": checks_steps.get_validation_checks_steps,
-        "exploration": exploration_steps.get_exploration_steps,
-        "processing": processing_steps.get_processing_steps,
-        "training": training_steps.get_training_steps,
-        "evaluation": evaluation_steps.get_evaluation_steps,
+    _step_to_func: Dict[str, str] = {
+        "validation": "src.pipelines.steps.checks_steps.get_validation_checks_steps",
+        "exploration": "src.pipelines.steps.exploration_steps.get_exploration_steps",
+        "processing": "src.pipelines.steps.processing_steps.get_processing_steps",
+        "training": "src.pipelines.steps.training_steps.get_training_steps",
+        "evaluation": "src.pipelines.steps.evaluation_steps.get_evaluation_steps",
     }
 
     @classmethod
@@ -52,10 +48,12 @@ class StepHandler:
         Returns configured StepDefinitions for requested category,
         forwarding any additional arguments to the definition getter.
         """
-        func = cls._step_to_func.get(category)
-        if not func:
+        func_path = cls._step_to_func.get(category)
+        if not func_path:
             valid = list(cls._step_to_func.keys())
             raise ValueError(f"Invalid category '{category}'. Valid options are: {valid}")
+        module_name, _, func_name = func_path.rpartition(".")
+        func = getattr(importlib.import_module(module_name), func_name)
         return func(*args, **kwargs)
 
     @staticmethod
@@ -69,7 +67,9 @@ class StepHandler:
             step_def.name: (
                 step_def.step_class,
                 step_def.args,
-                step_def.method_name
+                step_def.method_name,
+                step_def.outputs,
+                step_def.executor
             )
             for step_def in definitions
         }
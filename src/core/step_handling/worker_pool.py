@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+from typing import Optional
+
+
+class WorkerPool:
+    """
+    Summary
+    ----------
+    Context-scoped pool of worker processes for CPU-bound steps
+    Started on first use with the spawn method, so workers never inherit
+    the parent's threads or locks (checkpoint writer, artifact cache).
+
+    Extended Summary
+    ----------
+    - Workers initialise logging through the project setup on start
+    - `release` is called at the end of `StepFactory.run_main`; a persistent
+      pool (daemon mode) keeps its workers warm until `shutdown`
+
+    Parameters
+    ----------
+    max_workers : int
+        Number of worker processes
+    persistent : bool
+        Keep workers alive between runs
+    """
+
+    def __init__(self, max_workers: int, persistent: bool = False):
+        self.max_workers = max_workers
+        self.persistent = persistent
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        with self._lock:
+            if self._pool is None:
+                logging.debug(f"Starting worker pool with {self.max_workers} processes")
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=init_worker,
+                )
+            return self._pool.submit(fn, *args, **kwargs)
+
+    def release(self):
+        """End of a run: stops the workers unless the pool is persistent."""
+        if not self.persistent:
+            self.shutdown()
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+
+
+def init_worker():
+    # Imported here: the project setup imports the PipelineContext that owns this pool
+    from utils.project_setup import initialise_project_configs
+    initialise_project_configs()
@@ -1,18 +1,110 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
+from typing import Dict
+from typing import List
 
+import attr
+import numpy as np
 import pandas as pd
 
 from config.pipeline_context import PipelineContext
 from src.core.base_pipeline import BasePipeline
+from src.core.data_handling.data_chunks import iter_frames
 from src.core.data_handling.data_dict import RawDataDict
 from src.core.data_handling.data_module import DataModule
+from utils.tracing import trace_span
 
 pd.set_option("display.max_columns", None)
 
 
+@attr.s
+class ColumnValidation:
+    """Failure counts and sample offending row positions for one column"""
+    column: str = attr.ib()
+    expected: str = attr.ib()
+    nullable: bool = attr.ib(default=False)
+    dtype: str = attr.ib(default="")
+    dtype_ok: bool = attr.ib(default=True)
+    nulls: int = attr.ib(default=0)
+    placeholders: int = attr.ib(default=0)
+    null_rows: List[int] = attr.ib(factory=list)
+    placeholder_rows: List[int] = attr.ib(factory=list)
+    placeholder_values: List[Any] = attr.ib(factory=list)
+
+    @property
+    def unexpected_nulls(self) -> int:
+        return 0 if self.nullable else self.nulls
+
+    @property
+    def passed(self) -> bool:
+        return self.dtype_ok and not self.placeholders and not self.unexpected_nulls
+
+
+@attr.s
+class ValidationResult:
+    """
+    Summary
+    ----------
+    Outcome of validating a dataset against its data dictionary
+    Counts accumulate across chunks; row positions are offsets into the whole
+    dataset, at most `max_samples` per column and check.
+
+    Extended Summary
+    ----------
+    - Errors: missing or unexpected columns, dtype mismatches, non-numeric
+      placeholders in numeric columns
+    - Warnings: nulls in columns not expected to contain them
+    """
+    max_samples: int = attr.ib(default=5)
+    rows: int = attr.ib(default=0)
+    columns: Dict[str, ColumnValidation] = attr.ib(factory=dict)
+    missing_columns: List[str] = attr.ib(factory=list)
+    unexpected_columns: List[str] = attr.ib(factory=list)
+
+    @property
+    def errors(self) -> List[str]:
+        errors = []
+        if self.missing_columns:
+            errors.append(f"Missing columns {self.missing_columns}")
+        if self.unexpected_columns:
+            errors.append(f"Columns not in the data dictionary {self.unexpected_columns}")
+        for c in self.columns.values():
+            if not c.dtype_ok:
+                errors.append(f"Column '{c.column}' should be {c.expected}, but is {c.dtype}")
+            if c.placeholders:
+                errors.append(
+                    f"{c.placeholders} invalid entries in numeric column '{c.column}': "
+                    f"{c.placeholder_values} at rows {c.placeholder_rows}"
+                )
+        return errors
+
+    @property
+    def warnings(self) -> List[str]:
+        return [
+            f"{c.unexpected_nulls} unexpected nulls in '{c.column}' at rows {c.null_rows}"
+            for c in self.columns.values() if c.unexpected_nulls
+        ]
+
+    @property
+    def passed(self) -> bool:
+        return not self.errors
+
+    def summary(self) -> str:
+        lines = [f"Validated {self.rows} rows x {len(self.columns)} columns: {'PASSED' if self.passed else 'FAILED'}"]
+        lines += [f"  ERROR: {e}" for e in self.errors]
+        lines += [f"  WARNING: {w}" for w in self.warnings]
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return attr.asdict(self)
+
+
 class ValidationChecks(BasePipeline):
+    # Columns the data dictionary allows to contain nulls
+    nullable_cols = ('opx_vol',)
+
     def __init__(
         self, ctx: PipelineContext,
         dataset: DataModule,
@@ -21,16 +113,19 @@ class ValidationChecks(BasePipeline):
         _summary_
         ----------
         Utilises DataDictionary to perform data checks on raw dataset
+        Accepts a whole DataFrame or a DataChunks stream.
 
         _extended_summary_
         ----------
-            - Check for unexpected nulls
-            - Validate dtypes
-            - Check for invalid placeholders
+            - Null masks, dtype conformance and placeholder detection for all
+              columns in one vectorized pass per frame
+            - Results collected in a ValidationResult rather than stopping
+              at the first failure
 
         Outputs
         ----------
-            - Logs for each check
+            - ValidationResult, logged; raises once all checks have run if
+              any error was found
 
         Parameters
         ----------
@@ -41,73 +136,79 @@ class ValidationChecks(BasePipeline):
         self.dataset = dataset
         self.expected_dtypes = RawDataDict().data.get('dtypes')
 
-    def perform_data_checks(self):
-        no_expect_nulls, numeric_cols, float_cols, int_cols, str_cols = self.col_groups()
-        steps = [
-            ("Check for unexpected nulls", self.test_no_unexpected_nulls(no_expect_nulls)),
-            ("Dtype validation", self.test_dtypes(float_cols, int_cols, str_cols)),
-            ("Invalid placeholder check", self.test_no_invalid_placeholders(numeric_cols))
-        ]
-        for step_name, step_result in steps:
-            logging.debug(f"{step_name}: {step_result}")
-
-    def col_groups(self):
-        cols = self.dataset.columns
-        no_expect_nulls = cols.difference(['opx_vol'])
-        float_cols = []
-        int_cols = []
-        str_cols = []
-
-        for col in cols:
-            dtype = self.expected_dtypes[col]
-            if dtype == float:
-                float_cols.append(col)
-            elif dtype == int:
-                int_cols.append(col)
-            elif dtype == str:
-                str_cols.append(col)
-            else:
-                raise ValueError(f"Invalid dtype '{dtype}' for column '{col}'.")
-        numeric_cols = float_cols + int_cols
-        assert len(self.dataset.columns) == len(self.expected_dtypes), (
-            f"Expected {len(self.dataset.columns)} columns. DataDict uses dtype length {len(self.expected_dtypes)}."
-        )
-        assert len(self.dataset.columns) == len(numeric_cols) + len(str_cols), (
-            "Numeric and non-numeric columns do not add up to total columns."
-        )
-        return no_expect_nulls, numeric_cols, float_cols, int_cols, str_cols
-
-    def test_no_unexpected_nulls(self, no_expect_nulls):
-        col_store = []
-        for col in no_expect_nulls:
-            if self.dataset[col].isnull().any():
-                col_store.append(col)
-        return "PASSED: No unexpected nulls" if not col_store else f"FAILED: Unexpected nulls found in columns {col_store}. Continuing..."
-
-    def test_dtypes(self, float_cols, int_cols, str_cols):
-        # Check for float type
-        for col in float_cols:
-            assert pd.api.types.is_float_dtype(
-                self.dataset[col]
-            ), f"Column '{col}' should be float, but is {self.dataset[col].dtype}."
-
-        # Check for int type
-        for col in int_cols:
-            assert pd.api.types.is_integer_dtype(
-                self.dataset[col]
-            ), f"Column '{col}' should be int, but is {self.dataset[col].dtype}."
-
-        # Check for object/string type
-        for col in str_cols:
-            assert pd.api.types.is_object_dtype(
-                self.dataset[col]
-            ), f"Column '{col}' should be str/object, but isn't."
-        return "PASSED: Dtypes validated"
-
-    def test_no_invalid_placeholders(self, numeric_cols):
-        for col in numeric_cols:
-            invalid_vals = self.dataset[col][self.dataset[col].apply(lambda x: isinstance(x, str))]
-            assert invalid_vals.empty, (
-                f"Invalid string entries found in numeric column '{col}': {invalid_vals.unique()}"
+    def perform_data_checks(self) -> ValidationResult:
+        result = self.validate()
+        if result.passed and not result.warnings:
+            logging.debug(result.summary())
+        else:
+            logging.warning(result.summary())
+        if not result.passed:
+            raise ValueError(f"Validation failed:\n{result.summary()}")
+        return result
+
+    def validate(self) -> ValidationResult:
+        result = ValidationResult()
+        for df in iter_frames(self.dataset):
+            with trace_span("validate_frame", cat="substep", rows=len(df)):
+                self.validate_frame(df, result)
+        return result
+
+    def validate_frame(self, df: pd.DataFrame, result: ValidationResult):
+        """Adds one frame's failures to `result`; row positions continue from earlier frames."""
+        offset, k = result.rows, result.max_samples
+        result.rows += len(df)
+        expected = {col: self.dtype_name(dtype) for col, dtype in self.expected_dtypes.items()}
+        for col in expected.keys() - set(df.columns) - set(result.missing_columns):
+            result.missing_columns.append(col)
+        for col in set(df.columns) - expected.keys() - set(result.unexpected_columns):
+            result.unexpected_columns.append(col)
+        cols = [col for col in df.columns if col in expected]
+
+        # Null masks: one 2-D boolean array for every column
+        null_mask = df[cols].isna().to_numpy()
+        null_counts = null_mask.sum(axis=0)
+
+        for j, col in enumerate(cols):
+            report = result.columns.setdefault(
+                col, ColumnValidation(col, expected[col], nullable=col in self.nullable_cols)
             )
-        return "PASSED: No invalid placeholders found"
+            series = df[col]
+            report.dtype = str(series.dtype)
+            report.dtype_ok = report.dtype_ok and self.dtype_conforms(series, expected[col])
+            if null_counts[j]:
+                report.nulls += int(null_counts[j])
+                if not report.nullable and len(report.null_rows) < k:
+                    rows = np.flatnonzero(null_mask[:, j])[:k - len(report.null_rows)]
+                    report.null_rows.extend((rows + offset).tolist())
+
+            # Placeholders can only hide in numeric columns stored as objects/strings
+            if expected[col] in ("float", "int") and not pd.api.types.is_numeric_dtype(series):
+                invalid = pd.to_numeric(series, errors="coerce").isna().to_numpy() & ~null_mask[:, j]
+                n_invalid = int(invalid.sum())
+                if n_invalid:
+                    report.placeholders += n_invalid
+                    positions = np.flatnonzero(invalid)
+                    if len(report.placeholder_rows) < k:
+                        report.placeholder_rows.extend(
+                            (positions[:k - len(report.placeholder_rows)] + offset).tolist()
+                        )
+                    for value in pd.unique(series.to_numpy()[positions]):
+                        if len(report.placeholder_values) >= k:
+                            break
+                        if value not in report.placeholder_values:
+                            report.placeholder_values.append(value)
+
+    @staticmethod
+    def dtype_name(dtype) -> str:
+        names = {float: "float", int: "int", str: "str"}
+        if dtype not in names:
+            raise ValueError(f"Invalid dtype '{dtype}' in the data dictionary.")
+        return names[dtype]
+
+    @staticmethod
+    def dtype_conforms(series: pd.Series, expected: str) -> bool:
+        if expected == "float":
+            return pd.api.types.is_float_dtype(series)
+        if expected == "int":
+            return pd.api.types.is_integer_dtype(series)
+        return pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
 import numpy as np
-from scipy.stats import boxcox
-from scipy.stats import yeojohnson
 
 from config.paths import Paths
 from config.pipeline_context import PipelineContext
@@ -65,6 +63,8 @@ class DistributionTransformer:
 
     def apply_transform(self, df, transform_mapping):
         """Applies transformations based on the assigned mapping."""
+        from scipy.stats import boxcox
+        from scipy.stats import yeojohnson
         for feature, row in transform_mapping.iterrows():
             if feature == self.config.target_col:
                 continue
@@ -2,76 +2,90 @@ from __future__ import annotations
 
 import logging
 from pprint import pformat
+from typing import Union
 
-import numpy as np
+import pandas as pd
 
 from config.pipeline_context import PipelineContext
 from config.settings import Config
-from src.core.data_handling.data_module import DataModule
+from src.data.profile import DatasetProfile
+from src.data.statistics import DatasetStats
 
 
 class DataQualityChecks:
+    """
+    Summary
+    ----------
+    Data quality checks rendered from the dataset profile
+    Duplicates, missing values, cardinality, value counts, target imbalance
+    and skewness/kurtosis are read from the profile CollectMetadata computed,
+    so the checks add no pass over the data.
+
+    Parameters
+    ----------
+    ctx : PipelineContext
+        Contains the Config with the target column
+    profile : dict or pd.DataFrame
+        The saved `{path_key}-profile`, as a dict or as the table it loads as
+    path_key : str
+        Key of the profiled dataset, prefixing the output key
+    """
+
     def __init__(
         self, ctx: PipelineContext,
-        dataset: DataModule,
+        profile: Union[dict, pd.DataFrame],
         path_key: str
     ):
         self.ctx = ctx
-        self.dataset = dataset
+        self.profile = DatasetProfile.load(profile)
         self.path_key = path_key
         self.config: Config = ctx.settings.config
 
     def run(self):
+        skew_kurt = self.find_skewness_kurtosis()
         steps = [
-            ("find_duplicates", self.find_duplicates()),
-            ("find_missing_values", self.find_missing_values()),
-            ("find_missing_percentage", self.find_missing_percentage()),
-            ("find_unique_values", self.find_unique_values()),
-            ("find_value_counts", self.find_value_counts()),
-            ("target_imbalance", self.target_imbalance()),
-            ("find_skewness_kurtosis", self.find_skewness_kurtosis()),
+            ("find_duplicates", self.find_duplicates),
+            ("find_missing_values", self.find_missing_values),
+            ("find_missing_percentage", self.find_missing_percentage),
+            ("find_unique_values", self.find_unique_values),
+            ("find_value_counts", self.find_value_counts),
+            ("target_imbalance", self.target_imbalance),
         ]
-        for step_name, step_result in steps:
-            logging.debug(f"{step_name}:\n {pformat(step_result)}\n")
-        return {f'{self.path_key}-skew-kurt': self.find_skewness_kurtosis()}
+        for step_name, func in steps:
+            logging.debug(f"{step_name}:\n {pformat(func())}\n")
+        logging.debug(f"find_skewness_kurtosis:\n {pformat(skew_kurt)}\n")
+        if self.profile.error_bounds is not None:
+            logging.info(f"Approximate statistics for `{self.path_key}`: {self.profile.error_bounds}")
+        return {f'{self.path_key}-skew-kurt': skew_kurt}
+
+    @property
+    def stats(self) -> DatasetStats:
+        return self.profile.stats
 
     def find_duplicates(self):
-        return len(self.dataset[self.dataset.duplicated(keep='first')])
+        return self.profile.duplicates
 
     def find_missing_values(self):
-        return self.dataset.isnull().sum()
+        return self.stats.missing()
 
     def find_missing_percentage(self):
-        return self.dataset.isnull().sum() / len(self.dataset) * 100
+        return self.stats.missing_percentage()
 
     def find_unique_values(self):
-        object_cols = self.dataset.select_dtypes(include=['object'])
-
-        if object_cols.empty:
+        if not self.stats.categorical_columns:
             logging.debug("Categorical columns processed")
             return None
-
-        return object_cols.nunique()
+        return self.profile.info()["Unique"][self.stats.categorical_columns]
 
     def find_value_counts(self):
-        object_cols = self.dataset.select_dtypes(include=['object'])
-
-        if object_cols.empty:
+        counts = self.stats.value_counts(normalize=True)
+        if counts is None:
             logging.debug("Categorical columns processed")
-            return None
-
-        return object_cols.apply(lambda x: x.value_counts(normalize=True))
+        return counts
 
     def target_imbalance(self):
-        return self.dataset[self.config.target_col].value_counts(normalize=True)
+        return self.stats.imbalance(self.config.target_col)
 
     def find_skewness_kurtosis(self):
-        """Computes skewness and kurtosis for numerical columns, handling NaNs efficiently."""
-        skew_kurt_store = {}
-        cols = self.dataset.select_dtypes(include=np.number).columns
-        for col in cols:
-            data = self.dataset[col].dropna()
-            skewness = float(round(data.skew(), 3))
-            kurtosis = float(round(data.kurt(), 3))
-            skew_kurt_store[col] = (skewness, kurtosis)
-        return skew_kurt_store
+        """Skewness and kurtosis of the numerical columns, NaNs excluded."""
+        return self.stats.skewness_kurtosis()
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.pipeline_context import PipelineContext
+from config.settings import Config
+from src.core.data_handling.data_chunks import iter_frames
+from src.core.data_handling.data_dict import RawDataDict
+from src.core.data_handling.data_module import DataModule
+from utils.tracing import trace_span
+
+# Reason codes, in the order rules are evaluated
+INVALID_NUMBER = "invalid_number"
+NON_INTEGER = "non_integer"
+MISSING_TARGET = "missing_target"
+
+
+class SchemaIngestor:
+    """
+    Summary
+    ----------
+    Schema-enforcing ingestion of the raw file with row-level quarantine
+    Reads the raw file as strings, validates every row against the
+    RawDataDict dtypes and splits it into typed clean rows and quarantined
+    rows carrying a reason code, so a bad value costs its row rather than
+    the run.
+
+    Extended Summary
+    ----------
+    - Rules: ``invalid_number`` (a numeric column holds a non-numeric value),
+      ``non_integer`` (an int column holds a fractional value) and
+      ``missing_target`` (no label)
+    - Nulls in feature columns are not rejected; processing handles them
+    - Chunks are validated concurrently (``Config.ingest_workers``) and
+      reassembled in file order
+    - Quarantined rows keep their raw values, source row number and every
+      failed ``rule:column``
+    - Opt-in through ``Config.schema_ingestion``; consumers of `raw-data` then
+      read `ingested-data`
+
+    Parameters
+    ----------
+    ctx : PipelineContext
+        Contains the Config with the target column and worker count
+    dataset : DataChunks or pd.DataFrame
+        The raw file, every column read as strings
+    """
+
+    def __init__(self, ctx: PipelineContext, dataset: DataModule):
+        self.ctx = ctx
+        self.dataset = dataset
+        self.config: Config = ctx.settings.config
+        self.schema: Dict[str, type] = RawDataDict().data.get('dtypes')
+
+    def run(self):
+        clean_parts, quarantine_parts, counts, rows = [], [], Counter(), 0
+        for clean, quarantined, chunk_counts in self.validate_chunks():
+            clean_parts.append(clean)
+            quarantine_parts.append(quarantined)
+            counts.update(chunk_counts)
+            rows += len(clean) + len(quarantined)
+        if not clean_parts:
+            # An empty source still gives typed, empty outputs with the schema columns
+            empty = pd.DataFrame(columns=list(self.schema), dtype=object)
+            clean, quarantined, _ = self.validate_chunk(empty, 0)
+            floats = {col: float for col, dtype in self.schema.items() if dtype == float}
+            clean_parts, quarantine_parts = [clean.astype(floats)], [quarantined]
+        clean = pd.concat(clean_parts, ignore_index=True)
+        clean = self.narrow_int_columns(clean)
+        quarantined = pd.concat(quarantine_parts, ignore_index=True)
+        report = self.build_report(rows, len(clean), len(quarantined), counts)
+        if len(quarantined):
+            logging.warning(
+                f"Quarantined {len(quarantined)} of {rows} rows: {report['rules']}"
+            )
+        else:
+            logging.info(f"Ingested {rows} rows, none quarantined")
+        return {
+            "ingested-data": clean,
+            "quarantine": quarantined,
+            "ingestion-report": report,
+        }
+
+    def validate_chunks(self):
+        """Yields (clean, quarantined, counts) per chunk in file order, validating up to `ingest_workers` at once."""
+        width = max(1, self.config.ingest_workers)
+        pending: Deque[Future] = deque()
+        offset = 0
+        with ThreadPoolExecutor(max_workers=width, thread_name_prefix="ingest") as pool:
+            for chunk in iter_frames(self.dataset):
+                pending.append(pool.submit(self.validate_chunk, chunk, offset))
+                offset += len(chunk)
+                # Bound the chunks held in memory
+                if len(pending) >= 2 * width:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def validate_chunk(
+        self, chunk: pd.DataFrame, offset: int
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, Counter]:
+        with trace_span("ingest_chunk", cat="substep", rows=len(chunk)):
+            missing = [col for col in self.schema if col not in chunk.columns]
+            if missing:
+                raise ValueError(f"Raw data is missing schema columns {missing}; cannot ingest.")
+            typed, failures = {}, []
+            for col, dtype in self.schema.items():
+                raw = chunk[col]
+                if dtype in (float, int):
+                    values = pd.to_numeric(raw, errors="coerce")
+                    invalid = (values.isna() & raw.notna()).to_numpy()
+                    failures.append((INVALID_NUMBER, col, invalid))
+                    if dtype == int:
+                        fractional = (values.notna() & (values % 1 != 0)).to_numpy()
+                        failures.append((NON_INTEGER, col, fractional))
+                        # Fractional values are quarantined; blank them so the column casts
+                        values = values.where(~fractional).astype("Int64")
+                    typed[col] = values
+                else:
+                    typed[col] = raw
+            target = self.config.target_col
+            if target in typed:
+                failures.append((MISSING_TARGET, target, typed[target].isna().to_numpy()))
+
+            failed = np.zeros(len(chunk), dtype=bool)
+            counts: Counter = Counter()
+            for rule, col, mask in failures:
+                n_failed = int(mask.sum())
+                if n_failed:
+                    failed |= mask
+                    counts[(rule, col)] += n_failed
+
+            clean = pd.DataFrame(typed, index=chunk.index)[~failed]
+            quarantined = chunk[failed].copy()
+            quarantined.insert(0, "source_row", np.flatnonzero(failed) + offset)
+            quarantined["reason"] = self.reasons(failures, failed)
+            return clean, quarantined, counts
+
+    @staticmethod
+    def reasons(failures: List[Tuple[str, str, np.ndarray]], failed: np.ndarray) -> List[str]:
+        """`rule:column` codes of every failed check, per quarantined row."""
+        reasons: List[List[str]] = [[] for _ in range(int(failed.sum()))]
+        for rule, col, mask in failures:
+            for i in np.flatnonzero(mask[failed]):
+                reasons[i].append(f"{rule}:{col}")
+        return [";".join(r) for r in reasons]
+
+    def narrow_int_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Int columns without NAs become plain int64, matching a typed read of the raw file."""
+        for col, dtype in self.schema.items():
+            if dtype == int and col in df.columns and not df[col].isna().any():
+                df[col] = df[col].astype(int)
+        return df
+
+    @staticmethod
+    def build_report(rows: int, clean: int, quarantined: int, counts: Counter) -> dict:
+        rules: Dict[str, Dict[str, int]] = {}
+        for (rule, col), n in sorted(counts.items()):
+            rules.setdefault(rule, {})[col] = n
+        return {
+            "rows": rows,
+            "clean_rows": clean,
+            "quarantined_rows": quarantined,
+            "rules": rules,
+        }
@@ -1,17 +1,56 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
+from typing import Optional
 
 import pandas as pd
-from ydata_profiling import ProfileReport
 
 from config.paths import Paths
 from config.pipeline_context import PipelineContext
+from config.settings import Config
+from src.core.data_handling.data_chunks import DataChunks
+from src.core.data_handling.data_chunks import iter_frames
 from src.core.data_handling.data_module import DataModule
+from src.core.step_handling.step_cache import settings_fingerprint
+from src.core.step_handling.step_cache import StepCache
+from src.data.profile import DatasetProfile
+from src.data.profile import frame_digest
+from src.data.profile import profile_fingerprint
+from src.data.sketches import DatasetSketch
+from src.data.statistics import DatasetStats
+from utils.file_access import FileAccess
+from utils.tracing import trace_span
 pd.set_option("display.max_columns", None)
 
 
 class CollectMetadata:
+    """
+    Summary
+    ----------
+    Profiles a dataset once and renders the metadata log from the profile
+    The profile (`{path_key}-profile`) holds info, describe, head, duplicate
+    count and the mergeable statistics, and is reused while the dataset and
+    Settings are unchanged.
+
+    Extended Summary
+    ----------
+    - One statistics pass over the frame or, in approximate mode, the chunk
+      stream, which also builds the sketches (`{path_key}-sketches`)
+    - A saved profile with the current fingerprint is loaded instead of
+      recomputed; with the step cache on, an unchanged dataset skips the step
+    - The text log and debug logging render the same profile
+
+    Parameters
+    ----------
+    ctx : PipelineContext
+        Contains the paths and Config
+    dataset : DataModule
+        Frame or DataChunks stream to profile
+    path_key : str
+        Key of the dataset, prefixing the output keys
+    """
+
     def __init__(
         self, ctx: PipelineContext,
         dataset: DataModule,
@@ -21,30 +60,110 @@ class CollectMetadata:
         self.dataset = dataset
         self.path_key = path_key
         self.paths: Paths = ctx.paths
+        self.config: Config = ctx.settings.config
+        self.sketch: Optional[DatasetSketch] = None
 
     def run(self):
-        self.metadata()
-        self.output_metadata()
+        profile = self.saved_profile()
+        if profile is None:
+            profile = self.build_profile()
+        else:
+            logging.info(f"Reusing the `{self.path_key}` profile, dataset unchanged")
+        self.metadata(profile)
+        self.output_metadata(profile)
         # self.generate_report()
+        outputs = {f"{self.path_key}-profile": profile.to_dict()}
+        if self.sketch is not None:
+            outputs[f"{self.path_key}-sketches"] = self.sketch.to_dict()
+        return outputs
+
+    @cached_property
+    def fingerprint(self) -> Optional[str]:
+        """Digest of the data handed to the step, and of the Settings."""
+        return profile_fingerprint(self.data_digest(), settings_fingerprint(self.ctx.settings))
+
+    def data_digest(self) -> Optional[str]:
+        """
+        Content digest of the frame being profiled or, for a chunk stream, of
+        its file once any pending write has landed. Worker processes receive
+        streams only after the parent has awaited their writes.
+        """
+        if isinstance(self.dataset, DataChunks):
+            path = self.dataset.dm.data_path
+            self.ctx.writer.wait_for(path)
+            return StepCache(self.ctx).file_digest(path)
+        return frame_digest(self.dataset)
+
+    def saved_profile(self) -> Optional[DatasetProfile]:
+        """The saved profile (and sketches, in approximate mode) if it matches the current fingerprint."""
+        path = self.paths.get_path(f"{self.path_key}-profile")
+        sketch_path = self.paths.get_path(f"{self.path_key}-sketches")
+        if not path.exists() or (self.config.approximate_stats and not sketch_path.exists()):
+            return None
+        fingerprint = self.fingerprint
+        profile = DatasetProfile.load(FileAccess.load_json(path))
+        if fingerprint is None or profile.fingerprint != fingerprint:
+            return None
+        if self.config.approximate_stats:
+            self.sketch = DatasetSketch.from_dict(FileAccess.load_json(sketch_path))
+        return profile
+
+    def build_profile(self) -> DatasetProfile:
+        """One statistics pass; with ``Config.approximate_stats`` it streams and also sketches."""
+        if self.config.approximate_stats:
+            self.sketch = DatasetSketch(self.config.sketch_precision, self.config.sketch_k)
+        with trace_span("compute_statistics", cat="substep"):
+            stats = DatasetStats.compute(
+                self.dataset,
+                frequency_cols=[self.config.target_col],
+                track_duplicates=self.sketch is None,
+                max_categories=self.config.sketch_max_categories if self.sketch is not None else None,
+                sketch=self.sketch,
+            )
+        head = next(iter_frames(self.dataset)).head()
+        if self.sketch is not None:
+            return DatasetProfile.from_stats(
+                stats, head,
+                quartiles=self.sketch.quartiles(),
+                duplicates=self.sketch.duplicates,
+                unique=self.sketch.unique_values(list(stats.columns)),
+                error_bounds=self.sketch.error_bounds(),
+                fingerprint=self.fingerprint,
+            )
+        quartiles = self.dataset[stats.numeric_columns].quantile([0.25, 0.5, 0.75])
+        quartiles.index = ["25%", "50%", "75%"]
+        return DatasetProfile.from_stats(
+            stats, head,
+            quartiles=quartiles,
+            duplicates=stats.duplicates,
+            fingerprint=self.fingerprint,
+        )
+
+    def render_info(self, profile: DatasetProfile) -> str:
+        info = f"{profile.summary_line()}\n{profile.info().to_string()}"
+        if profile.error_bounds is not None:
+            info += f"\nApproximate: {profile.error_bounds}"
+        return info
 
-    def metadata(self):
+    def metadata(self, profile: DatasetProfile):
         file_path = self.paths.get_path(f"{self.path_key}-metadata")
 
         with open(file_path, "w") as f:
             f.write("Head of the dataset:\n")
-            f.write(self.dataset.head().to_string() + "\n\n")
+            f.write(profile.head().to_string() + "\n\n")
 
             f.write("Dataset Info:\n")
-            self.dataset.info(buf=f)
+            f.write(self.render_info(profile) + "\n")
 
             f.write("\n\nDataset Description:\n")
-            f.write(round(self.dataset.describe(), 3).to_string() + "\n")
+            f.write(profile.describe().to_string() + "\n")
 
-    def output_metadata(self):
-        logging.debug(f"Head of the dataset:\n{self.dataset.head()}")
-        logging.debug(f"\n\nDataset Info:\n{self.dataset.info()}")
-        logging.debug(f"\n\nDataset Description:\n{round(self.dataset.describe(), 3)}")
+    def output_metadata(self, profile: DatasetProfile):
+        logging.debug(f"Head of the dataset:\n{profile.head()}")
+        logging.debug(f"\n\nDataset Info:\n{self.render_info(profile)}")
+        logging.debug(f"\n\nDataset Description:\n{profile.describe()}")
 
     def generate_report(self):
+        from ydata_profiling import ProfileReport
         profile = ProfileReport(self.dataset, title='title')
         profile.to_file(self.paths.get_path(f'{self.path_key}_quality_report'))
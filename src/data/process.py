@@ -1,16 +1,24 @@
 from __future__ import annotations
 
 import logging
+from typing import Optional
+
+import pandas as pd
 
 from config.pipeline_context import PipelineContext
 from config.settings import Config
+from src.core.data_handling.data_chunks import DataChunks
 from src.core.data_handling.data_module import DataModule
+from src.data.dedup import DedupIndex
+from src.data.dedup import RowDeduplicator
+from utils.tracing import trace_span
 
 
 class DataPreprocessor:
     def __init__(
         self, ctx: PipelineContext,
         dataset: DataModule,
+        dedup_index: Optional[DedupIndex] = None,
     ):
         self.ctx = ctx
         self.dataset = dataset
@@ -19,8 +27,11 @@ class DataPreprocessor:
         self.log_skew_threshold = self.config.log_skew_threshold
         self.kurtosis_threshold = self.config.kurtosis_threshold
         self.boxcox_skew_threshold = self.config.boxcox_skew_threshold
+        self.deduplicator = RowDeduplicator(dedup_index)
 
     def run(self):
+        if isinstance(self.dataset, DataChunks):
+            return {'processed-data': self.run_chunked()}
         steps = [
             ('remove_duplicates', self.remove_duplicates),
             ('encode_cat_cols', self.encode_cat_cols),
@@ -30,11 +41,48 @@ class DataPreprocessor:
         df = self.dataset
         for name, func in steps:
             logging.info(f"Processing: {name}")
-            df = func(df)
+            with trace_span(name, cat="substep"):
+                df = func(df)
+        self.finish_deduplication()
         return {'processed-data': df}
 
+    def run_chunked(self):
+        """
+        Applies the processing steps chunk by chunk
+        Category codes are fixed from a first pass over `loc` and duplicates are
+        tracked by row hash across chunks, so output matches the whole-frame run.
+        """
+        with trace_span("collect_categories", cat="substep"):
+            categories = self.collect_categories('loc')
+        processed = []
+        for chunk in self.dataset:
+            with trace_span("process_chunk", cat="substep", rows=len(chunk)):
+                df = self.deduplicator.drop(chunk)
+                df = df.assign(loc=pd.Categorical(df['loc'], categories=categories).codes)
+                df = self.remove_nan_columns(df)
+                processed.append(self.remove_nan_rows(df))
+        logging.info(f"Processed {len(processed)} chunks")
+        self.finish_deduplication()
+        with trace_span("concat_chunks", cat="substep"):
+            return pd.concat(processed)
+
+    def collect_categories(self, col):
+        values = set()
+        for chunk in self.dataset.iter(columns=[col]):
+            values.update(chunk[col].dropna().unique())
+        return sorted(values)
+
     def remove_duplicates(self, df):
-        return df.drop_duplicates(keep='first')
+        return self.deduplicator.drop(df)
+
+    def finish_deduplication(self):
+        dedup = self.deduplicator
+        logging.info(
+            f"Removed {dedup.duplicates} duplicate rows of {dedup.rows}, "
+            f"{dedup.repeats} of them seen in earlier runs over other sources"
+        )
+        if dedup.index is not None:
+            dedup.save()
 
     def encode_cat_cols(self, df):
         df['loc'] = df['loc'].astype('category').cat.codes
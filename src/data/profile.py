@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Union
+
+import attr
+import numpy as np
+import pandas as pd
+
+from src.data.statistics import ColumnStats
+from src.data.statistics import DatasetStats
+
+DATASET_KEY = "__dataset__"
+QUARTILE_ROWS = ("25%", "50%", "75%")
+DESCRIBE_ROWS = ("count", "mean", "std", "min", "25%", "50%", "75%", "max", "skew", "kurt")
+
+
+def profile_fingerprint(data_digest: Optional[str], settings_digest: str) -> Optional[str]:
+    """Identifies a dataset's content and the settings it was profiled under."""
+    if data_digest is None:
+        return None
+    payload = json.dumps({"data": data_digest, "settings": settings_digest}, sort_keys=True)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def frame_digest(df: pd.DataFrame) -> str:
+    """Content digest of a frame: column names, dtypes and row values."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(json.dumps([[str(col), str(dtype)] for col, dtype in df.dtypes.items()]).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _plain(value):
+    """JSON-safe scalar: numpy types unwrapped, NaN as null."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+@attr.s
+class DatasetProfile:
+    """
+    Summary
+    ----------
+    Structured, persisted profile of a dataset: the `info()`/`describe()`
+    content, head, duplicate count and the mergeable statistics behind them
+    Computed once per dataset fingerprint by CollectMetadata; the text log,
+    debug logging and the quality checks all render from it.
+
+    Extended Summary
+    ----------
+    - Saved as JSON with one entry per column plus a ``__dataset__`` entry, so
+      the artifact also loads as a column-by-field table
+    - Keeps each column's moments and frequencies, so the full DatasetStats
+      (skewness, missing counts, value counts) can be rebuilt without a pass
+    - `fingerprint` ties the profile to the dataset's content and Settings;
+      a matching profile is reused instead of recomputed
+    - In approximate mode unique counts and quartiles are sketch estimates and
+      `error_bounds` states their accuracy
+    """
+    fingerprint: Optional[str] = attr.ib(default=None)
+    rows: int = attr.ib(default=0)
+    duplicates: Optional[int] = attr.ib(default=None)
+    error_bounds: Optional[str] = attr.ib(default=None)
+    stats: DatasetStats = attr.ib(factory=lambda: DatasetStats(track_duplicates=False), repr=False)
+    unique: Dict[str, Optional[int]] = attr.ib(factory=dict, repr=False)
+    quartiles: Dict[str, Dict[str, float]] = attr.ib(factory=dict, repr=False)
+    head_rows: Dict[str, list] = attr.ib(factory=dict, repr=False)
+
+    @classmethod
+    def from_stats(
+        cls, stats: DatasetStats,
+        head: pd.DataFrame,
+        quartiles: pd.DataFrame,
+        duplicates: Optional[int],
+        unique: Optional[pd.Series] = None,
+        error_bounds: Optional[str] = None,
+        fingerprint: Optional[str] = None,
+    ) -> DatasetProfile:
+        unique = stats.info()["Unique"] if unique is None else unique
+        return cls(
+            fingerprint=fingerprint,
+            rows=stats.rows,
+            duplicates=duplicates,
+            error_bounds=error_bounds,
+            stats=stats,
+            unique={col: _plain(n) if not pd.isna(n) else None for col, n in unique.items()},
+            quartiles={col: {q: float(v) for q, v in values.items()} for col, values in quartiles.items()},
+            # Through to_json so values are JSON types, nulls included
+            head_rows={
+                col: list(values.values()) for col, values in json.loads(head.to_json(orient="columns")).items()
+            },
+        )
+
+    @classmethod
+    def load(cls, data: Union[Dict[str, Any], pd.DataFrame]) -> DatasetProfile:
+        """Rebuilds a profile from its saved dict, or the table the JSON loads as."""
+        if isinstance(data, pd.DataFrame):
+            data = {
+                key: {k: v for k, v in row.items() if not (np.isscalar(v) and pd.isna(v))}
+                for key, row in data.iterrows()
+            }
+        dataset = data[DATASET_KEY]
+        stats = DatasetStats(track_duplicates=False, rows=int(dataset["rows"]))
+        profile = cls(
+            fingerprint=dataset.get("fingerprint"),
+            rows=int(dataset["rows"]),
+            duplicates=None if dataset.get("duplicates") is None else int(dataset["duplicates"]),
+            error_bounds=dataset.get("error_bounds"),
+            stats=stats,
+        )
+        for col, entry in data.items():
+            if col == DATASET_KEY:
+                continue
+            stats.columns[col] = ColumnStats(
+                col, entry["dtype"],
+                numeric=bool(entry.get("numeric", False)),
+                count=int(entry["count"]),
+                nulls=int(entry["nulls"]),
+                minimum=_float(entry.get("min")),
+                maximum=_float(entry.get("max")),
+                moments=tuple(_float(m) for m in entry["moments"]) if entry.get("moments") else (0.0,) * 5,
+                frequencies=entry.get("frequencies"),
+                capped=bool(entry.get("capped", False)),
+            )
+            profile.unique[col] = None if entry.get("unique") is None else int(entry["unique"])
+            if entry.get("quartiles"):
+                profile.quartiles[col] = {q: _float(v) for q, v in entry["quartiles"].items()}
+            profile.head_rows[col] = list(entry.get("head", []))
+        return profile
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            DATASET_KEY: {
+                "fingerprint": self.fingerprint,
+                "rows": self.rows,
+                "columns": len(self.stats.columns),
+                "duplicates": self.duplicates,
+                "error_bounds": self.error_bounds,
+            }
+        }
+        for col, c in self.stats.columns.items():
+            entry = {
+                "dtype": c.dtype,
+                "numeric": c.numeric,
+                "count": c.count,
+                "nulls": c.nulls,
+                "unique": self.unique.get(col),
+                "head": self.head_rows.get(col, []),
+            }
+            if c.numeric:
+                entry.update({
+                    "min": _plain(c.minimum),
+                    "max": _plain(c.maximum),
+                    "mean": _plain(c.mean),
+                    "std": _plain(c.std),
+                    "skew": _plain(c.skewness),
+                    "kurt": _plain(c.kurtosis),
+                    "quartiles": {q: _plain(v) for q, v in self.quartiles.get(col, {}).items()},
+                    "moments": [_plain(m) for m in c.moments],
+                })
+            if c.frequencies is not None or c.capped:
+                entry["frequencies"] = (
+                    None if c.frequencies is None
+                    else {str(_plain(k)): int(n) for k, n in c.frequencies.items()}
+                )
+                entry["capped"] = c.capped
+            data[col] = entry
+        return data
+
+    def head(self) -> pd.DataFrame:
+        return pd.DataFrame(self.head_rows)
+
+    def info(self) -> pd.DataFrame:
+        table = self.stats.info()
+        table["Unique"] = pd.array([self.unique.get(col) for col in table.index], dtype="Int64")
+        return table
+
+    def describe(self) -> pd.DataFrame:
+        """`describe()` layout plus skew and kurtosis."""
+        description = self.stats.describe()
+        quartiles = pd.DataFrame(
+            {col: [self.quartiles.get(col, {}).get(q, np.nan) for q in QUARTILE_ROWS] for col in description.columns},
+            index=list(QUARTILE_ROWS),
+        )
+        description = pd.concat([description, quartiles])
+        return round(description.loc[list(DESCRIBE_ROWS)], 3)
+
+    def summary_line(self) -> str:
+        duplicates = self.duplicates
+        if self.error_bounds is not None and duplicates is not None:
+            duplicates = f"~{duplicates}"
+        return f"{self.rows} rows x {len(self.stats.columns)} columns, {duplicates} duplicate rows"
+
+
+def _float(value) -> float:
+    return np.nan if value is None else float(value)
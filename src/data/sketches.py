@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import base64
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+import attr
+import numpy as np
+import pandas as pd
+
+# Two standard errors: ~95% of HyperLogLog estimates fall within this multiple of the error
+HLL_CONFIDENCE = 2.0
+QUARTILES = (0.25, 0.5, 0.75)
+
+
+def hash_values(values) -> np.ndarray:
+    """64-bit hashes of a Series' values or of a frame's rows."""
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+@attr.s
+class HyperLogLog:
+    """
+    Distinct-count sketch over 64-bit hashes
+    `2 ** precision` one-byte registers; the relative standard error is
+    1.04 / sqrt(2 ** precision), about 0.8% at the default precision.
+    Sketches of the same precision merge by register-wise max.
+    """
+    precision: int = attr.ib(default=14)
+    registers: np.ndarray = attr.ib(default=None, repr=False, eq=False)
+
+    def __attrs_post_init__(self):
+        if not 4 <= self.precision <= 18:
+            raise ValueError(f"HyperLogLog precision must be between 4 and 18, got {self.precision}.")
+        if self.registers is None:
+            self.registers = np.zeros(1 << self.precision, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray) -> HyperLogLog:
+        if not len(hashes):
+            return self
+        width = 64 - self.precision
+        index = (hashes >> np.uint64(width)).astype(np.intp)
+        rest = hashes & np.uint64((1 << width) - 1)
+        # Rank = leading zeros in the remaining bits + 1; `width` bits are exact in float64
+        rank = (width + 1 - np.frexp(rest.astype(np.float64))[1]).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other: HyperLogLog) -> HyperLogLog:
+        if other.precision != self.precision:
+            raise ValueError(
+                f"Cannot merge HyperLogLog sketches of precision {self.precision} and {other.precision}."
+            )
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.ldexp(1.0, -self.registers.astype(np.int64)).sum()
+        zeros = int((self.registers == 0).sum())
+        if raw <= 2.5 * m and zeros:
+            # Small-range correction: linear counting
+            return float(m * np.log(m / zeros))
+        return float(raw)
+
+    @property
+    def relative_error(self) -> float:
+        return float(1.04 / np.sqrt(len(self.registers)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "precision": self.precision,
+            "registers": base64.b64encode(self.registers.tobytes()).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> HyperLogLog:
+        registers = np.frombuffer(base64.b64decode(data["registers"]), dtype=np.uint8).copy()
+        return cls(data["precision"], registers)
+
+
+@attr.s
+class KLLSketch:
+    """
+    Quantile sketch (KLL compactors)
+    Level ``h`` holds items of weight ``2 ** h``; a full level is sorted and
+    every other item promoted, so about ``3 * k`` items are retained
+    regardless of the stream length. Sketches merge level by level.
+    """
+    k: int = attr.ib(default=200)
+    n: int = attr.ib(default=0)
+    levels: List[np.ndarray] = attr.ib(factory=lambda: [np.empty(0)], repr=False, eq=False)
+    rng: np.random.Generator = attr.ib(factory=lambda: np.random.default_rng(0), repr=False, eq=False)
+
+    def update(self, values: np.ndarray) -> KLLSketch:
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values):
+            self.n += len(values)
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self.compress()
+        return self
+
+    def merge(self, other: KLLSketch) -> KLLSketch:
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self.n += other.n
+        self.compress()
+        return self
+
+    def capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) <= self.capacity(level):
+                level += 1
+                continue
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            items = np.sort(items)
+            paired = len(items) - len(items) % 2
+            promoted = items[:paired][self.rng.integers(2)::2]
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            self.levels[level] = items[paired:]
+            # A new top level lowers the capacity of every level below it
+            level = 0 if level + 2 == len(self.levels) else level + 1
+
+    def quantiles(self, qs: Sequence[float]) -> List[float]:
+        if not self.n:
+            return [np.nan for _ in qs]
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        items, cumulative = items[order], np.cumsum(weights[order])
+        positions = np.searchsorted(cumulative, np.asarray(qs) * cumulative[-1], side="left")
+        return items[np.minimum(positions, len(items) - 1)].tolist()
+
+    @property
+    def rank_error(self) -> float:
+        """Normalized rank error of a single quantile at ~99% confidence (DataSketches' KLL fit)."""
+        return 2.296 / self.k ** 0.9723
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"k": self.k, "n": self.n, "levels": [items.tolist() for items in self.levels]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> KLLSketch:
+        return cls(data["k"], data["n"], [np.asarray(items, dtype=float) for items in data["levels"]])
+
+
+@attr.s
+class DatasetSketch:
+    """
+    Summary
+    ----------
+    Approximate cardinality, quantiles and duplicate count of a dataset in
+    bounded memory
+    The approximate counterpart of the exact counts in DatasetStats for data
+    too large to hold, or hash, in full. Enabled by ``Config.approximate_stats``.
+
+    Extended Summary
+    ----------
+    - Distinct values per column: HyperLogLog over value hashes
+    - Quartiles of numeric columns: KLL sketch
+    - Duplicate rows: rows minus a HyperLogLog estimate of distinct row hashes
+    - Sketches serialise to JSON (`to_dict`/`from_dict`) and merge across
+      chunks, worker processes and separately sketched files
+    - `report` states each estimate with its error bound
+
+    Parameters
+    ----------
+    precision : int
+        HyperLogLog precision; memory is ``2 ** precision`` bytes per column
+    k : int
+        KLL accuracy parameter; rank error is about ``2.3 / k``
+    """
+    precision: int = attr.ib(default=14)
+    k: int = attr.ib(default=200)
+    rows: int = attr.ib(default=0)
+    row_distinct: HyperLogLog = attr.ib(default=None)
+    distinct: Dict[str, HyperLogLog] = attr.ib(factory=dict)
+    quantiles: Dict[str, KLLSketch] = attr.ib(factory=dict)
+
+    def __attrs_post_init__(self):
+        if self.row_distinct is None:
+            self.row_distinct = HyperLogLog(self.precision)
+
+    def update(self, df: pd.DataFrame) -> DatasetSketch:
+        self.rows += len(df)
+        self.row_distinct.add_hashes(hash_values(df))
+        numeric = set(df.select_dtypes(include=np.number).columns)
+        for col in df.columns:
+            values = df[col].dropna()
+            self.distinct.setdefault(col, HyperLogLog(self.precision)).add_hashes(hash_values(values))
+            if col in numeric:
+                self.quantiles.setdefault(col, KLLSketch(self.k)).update(values.to_numpy(dtype=float))
+        return self
+
+    def merge(self, other: DatasetSketch) -> DatasetSketch:
+        self.rows += other.rows
+        self.row_distinct.merge(other.row_distinct)
+        for col, sketch in other.distinct.items():
+            self.distinct.setdefault(col, HyperLogLog(self.precision)).merge(sketch)
+        for col, sketch in other.quantiles.items():
+            self.quantiles.setdefault(col, KLLSketch(self.k)).merge(sketch)
+        return self
+
+    @property
+    def duplicates(self) -> int:
+        return max(0, self.rows - round(min(self.row_distinct.estimate(), self.rows)))
+
+    @property
+    def duplicates_error(self) -> int:
+        return int(np.ceil(HLL_CONFIDENCE * self.row_distinct.relative_error * min(self.row_distinct.estimate(), self.rows)))
+
+    def unique_values(self, columns: Optional[Sequence[str]] = None) -> pd.Series:
+        columns = list(self.distinct) if columns is None else columns
+        return pd.Series({col: round(self.distinct[col].estimate()) for col in columns}, dtype="int64")
+
+    def quartiles(self) -> pd.DataFrame:
+        """Approximate `describe()` quartile rows for the numeric columns."""
+        return pd.DataFrame(
+            {col: sketch.quantiles(QUARTILES) for col, sketch in self.quantiles.items()},
+            index=[f"{q:.0%}" for q in QUARTILES],
+        )
+
+    @property
+    def distinct_error(self) -> float:
+        return HLL_CONFIDENCE * HyperLogLog(self.precision).relative_error
+
+    @property
+    def rank_error(self) -> float:
+        return KLLSketch(self.k).rank_error
+
+    def error_bounds(self) -> str:
+        return (
+            f"distinct counts within ±{self.distinct_error:.1%} (95%), "
+            f"quantiles within ±{self.rank_error:.1%} in rank (99%), "
+            f"duplicates within ±{self.duplicates_error} rows (95%)"
+        )
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "duplicates": {"estimate": self.duplicates, "error_rows": self.duplicates_error, "confidence": 0.95},
+            "distinct": {
+                "estimates": self.unique_values().to_dict(),
+                "relative_error": round(self.distinct_error, 4),
+                "confidence": 0.95,
+            },
+            "quantiles": {
+                "estimates": {col: dict(zip(QUARTILES, sketch.quantiles(QUARTILES)))
+                              for col, sketch in self.quantiles.items()},
+                "rank_error": round(self.rank_error, 4),
+                "confidence": 0.99,
+            },
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Report plus the serialised sketch state, as persisted next to the skew/kurt JSON."""
+        return {
+            "report": self.report(),
+            "state": {
+                "precision": self.precision,
+                "k": self.k,
+                "rows": self.rows,
+                "row_distinct": self.row_distinct.to_dict(),
+                "distinct": {col: sketch.to_dict() for col, sketch in self.distinct.items()},
+                "quantiles": {col: sketch.to_dict() for col, sketch in self.quantiles.items()},
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> DatasetSketch:
+        state = data["state"]
+        return cls(
+            precision=state["precision"],
+            k=state["k"],
+            rows=state["rows"],
+            row_distinct=HyperLogLog.from_dict(state["row_distinct"]),
+            distinct={col: HyperLogLog.from_dict(s) for col, s in state["distinct"].items()},
+            quantiles={col: KLLSketch.from_dict(s) for col, s in state["quantiles"].items()},
+        )
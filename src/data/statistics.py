@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+import attr
+import numpy as np
+import pandas as pd
+
+from src.core.data_handling.data_chunks import iter_frames
+from src.data.dedup import RowDeduplicator
+from utils.tracing import trace_span
+
+if TYPE_CHECKING:
+    from src.data.sketches import DatasetSketch
+
+# (n, mean, M2, M3, M4): count, mean and summed 2nd-4th central moments
+Moments = Tuple[float, float, float, float, float]
+EMPTY_MOMENTS: Moments = (0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+def merge_moments(a: Moments, b: Moments) -> Moments:
+    """Pairwise (Chan/Pebay) combination of two moment states."""
+    if a[0] == 0:
+        return b
+    if b[0] == 0:
+        return a
+    na, mean_a, m2a, m3a, m4a = a
+    nb, mean_b, m2b, m3b, m4b = b
+    n = na + nb
+    delta = mean_b - mean_a
+    mean = mean_a + delta * nb / n
+    m2 = m2a + m2b + delta ** 2 * na * nb / n
+    m3 = (
+        m3a + m3b
+        + delta ** 3 * na * nb * (na - nb) / n ** 2
+        + 3 * delta * (na * m2b - nb * m2a) / n
+    )
+    m4 = (
+        m4a + m4b
+        + delta ** 4 * na * nb * (na ** 2 - na * nb + nb ** 2) / n ** 3
+        + 6 * delta ** 2 * (na ** 2 * m2b + nb ** 2 * m2a) / n ** 2
+        + 4 * delta * (na * m3b - nb * m3a) / n
+    )
+    return (n, mean, m2, m3, m4)
+
+
+@attr.s
+class ColumnStats:
+    """
+    Mergeable summary of one column
+    Numeric columns carry min/max and moments; categorical columns (and any
+    requested frequency column) carry value frequencies. Derived statistics
+    follow the pandas estimators (sample std, bias-corrected skew and kurtosis).
+    """
+    name: str = attr.ib()
+    dtype: str = attr.ib()
+    numeric: bool = attr.ib(default=False)
+    count: int = attr.ib(default=0)
+    nulls: int = attr.ib(default=0)
+    minimum: float = attr.ib(default=np.nan)
+    maximum: float = attr.ib(default=np.nan)
+    moments: Moments = attr.ib(default=EMPTY_MOMENTS)
+    frequencies: Optional[Dict[Any, int]] = attr.ib(default=None)
+    # Frequencies dropped after exceeding DatasetStats.max_categories
+    capped: bool = attr.ib(default=False)
+
+    def merge(self, other: ColumnStats) -> ColumnStats:
+        self.count += other.count
+        self.nulls += other.nulls
+        self.minimum = np.fmin(self.minimum, other.minimum)
+        self.maximum = np.fmax(self.maximum, other.maximum)
+        self.moments = merge_moments(self.moments, other.moments)
+        self.capped = self.capped or other.capped
+        if self.capped:
+            self.frequencies = None
+        elif other.frequencies is not None:
+            frequencies = self.frequencies if self.frequencies is not None else {}
+            for value, n in other.frequencies.items():
+                frequencies[value] = frequencies.get(value, 0) + n
+            self.frequencies = frequencies
+        return self
+
+    @property
+    def mean(self) -> float:
+        return self.moments[1] if self.moments[0] else np.nan
+
+    @property
+    def std(self) -> float:
+        n, _, m2, _, _ = self.moments
+        return float(np.sqrt(m2 / (n - 1))) if n > 1 else np.nan
+
+    @property
+    def skewness(self) -> float:
+        n, _, m2, m3, _ = self.moments
+        if n < 3:
+            return np.nan
+        if m2 == 0:
+            return 0.0
+        return (n * (n - 1) ** 0.5 / (n - 2)) * (m3 / m2 ** 1.5)
+
+    @property
+    def kurtosis(self) -> float:
+        n, _, m2, _, m4 = self.moments
+        if n < 4:
+            return np.nan
+        if m2 == 0:
+            return 0.0
+        return (
+            n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2)
+            - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+        )
+
+    @property
+    def unique(self) -> Optional[int]:
+        return None if self.frequencies is None else len(self.frequencies)
+
+    def value_counts(self, normalize: bool = False) -> pd.Series:
+        counts = pd.Series(self.frequencies or {}, name=self.name, dtype="int64")
+        counts = counts.sort_values(ascending=False, kind="stable")
+        return counts / counts.sum() if normalize else counts
+
+
+@attr.s
+class DatasetStats:
+    """
+    Summary
+    ----------
+    Count, nulls, min/max, first four moments and categorical frequencies of
+    every column, computed in one vectorized pass per frame
+    Partial states from chunks or worker processes combine with `merge`, so
+    a dataset can be summarised piecewise and the result matches a single
+    pass over the whole frame.
+
+    Extended Summary
+    ----------
+    - Numeric columns are reduced together as one 2-D float block per frame
+    - Moments merge pairwise (Chan/Pebay); frequencies and counts add
+    - Duplicate rows are counted by a RowDeduplicator, whose hash sets merge
+      by union
+    - States are plain attrs objects and pickle across processes
+
+    Parameters
+    ----------
+    frequency_cols : Sequence[str]
+        Numeric columns that also need value frequencies (e.g. the target)
+    track_duplicates : bool
+        Whether to keep row hashes for the duplicate count
+    max_categories : int, optional
+        Drop the frequencies of a column once it has more distinct values,
+        bounding memory on high-cardinality columns
+    """
+    frequency_cols: Tuple[str, ...] = attr.ib(default=(), converter=tuple)
+    track_duplicates: bool = attr.ib(default=True)
+    max_categories: Optional[int] = attr.ib(default=None)
+    rows: int = attr.ib(default=0)
+    columns: Dict[str, ColumnStats] = attr.ib(factory=dict)
+    row_index: Optional[RowDeduplicator] = attr.ib(default=None, repr=False)
+
+    def __attrs_post_init__(self):
+        if self.track_duplicates and self.row_index is None:
+            self.row_index = RowDeduplicator()
+
+    @classmethod
+    def compute(
+        cls, dataset, frequency_cols: Sequence[str] = (), track_duplicates: bool = True,
+        max_categories: Optional[int] = None, sketch: Optional[DatasetSketch] = None,
+    ) -> DatasetStats:
+        """One pass over a DataFrame or a DataChunks stream, also feeding `sketch` if given."""
+        stats = cls(frequency_cols, track_duplicates, max_categories)
+        for df in iter_frames(dataset):
+            with trace_span("statistics_frame", cat="substep", rows=len(df)):
+                stats.merge(cls.from_frame(df, frequency_cols, track_duplicates))
+                if sketch is not None:
+                    sketch.update(df)
+        return stats
+
+    @classmethod
+    def merge_all(cls, parts: Iterable[DatasetStats]) -> DatasetStats:
+        """Combines partial states, e.g. one per worker, in order."""
+        merged = None
+        for part in parts:
+            merged = part if merged is None else merged.merge(part)
+        return merged if merged is not None else cls()
+
+    @classmethod
+    def from_frame(
+        cls, df: pd.DataFrame, frequency_cols: Sequence[str] = (), track_duplicates: bool = True
+    ) -> DatasetStats:
+        stats = cls(frequency_cols, track_duplicates, rows=len(df))
+        nulls = df.isna().sum()
+        numeric = list(df.select_dtypes(include=np.number).columns)
+        for col in df.columns:
+            stats.columns[col] = ColumnStats(
+                col, str(df[col].dtype), numeric=col in numeric,
+                count=len(df) - int(nulls[col]), nulls=int(nulls[col]),
+            )
+
+        if numeric:
+            for col, moments, low, high in zip(numeric, *cls.numeric_block(df[numeric])):
+                column = stats.columns[col]
+                column.moments, column.minimum, column.maximum = moments, low, high
+
+        for col in df.columns:
+            if not stats.columns[col].numeric or col in stats.frequency_cols:
+                counts = df[col].value_counts(dropna=True)
+                stats.columns[col].frequencies = dict(zip(counts.index.tolist(), counts.tolist()))
+
+        if track_duplicates:
+            stats.row_index.mark(df)
+        return stats
+
+    @staticmethod
+    def numeric_block(df: pd.DataFrame) -> Tuple[List[Moments], np.ndarray, np.ndarray]:
+        """Moments, minima and maxima of every numeric column in one set of 2-D reductions."""
+        x = df.to_numpy(dtype=float, na_value=np.nan)
+        present = ~np.isnan(x)
+        n = present.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(present, x, 0.0).sum(axis=0) / n
+            dev = np.where(present, x - mean, 0.0)
+            dev2 = dev * dev
+            m2 = dev2.sum(axis=0)
+            m3 = (dev2 * dev).sum(axis=0)
+            m4 = (dev2 * dev2).sum(axis=0)
+        low = np.where(present, x, np.inf).min(axis=0, initial=np.inf)
+        high = np.where(present, x, -np.inf).max(axis=0, initial=-np.inf)
+        low[n == 0], high[n == 0], mean[n == 0] = np.nan, np.nan, 0.0
+        moments = [
+            (float(n[j]), float(mean[j]), float(m2[j]), float(m3[j]), float(m4[j]))
+            for j in range(x.shape[1])
+        ]
+        return moments, low, high
+
+    def merge(self, other: DatasetStats) -> DatasetStats:
+        self.rows += other.rows
+        for col, column in other.columns.items():
+            if col in self.columns:
+                self.columns[col].merge(column)
+            else:
+                self.columns[col] = column
+            column = self.columns[col]
+            if self.max_categories is not None and len(column.frequencies or ()) > self.max_categories:
+                column.frequencies, column.capped = None, True
+        if self.track_duplicates:
+            self.row_index.merge(other.row_index)
+        return self
+
+    @property
+    def duplicates(self) -> Optional[int]:
+        return self.row_index.duplicates if self.track_duplicates else None
+
+    @property
+    def numeric_columns(self) -> List[str]:
+        return [col for col, c in self.columns.items() if c.numeric]
+
+    @property
+    def categorical_columns(self) -> List[str]:
+        return [col for col, c in self.columns.items() if not c.numeric]
+
+    def missing(self) -> pd.Series:
+        return pd.Series({col: c.nulls for col, c in self.columns.items()}, dtype="int64")
+
+    def missing_percentage(self) -> pd.Series:
+        return self.missing() / self.rows * 100
+
+    def unique_values(self) -> Optional[pd.Series]:
+        if not self.categorical_columns:
+            return None
+        return pd.Series(
+            {col: self.columns[col].unique for col in self.categorical_columns}, dtype="Int64"
+        )
+
+    def value_counts(self, normalize: bool = True) -> Optional[pd.DataFrame]:
+        if not self.categorical_columns:
+            return None
+        return pd.DataFrame({
+            col: self.columns[col].value_counts(normalize=normalize)
+            for col in self.categorical_columns if not self.columns[col].capped
+        })
+
+    def imbalance(self, col: str) -> pd.Series:
+        return self.columns[col].value_counts(normalize=True)
+
+    def skewness_kurtosis(self, decimals: int = 3) -> Dict[str, Tuple[float, float]]:
+        return {
+            col: (float(round(c.skewness, decimals)), float(round(c.kurtosis, decimals)))
+            for col, c in self.columns.items() if c.numeric
+        }
+
+    def info(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "Non-Null Count": [c.count for c in self.columns.values()],
+                "Null Count": [c.nulls for c in self.columns.values()],
+                "Unique": pd.array([c.unique for c in self.columns.values()], dtype="Int64"),
+                "Dtype": [c.dtype for c in self.columns.values()],
+            },
+            index=list(self.columns),
+        )
+
+    def describe(self) -> pd.DataFrame:
+        """Numeric summary in the layout of `DataFrame.describe`, plus skew and kurtosis."""
+        return pd.DataFrame(
+            {
+                col: {
+                    "count": c.count,
+                    "mean": c.mean,
+                    "std": c.std,
+                    "min": c.minimum,
+                    "max": c.maximum,
+                    "skew": c.skewness,
+                    "kurt": c.kurtosis,
+                }
+                for col, c in self.columns.items() if c.numeric
+            }
+        )
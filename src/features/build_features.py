@@ -4,7 +4,9 @@ import logging
 
 from config.pipeline_context import PipelineContext
 from config.settings import Config
+from src.core.data_handling.compact_dtypes import CompactDtypes
 from src.core.data_handling.data_module import DataModule
+from utils.tracing import trace_span
 
 
 class BuildFeatures:
@@ -29,7 +31,10 @@ class BuildFeatures:
         df = self.dataset
         for name, func in steps:
             logging.info(f"Building Feature: {name}")
-            df = func(df)
+            with trace_span(name, cat="substep"):
+                df = func(df)
+        with trace_span("compact_dtypes", cat="substep"):
+            df = CompactDtypes(self.ctx).apply(df, "build-features")
         return {'feature-eng': df}
 
     def interaction_features(self, df):
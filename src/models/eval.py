@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
 import numpy as np
-from imblearn.pipeline import Pipeline as ImbPipeline
-from sklearn.model_selection import cross_val_score
 
 from config.paths import Paths
 from config.pipeline_context import PipelineContext
@@ -14,6 +13,9 @@ from config.settings import Params
 from src.core.base_pipeline import BasePipeline
 from src.core.data_handling.data_module import DataModule
 
+if TYPE_CHECKING:
+    from imblearn.pipeline import Pipeline as ImbPipeline
+
 
 class EvaluateModel(BasePipeline):
     def __init__(
@@ -49,6 +51,7 @@ class EvaluateModel(BasePipeline):
 
     def cross_validate(self, X_train, y_train):
         """Performs cross-validation and logs results."""
+        from sklearn.model_selection import cross_val_score
         scores = cross_val_score(
             self.best_pipeline,
             X_train,
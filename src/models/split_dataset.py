@@ -4,13 +4,13 @@ import logging
 
 import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
 
 from config.paths import Paths
 from config.pipeline_context import PipelineContext
 from config.settings import Config
 from config.settings import HyperParams
 from config.settings import Params
+from src.core.data_handling.compact_dtypes import CompactDtypes
 from src.core.data_handling.data_module import DataModule
 
 
@@ -40,6 +40,8 @@ class DatasetSplitter:
         return to_save
 
     def split_dataset(self, df: pd.DataFrame):
+        from sklearn.model_selection import train_test_split
+        df = CompactDtypes(self.ctx).apply(df, "model-matrix")
         X = df.drop(columns=['target'])
         y = df['target']
 
@@ -1,14 +1,10 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
-from imblearn.pipeline import Pipeline as ImbPipeline
-from sklearn.metrics import f1_score
-from sklearn.metrics import make_scorer
-from sklearn.model_selection import RandomizedSearchCV
-from sklearn.model_selection import StratifiedKFold
 
 from config.pipeline_context import PipelineContext
 from config.settings import Config
@@ -16,6 +12,10 @@ from config.settings import HyperParams
 from src.core.base_pipeline import BasePipeline
 from src.core.data_handling.data_module import DataModule
 
+if TYPE_CHECKING:
+    from imblearn.pipeline import Pipeline as ImbPipeline
+    from sklearn.model_selection import StratifiedKFold
+
 
 class ModelTrainer(BasePipeline):
     """Handles training and model selection using hyperparameter tuning."""
@@ -57,6 +57,9 @@ class ModelTrainer(BasePipeline):
 
     def train_model(self, x_train: pd.DataFrame, y_train: np.ndarray):
         """Train model and remove feature selector at inference time."""
+        from sklearn.metrics import f1_score
+        from sklearn.metrics import make_scorer
+        from sklearn.model_selection import RandomizedSearchCV
         search = RandomizedSearchCV(
             estimator=self.pipeline_builder,
             param_distributions=self.hyperparams.param_dist,
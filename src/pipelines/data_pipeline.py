@@ -4,6 +4,7 @@ from config.pipeline_context import PipelineContext
 from src.core.base_pipeline import BasePipeline
 from src.core.step_handling.step_factory import StepFactory
 from src.core.step_handling.step_handler import StepHandler
+from src.data.dedup import DedupIndex
 
 
 class DataPipeline(BasePipeline):
@@ -17,7 +18,12 @@ class DataPipeline(BasePipeline):
         }
 
     def process(self):
-        step_defs = StepHandler.get_step_defs("processing", self.modules)
+        dedup_index = None
+        if self.ctx.settings.config.dedup_index:
+            dedup_index = DedupIndex(
+                self.ctx.paths.get_path("dedup-index"), self.modules['raw-data'].data_path
+            )
+        step_defs = StepHandler.get_step_defs("processing", self.modules, dedup_index=dedup_index)
         step_map = StepHandler.create_step_map(step_defs)
         step_order = [
             "processing",
@@ -25,20 +25,26 @@ class EDAPipeline(BasePipeline):
         self.modules = {
             'raw-data': self.dm_handler.get_dm('raw-data'),
             'transformed-data': self.dm_handler.get_dm('transformed-data'),
+            'raw-data-profile': self.dm_handler.get_dm('raw-data-profile'),
+            'transformed-data-profile': self.dm_handler.get_dm('transformed-data-profile'),
         }
 
     def initial_exploration(self):
-        step_defs = StepHandler.get_step_defs("exploration", self.modules, "raw-data")
+        step_defs = StepHandler.get_step_defs(
+            "exploration", self.modules, "raw-data", approximate=self.config.approximate_stats
+        )
         step_map = StepHandler.create_step_map(step_defs)
         step_order = ["collect-metadata", "perform-quality-checks", "generate-visuals"]
-        save_points = ["perform-quality-checks"]
+        save_points = ["collect-metadata", "perform-quality-checks"]
         factory = StepFactory(ctx=self.ctx, step_map=step_map)
         factory.run_pipeline(step_order, save_points)
 
     def further_exploration(self):
-        step_defs = StepHandler.get_step_defs("exploration", self.modules, "transformed-data")
+        step_defs = StepHandler.get_step_defs(
+            "exploration", self.modules, "transformed-data", approximate=self.config.approximate_stats
+        )
         step_map = StepHandler.create_step_map(step_defs)
         step_order = ["collect-metadata", "perform-quality-checks", "generate-visuals"]
-        save_points = ["perform-quality-checks"]
+        save_points = ["collect-metadata", "perform-quality-checks"]
         factory = StepFactory(ctx=self.ctx, step_map=step_map)
         factory.run_pipeline(step_order, save_points)
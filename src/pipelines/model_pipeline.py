@@ -1,11 +1,5 @@
 from __future__ import annotations
 
-from imblearn.pipeline import Pipeline as ImbPipeline
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.feature_selection import SelectFromModel
-from sklearn.model_selection import StratifiedKFold
-from sklearn.preprocessing import StandardScaler
-
 from config.pipeline_context import PipelineContext
 from src.core.base_pipeline import BasePipeline
 from src.core.step_handling.step_factory import StepFactory
@@ -26,6 +20,15 @@ class ModelPipeline(BasePipeline):
             'x-test-selected': self.dm_handler.get_dm('x-test-selected'),
             'y-test-pred': self.dm_handler.get_dm('y-test-pred')
         }
+
+    def build_pipeline(self):
+        """Model pipeline and CV splitter; sklearn and imblearn are only imported for training."""
+        from imblearn.pipeline import Pipeline as ImbPipeline
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.feature_selection import SelectFromModel
+        from sklearn.model_selection import StratifiedKFold
+        from sklearn.preprocessing import StandardScaler
+
         estimator = RandomForestClassifier(
             n_estimators=100,
             random_state=self.config.random_state
@@ -49,6 +52,7 @@ class ModelPipeline(BasePipeline):
         )
 
     def train(self):
+        self.build_pipeline()
         step_defs = StepHandler.get_step_defs("training", self.modules, self.pipeline_builder, self.skf)
         step_map = StepHandler.create_step_map(step_defs)
         step_order = ["split-dataset", "train-model"]
@@ -4,6 +4,7 @@ from src.core.data_handling.lazy_load import LazyLoad
 from src.core.step_handling.step_definition import StepDefinition
 from src.core.step_handling.step_registry import StepRegistry
 from src.data.checks import ValidationChecks
+from src.data.ingest import SchemaIngestor
 
 
 @StepRegistry.register(
@@ -13,13 +14,29 @@ from src.data.checks import ValidationChecks
     args={"dataset": "raw-data"},
     outputs=[],
 )
+@StepRegistry.register(
+    category="checks",
+    name="ingest-raw-data",
+    step_class=SchemaIngestor,
+    args={"dataset": "raw-source"},
+    outputs=["ingested-data", "quarantine", "ingestion-report"],
+)
 def get_validation_checks_steps(modules: dict) -> list[StepDefinition]:
     return [
+        StepDefinition(
+            name="ingest-raw-data",
+            step_class=SchemaIngestor,
+            args={
+                "dataset": LazyLoad(dm=modules.get("raw-source"), stream=True),
+            },
+            method_name="run",
+            outputs=["ingested-data", "quarantine", "ingestion-report"]
+        ),
         StepDefinition(
             name="perform-validation-checks",
             step_class=ValidationChecks,
             args={
-                "dataset": LazyLoad(dm=modules.get("raw-data")),
+                "dataset": LazyLoad(dm=modules.get("raw-data"), stream=True),
             },
             method_name="perform_data_checks"
         ),
@@ -43,7 +43,7 @@ def get_evaluation_steps(modules: dict) -> list[StepDefinition]:
                 "x_test": LazyLoad(dm=modules.get("x-test-selected")),
                 "y_train": LazyLoad(dm=modules.get("y-train")),
                 "y_test": LazyLoad(dm=modules.get("y-test")),
-                'model': LazyLoad(dm=modules.get("model")),
+                'model': LazyLoad(dm=modules.get("model"), mmap_mode="r"),
             },
             outputs=["y-test-pred"],
         ),
@@ -53,8 +53,8 @@ def get_evaluation_steps(modules: dict) -> list[StepDefinition]:
             args={
                 "x_test": LazyLoad(dm=modules.get("x-test-selected")),
                 "y_test": LazyLoad(dm=modules.get("y-test")),
-                "y_test_pred": LazyLoad(dm=modules.get("y-test-pred")),
-                "model": LazyLoad(dm=modules.get("model")),
+                "y_test_pred": LazyLoad(dm=modules.get("y-test-pred"), mmap_mode="r"),
+                "model": LazyLoad(dm=modules.get("model"), mmap_mode="r"),
                 "path_key": "evaluation"
             },
         ),
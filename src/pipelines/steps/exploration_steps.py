@@ -19,7 +19,7 @@ from src.plots.visuals import ExploratoryVisuals
     category="exploration",
     name="perform-quality-checks",
     step_class=DataQualityChecks,
-    args={"dataset": "raw-data", "path_key": "Optional[raw-data, transformed-data]"},
+    args={"profile": "raw-data-profile", "path_key": "Optional[raw-data, transformed-data]"},
     outputs=["raw-data-skew-kurt"],
 )
 @StepRegistry.register(
@@ -27,26 +27,33 @@ from src.plots.visuals import ExploratoryVisuals
     name="collect-metadata",
     step_class=CollectMetadata,
     args={"dataset": "raw-data", "path_key": "Optional[raw-data, transformed-data]"},
-    outputs=[],
+    outputs=["raw-data-profile", "Optional[raw-data-sketches]"],
 )
-def get_exploration_steps(modules: dict, path_key: str) -> list[StepDefinition]:
+def get_exploration_steps(modules: dict, path_key: str, approximate: bool = False) -> list[StepDefinition]:
+    """With `approximate`, the profile streams in bounded memory and sketches are saved with it."""
+    profile_outputs = [f"{path_key}-profile"]
+    if approximate:
+        profile_outputs.append(f"{path_key}-sketches")
     return [
         StepDefinition(
             name="collect-metadata",
             step_class=CollectMetadata,
             args={
-                "dataset": LazyLoad(dm=modules.get(path_key)),
+                "dataset": LazyLoad(dm=modules.get(path_key), stream=approximate),
                 "path_key": path_key
             },
+            outputs=profile_outputs,
+            executor="process",
         ),
         StepDefinition(
             name="perform-quality-checks",
             step_class=DataQualityChecks,
             args={
-                "dataset": LazyLoad(dm=modules.get(path_key)),
+                "profile": LazyLoad(dm=modules.get(f"{path_key}-profile")),
                 "path_key": path_key
             },
-            outputs=f"{path_key}-skew-kurt"
+            outputs=[f"{path_key}-skew-kurt"],
+            executor="process",
         ),
         StepDefinition(
             name="generate-visuals",
@@ -55,5 +62,6 @@ def get_exploration_steps(modules: dict, path_key: str) -> list[StepDefinition]:
                 "dataset": LazyLoad(dm=modules.get(path_key)),
                 "path_key": path_key
             },
+            executor="process",
         ),
     ]
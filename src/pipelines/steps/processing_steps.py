@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from typing import Optional
+
 from src.core.data_handling.lazy_load import LazyLoad
 from src.core.step_handling.step_definition import StepDefinition
 from src.core.step_handling.step_registry import StepRegistry
+from src.data.dedup import DedupIndex
 from src.data.dist_transform import DistributionTransformer
 from src.data.process import DataPreprocessor
 from src.features.build_features import BuildFeatures
@@ -29,13 +32,15 @@ from src.features.build_features import BuildFeatures
     args={"dataset": "raw-data"},
     outputs=["processed-data"],
 )
-def get_processing_steps(modules: dict) -> list[StepDefinition]:
+def get_processing_steps(modules: dict, dedup_index: Optional[DedupIndex] = None) -> list[StepDefinition]:
+    """`dedup_index` drops rows seen in earlier runs over other source files."""
     return [
         StepDefinition(
             name="processing",
             step_class=DataPreprocessor,
             args={
-                "dataset": LazyLoad(dm=modules.get("raw-data")),
+                "dataset": LazyLoad(dm=modules.get("raw-data"), stream=True),
+                "dedup_index": dedup_index,
             },
             outputs=["processed-data"]
         ),
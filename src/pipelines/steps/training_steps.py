@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from imblearn.pipeline import Pipeline as ImbPipeline
-from sklearn.model_selection import StratifiedKFold
+from typing import TYPE_CHECKING
 
 from src.core.data_handling.lazy_load import LazyLoad
 from src.core.step_handling.step_definition import StepDefinition
@@ -9,6 +8,10 @@ from src.core.step_handling.step_registry import StepRegistry
 from src.models.split_dataset import DatasetSplitter
 from src.models.trainer import ModelTrainer
 
+if TYPE_CHECKING:
+    from imblearn.pipeline import Pipeline as ImbPipeline
+    from sklearn.model_selection import StratifiedKFold
+
 
 @StepRegistry.register(
     category="training",
@@ -19,8 +22,8 @@ from src.models.trainer import ModelTrainer
         "x_test": "x-test",
         "y_train": "y-train",
         "y_test": "y-test",
-        "pipeline_builder": ImbPipeline.__name__,
-        "skf": StratifiedKFold.__name__
+        "pipeline_builder": "Pipeline",
+        "skf": "StratifiedKFold"
     },
     outputs=["selected-features", "x-train-selected", "x-test-selected", "model"],
 )
@@ -18,12 +18,17 @@ class ValidationPipeline(BasePipeline):
     2. Retrieves validation step definitions via StepHandler
     3. Executes validation checks via StepFactory
     4. Outputs invalid records to name-errors path
+
+    With ``Config.schema_ingestion``, the raw file is first ingested row by row:
+    clean rows go to `ingested-data`, which later stages read in place of
+    `raw-data`, and failing rows to the `quarantine` artifact.
     """
 
     def __init__(self, ctx: PipelineContext):
         super().__init__(ctx)
         self.modules = {
             'raw-data': self.dm_handler.get_dm('raw-data'),
+            'raw-source': self.dm_handler.get_dm('raw-source'),
         }
 
     def validate_names(self):
@@ -31,5 +36,8 @@ class ValidationPipeline(BasePipeline):
         step_map = StepHandler.create_step_map(step_defs)
         step_order = ["perform-validation-checks"]
         save_points = []
+        if self.config.schema_ingestion:
+            step_order.insert(0, "ingest-raw-data")
+            save_points.append("ingest-raw-data")
         factory = StepFactory(ctx=self.ctx, step_map=step_map)
         factory.run_pipeline(step_order, save_points)
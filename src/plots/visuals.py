@@ -1,25 +1,30 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from pprint import pformat
+from typing import TYPE_CHECKING
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
-from imblearn.pipeline import Pipeline as ImbPipeline
-from sklearn.metrics import auc
-from sklearn.metrics import classification_report
-from sklearn.metrics import confusion_matrix
-from sklearn.metrics import precision_recall_curve
-from sklearn.metrics import roc_curve
 
 from config.pipeline_context import PipelineContext
 from config.settings import Config
 from src.core.base_pipeline import BasePipeline
 from src.core.data_handling.data_module import DataModule
+
+if TYPE_CHECKING:
+    from imblearn.pipeline import Pipeline as ImbPipeline
 # from ydata_profiling import ProfileReport
-sns.set_style("darkgrid")
+
+
+@lru_cache(maxsize=None)
+def plotting():
+    """pyplot and seaborn, imported and styled on the first plot rather than at import."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    sns.set_style("darkgrid")
+    return plt, sns
 
 
 class ExploratoryVisuals:
@@ -46,6 +51,7 @@ class ExploratoryVisuals:
         [self.generate_corr_plot(method) for method in ["pearson", "spearman"]]
 
     def generate_target_barplot(self):
+        plt, sns = plotting()
         plt.figure(figsize=(8, 6))
         sns.countplot(
             x='target',
@@ -62,6 +68,7 @@ class ExploratoryVisuals:
         plt.close()
 
     def generate_pair_plot(self, name, cols):
+        plt, sns = plotting()
         sns.pairplot(
             self.dataset[cols], diag_kind='kde',
             plot_kws={'alpha': 0.8, 's': 2, 'edgecolor': 'k'}
@@ -74,6 +81,7 @@ class ExploratoryVisuals:
 
     def plot_box_by_target(self, name, cols):
         """Generates box plots for each numerical feature grouped by the target column."""
+        plt, sns = plotting()
         cols = cols + [self.config.target_col]
         num_features = len(cols)
         fig, axes = plt.subplots(nrows=num_features, figsize=(8, 5 * num_features))
@@ -103,6 +111,7 @@ class ExploratoryVisuals:
         plt.close()
 
     def generate_corr_plot(self, method="pearson", threshold=0.1):
+        plt, sns = plotting()
         df = self.dataset.select_dtypes(include=np.number)
         correlation_matrix = df.corr(method=method)
         target_col = self.config.target_col
@@ -161,6 +170,8 @@ class EvaluationVisuals(BasePipeline):
     def plot_confusion_matrix(self, y_test, y_test_pred):
         """Generates a Confusion Matrix for the model.
         IE. how many of the positive cases are we able to predict?"""
+        from sklearn.metrics import confusion_matrix
+        plt, sns = plotting()
         cm = confusion_matrix(y_test, y_test_pred)
         plt.figure(figsize=(8, 6))
         sns.heatmap(cm, annot=True, fmt='d', cmap='Blues',
@@ -180,6 +191,9 @@ class EvaluationVisuals(BasePipeline):
         The ROC curve plots the true positive rate (TPR) against the false positive rate (FPR).
         IE. if we are trying to predict a positive case, how many of the positive cases are we able to predict?
         """
+        from sklearn.metrics import auc
+        from sklearn.metrics import roc_curve
+        plt, _ = plotting()
         fpr, tpr, _ = roc_curve(y_test, model.predict_proba(X_test_fs)[:, 1])
         roc_auc = auc(fpr, tpr)
         plt.figure(figsize=(8, 6))
@@ -209,6 +223,7 @@ class EvaluationVisuals(BasePipeline):
             Shows the distribution of the cross-validation F1 scores.
             IE. How consistent is our model?
         """
+        plt, _ = plotting()
         plt.figure(figsize=(8, 6))
         plt.boxplot([0.49, 0.53, 0.56, 0.52, 0.57])
         plt.title('Distribution of Cross-validation F1 Scores')
@@ -225,6 +240,8 @@ class EvaluationVisuals(BasePipeline):
             Shows the trade-off between precision and recall.
             IE. if we are trying to predict a positive case, how many of the positive cases are we able to predict?
         """
+        from sklearn.metrics import precision_recall_curve
+        plt, _ = plotting()
         precision, recall, _ = precision_recall_curve(
             y_test,
             model.predict_proba(X_test_fs)[:, 1]
@@ -242,6 +259,7 @@ class EvaluationVisuals(BasePipeline):
         plt.close()
 
     def generate_classification_report(self, y_test, y_test_pred):
+        from sklearn.metrics import classification_report
         file_path = f"reports/analysis/{self.path_key}-classification-report.xlsx"
         report = classification_report(y_test, y_test_pred, output_dict=True)
         report_df = pd.DataFrame(report).transpose()
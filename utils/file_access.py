@@ -2,12 +2,18 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import uuid
 from pathlib import Path
+from typing import List
+from typing import Optional
 
 import joblib
 import numpy as np
 import pandas as pd
 
+from utils.tracing import trace_span
+
 
 class FileAccess:
     """Automatic file loading and saving."""
@@ -16,51 +22,135 @@ class FileAccess:
         return path.suffix
 
     @staticmethod
-    def load_file(path: Path):
+    def load_file(
+        path: Path,
+        columns: Optional[List[str]] = None,
+        mmap_mode: Optional[str] = None,
+        **reader_kwargs
+    ):
+        """
+        Loads a file by suffix. `columns` projects tabular formats on read.
+        `mmap_mode` memory-maps .npy arrays and the arrays inside .joblib
+        artifacts instead of reading them into private memory.
+        `reader_kwargs` are forwarded to the csv parser.
+        """
         path = Path(path)
         suffix = path.suffix
         logging.getLogger("file_access").file_track(f"Loading Input File: ``{path}``")
-        if suffix == ".parquet":
-            return pd.read_parquet(path)
-        elif suffix == ".csv":
-            return pd.read_csv(path)
-        elif suffix == ".xlsx":
-            return pd.read_excel(path)
-        elif suffix == ".npy":
-            return np.load(path)
-        elif suffix == ".joblib":
-            return joblib.load(path)
-        elif suffix == ".json":
-            return pd.read_json(path, orient="index")
-        elif suffix == ".pdf":
-            pass
+        with trace_span("FileAccess.load_file", cat="io", path=path):
+            if suffix == ".parquet":
+                return pd.read_parquet(path, columns=columns)
+            elif suffix == ".feather":
+                return pd.read_feather(path, columns=columns)
+            elif suffix == ".csv":
+                if columns is not None:
+                    reader_kwargs["usecols"] = columns
+                return pd.read_csv(path, **reader_kwargs)
+            elif suffix == ".xlsx":
+                return pd.read_excel(path)
+            elif suffix == ".npy":
+                return np.load(path, mmap_mode=mmap_mode)
+            elif suffix == ".joblib":
+                return joblib.load(path, mmap_mode=mmap_mode)
+            elif suffix == ".json":
+                return pd.read_json(path, orient="index")
+            elif suffix == ".pdf":
+                pass
+            else:
+                raise ValueError(f"Unknown file type: {suffix}")
+
+    @staticmethod
+    def iter_file(path: Path, chunk_size: int, columns: Optional[List[str]] = None, **reader_kwargs):
+        """Yields bounded row chunks of a tabular file."""
+        path = Path(path)
+        suffix = path.suffix
+        logging.getLogger("file_access").file_track(
+            f"Streaming Input File: ``{path}`` in chunks of {chunk_size} rows")
+        if suffix == ".csv":
+            if columns is not None:
+                reader_kwargs["usecols"] = columns
+            with pd.read_csv(path, chunksize=chunk_size, **reader_kwargs) as reader:
+                yield from FileAccess._traced_chunks(reader, path)
+        elif suffix == ".parquet":
+            import pyarrow.parquet as pq
+            parquet_file = pq.ParquetFile(path)
+            batches = parquet_file.iter_batches(batch_size=chunk_size, columns=columns)
+            for batch in FileAccess._traced_chunks(batches, path):
+                yield batch.to_pandas()
         else:
-            raise ValueError(f"Unknown file type: {suffix}")
+            raise ValueError(f"Streaming not supported for file type: {suffix}")
+
+    @staticmethod
+    def _traced_chunks(chunks, path: Path):
+        """Spans each chunk read, excluding the time the consumer spends on it."""
+        iterator = iter(chunks)
+        while True:
+            with trace_span("FileAccess.read_chunk", cat="io", path=path):
+                chunk = next(iterator, None)
+            if chunk is None:
+                return
+            yield chunk
 
     @staticmethod
     def save_file(df: pd.DataFrame, path: Path, index=False):
         suffix = path.suffix
         logging.getLogger("file_access").file_track(f"Saving Output File: ``{path}``")
-        if suffix == ".parquet":
-            return df.to_parquet(path, index=index)
-        elif suffix == ".csv":
-            return df.to_csv(path, index=index)
-        elif suffix == ".xlsx":
-            return df.to_excel(path, index=index)
-        elif suffix == ".npy":
-            return np.save(path, df)
-        elif suffix == ".joblib":
-            return joblib.dump(df, path)
-        elif suffix == ".json":
-            if isinstance(df, pd.DataFrame):
-                return df.to_json(path, orient="records", indent=4)
-            elif isinstance(df, dict):
-                return FileAccess.save_json(df, path)
-        elif suffix == ".txt":
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(df)
-        else:
-            raise ValueError(f"Unknown file type: {path} {suffix}")
+        with trace_span("FileAccess.save_file", cat="io", path=path):
+            if suffix in (".parquet", ".feather"):
+                return FileAccess.save_columnar(df, path, index=index)
+            elif suffix == ".csv":
+                return df.to_csv(path, index=index)
+            elif suffix == ".xlsx":
+                return df.to_excel(path, index=index)
+            elif suffix == ".npy":
+                # C-contiguous so the saved array can be mapped back as-is
+                return np.save(path, np.ascontiguousarray(df))
+            elif suffix == ".joblib":
+                # Uncompressed: joblib can only memory-map arrays stored raw
+                return joblib.dump(df, path, compress=0)
+            elif suffix == ".json":
+                if isinstance(df, pd.DataFrame):
+                    return df.to_json(path, orient="records", indent=4)
+                elif isinstance(df, dict):
+                    return FileAccess.save_json(df, path)
+            elif suffix == ".txt":
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write(df)
+            else:
+                raise ValueError(f"Unknown file type: {path} {suffix}")
+
+    @staticmethod
+    def save_file_atomic(df: pd.DataFrame, path: Path, index=False) -> int:
+        """
+        Saves via a temporary sibling file and renames it into place, so readers
+        never observe a partially written artifact. Returns the bytes written.
+        Appending formats (.txt) are written in place.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".txt":
+            FileAccess.save_file(df, path, index=index)
+            return path.stat().st_size
+        tmp_path = path.with_name(f".{path.stem}.{uuid.uuid4().hex[:8]}.tmp{path.suffix}")
+        try:
+            FileAccess.save_file(df, tmp_path, index=index)
+            n_bytes = tmp_path.stat().st_size
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        return n_bytes
+
+    @staticmethod
+    def save_columnar(df, path: Path, index=False):
+        """Writes Parquet/Feather, keeping dtypes such as ``Int64`` and category."""
+        if isinstance(df, pd.Series):
+            df = df.to_frame()
+        if path.suffix == ".feather":
+            # Feather only stores a default RangeIndex
+            df = df.reset_index() if index else df.reset_index(drop=True)
+            return df.to_feather(path)
+        return df.to_parquet(path, index=index)
 
     @staticmethod
     def load_json(path):
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+# Imported at first use only; importing any of these from `main` is a regression
+LAZY_PACKAGES = (
+    "imblearn",
+    "lightgbm",
+    "matplotlib",
+    "scipy",
+    "seaborn",
+    "sklearn",
+    "xgboost",
+    "ydata_profiling",
+)
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure(module: str, project_dir: Path) -> Tuple[int, Dict[str, int], List[str]]:
+    """
+    Imports `module` in a fresh interpreter under ``-X importtime``.
+    Returns its cumulative import time (us), the cumulative time of each
+    top-level dependency and every module imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"`import {module}` failed:\n{result.stderr[-2000:]}")
+    total, top_level, imported = 0, {}, []
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        cumulative, depth, name = int(match.group(2)), len(match.group(3)) // 2, match.group(4)
+        imported.append(name)
+        if name == module:
+            total = cumulative
+        elif depth == 1:
+            top_level[name] = top_level.get(name, 0) + cumulative
+    return total, top_level, imported
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Cold-start import time of the pipeline entry point.")
+    parser.add_argument("--module", default="main", help="Module to import")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters to time; the fastest is kept")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if the import takes longer")
+    parser.add_argument("--top", type=int, default=15, help="Slowest direct dependencies to list")
+    args = parser.parse_args(argv)
+
+    project_dir = Path(__file__).resolve().parents[1]
+    runs = [measure(args.module, project_dir) for _ in range(args.repeat)]
+    total, top_level, imported = min(runs, key=lambda run: run[0])
+
+    print(f"import {args.module}: {total / 1000:.0f} ms (best of {args.repeat})")
+    for name, cumulative in sorted(top_level.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    failures = []
+    eager = sorted({name.split(".")[0] for name in imported} & set(LAZY_PACKAGES))
+    if eager:
+        failures.append(f"heavy packages imported eagerly: {', '.join(eager)}")
+    if args.budget_ms is not None and total / 1000 > args.budget_ms:
+        failures.append(f"{total / 1000:.0f} ms exceeds the {args.budget_ms:.0f} ms budget")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return int(bool(failures))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,11 +5,15 @@ import time
 from functools import wraps
 from pathlib import Path
 from pprint import pformat
+from typing import Any
 from typing import Callable
 from typing import List
 from typing import Optional
 from typing import Union
 
+from utils.run_metrics import RunMetrics
+from utils.tracing import trace_span
+
 
 def log_cls_methods(cls):
     for name, method in cls.__dict__.items():
@@ -24,7 +28,18 @@ def log_step(
     view: bool = False,
     input: bool = False,
     output: bool = False,
+    step: Optional[str] = None,
+    input_data: Any = None,
+    outputs: Optional[List[Path]] = None,
+    label: Optional[str] = None,
 ):
+    """
+    Logs the start, completion and duration of a call, and appends a resource
+    record (wall, CPU, peak RSS, traced allocations, input/output sizes) to the
+    run metrics file. `step` names a dispatched pipeline step, `input_data`
+    holds its resolved inputs for sizing and `outputs` its checkpoint paths.
+    `label` qualifies the step by stage and dataset in the run history.
+    """
     def decorator(func: Callable):
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -45,9 +60,13 @@ def log_step(
             else:
                 logging.info(f"STARTING {locate} INITIATING")
             start_time = time.time()
+            frame = RunMetrics.start()
+            status, result = "error", None
 
             try:
-                result = func(*args, **kwargs)
+                with trace_span(locate.strip("`"), cat="step" if step else "pipeline"):
+                    result = func(*args, **kwargs)
+                status = "ok"
 
                 log_details = {
                     "Load path": load_path if load_path or view or input else None,
@@ -71,7 +90,13 @@ def log_step(
                 raise
             finally:
                 duration = time.time() - start_time
-                logging.debug(f"{locate} took {duration:.2f} seconds to execute")
+                record = RunMetrics.finish(
+                    frame, locate.strip("`"), step, input_data, result, status, outputs, label
+                )
+                logging.debug(
+                    f"{locate} took {duration:.2f} seconds to execute "
+                    f"(CPU {record['cpu_s']:.2f}s, peak RSS +{record['max_rss_delta_mb']:.1f} MB)"
+                )
 
         return wrapper
 
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import sys
+from typing import Any
+from typing import Optional
+
+import numpy as np
+
+
+def approx_nbytes(obj: Any) -> int:
+    """
+    Approximate in-memory size of pipeline objects
+    DataFrame/Series use `memory_usage(deep=True)`, arrays their `nbytes`,
+    containers the sum of their items; anything else falls back to `sys.getsizeof`.
+    Memory-mapped arrays are file-backed shared pages and count as 0.
+    """
+    if isinstance(obj, np.memmap):
+        return 0
+    if hasattr(obj, "memory_usage"):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    if hasattr(obj, "nbytes"):
+        return int(obj.nbytes)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(approx_nbytes(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(approx_nbytes(v) for v in obj)
+    return sys.getsizeof(obj)
+
+
+def row_count(obj: Any) -> Optional[int]:
+    """
+    Rows held by pipeline objects
+    Frames, Series and arrays count their first axis, containers the sum of
+    their items; None where nothing has rows (streams, models, scalars).
+    """
+    if isinstance(obj, (dict, list, tuple)):
+        counts = [row_count(v) for v in (obj.values() if isinstance(obj, dict) else obj)]
+        counts = [c for c in counts if c is not None]
+        return sum(counts) if counts else None
+    if hasattr(obj, "shape") and getattr(obj, "ndim", 0) >= 1:
+        return int(obj.shape[0])
+    return None
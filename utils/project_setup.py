@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import warnings
 from pathlib import Path
+from typing import Optional
 from typing import Tuple
 
 import dotenv
 import yaml
 
 from config.pipeline_context import PipelineContext
+from config.settings import Settings
 from utils.logging_config import setup_logging
+from utils.run_metrics import RunMetrics
+from utils.tracing import Tracer
 warnings.filterwarnings("ignore")
 
 
@@ -22,10 +26,12 @@ def initialise_project_configs(
     config_filename: str = "config/logging.yaml",
     env_filename: str = ".env",
     log_filename: str = None,
+    overrides: Optional[dict] = None,
 ) -> Tuple[Path, dict, PipelineContext]:
     """
     Initialize the project environment, load configuration,
     set up logging, and create PipelineContext.
+    `overrides` replaces Settings fields, e.g. {"config.chunk_size": 50000}.
     """
     project_dir = Path(__file__).resolve().parents[1]
 
@@ -41,4 +47,7 @@ def initialise_project_configs(
     setup_logging("MainPipeline", project_dir, log_filename, project_config)
 
     # Initialize Pipeline Context
-    return PipelineContext()
+    ctx = PipelineContext(settings=Settings().with_overrides(overrides or {}))
+    RunMetrics.configure(ctx.paths.get_path("run-metrics"))
+    Tracer.configure(ctx.paths.get_path("trace"), ctx.paths.get_path("profile"))
+    return ctx
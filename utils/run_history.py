@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+import statistics
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+import attr
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started_at REAL,
+    finished_at REAL,
+    status TEXT,
+    settings_fingerprint TEXT,
+    selection TEXT
+);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id TEXT REFERENCES runs(run_id),
+    label TEXT,
+    name TEXT,
+    step TEXT,
+    pid INTEGER,
+    status TEXT,
+    wall_s REAL,
+    cpu_s REAL,
+    max_rss_mb REAL,
+    max_rss_delta_mb REAL,
+    traced_peak_mb REAL,
+    input_mb REAL,
+    output_mb REAL,
+    input_rows INTEGER,
+    output_rows INTEGER,
+    artifact_bytes INTEGER
+);
+CREATE INDEX IF NOT EXISTS steps_label ON steps (label, run_id);
+"""
+
+STEP_COLUMNS = (
+    "name", "step", "pid", "status", "wall_s", "cpu_s", "max_rss_mb", "max_rss_delta_mb",
+    "traced_peak_mb", "input_mb", "output_mb", "input_rows", "output_rows",
+)
+
+
+@attr.s
+class StepComparison:
+    """A step of the latest run against its baseline median"""
+    label: str = attr.ib()
+    wall_s: float = attr.ib()
+    baseline_wall_s: Optional[float] = attr.ib()
+    memory_mb: Optional[float] = attr.ib()
+    baseline_memory_mb: Optional[float] = attr.ib()
+    rows: Optional[int] = attr.ib()
+    baseline_rows: Optional[float] = attr.ib()
+    baseline_runs: int = attr.ib()
+    regressions: List[str] = attr.ib(factory=list)
+
+
+class RunHistory:
+    """
+    Summary
+    ----------
+    Local SQLite history of pipeline runs and their per-step metrics
+    Each run's RunMetrics records are stored with the settings fingerprint,
+    row counts and the on-disk size of the checkpoints each step wrote.
+
+    Extended Summary
+    ----------
+    - Steps are keyed by stage, step name and dataset (e.g.
+      ``initial-eda:collect-metadata[raw-data]``), pipeline stages by the
+      logged method (e.g. ``data_pipeline.DataPipeline.process``)
+    - `compare` measures the latest run against the median of the previous
+      `window` successful runs containing each step
+    - Memory is the traced allocation peak when both sides recorded one
+      (``PIPELINE_TRACEMALLOC=1``), otherwise the growth of peak RSS
+    - Changes below `min_wall_s` / `min_memory_mb` are not flagged, so
+      millisecond steps do not trip the relative threshold on noise
+
+    Parameters
+    ----------
+    path : Path
+        SQLite database file, created on first use
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def record(
+        self,
+        run_id: str,
+        records: Iterable[Dict[str, Any]],
+        settings_fingerprint: str,
+        status: str,
+        selection: Optional[str] = None,
+    ) -> int:
+        """Stores a run and its step records; returns the number of steps stored."""
+        rows, started_at = [], time.time()
+        for record in records:
+            started_at = min(started_at, record["ts"] - record["wall_s"])
+            rows.append((
+                run_id,
+                record.get("label") or record["step"] or record["name"],
+                *(record.get(column) for column in STEP_COLUMNS),
+                self._artifact_bytes(record.get("outputs")),
+            ))
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?)",
+                (run_id, started_at, time.time(), status, settings_fingerprint, selection),
+            )
+            conn.execute("DELETE FROM steps WHERE run_id = ?", (run_id,))
+            conn.executemany(
+                f"INSERT INTO steps VALUES ({', '.join('?' * (len(STEP_COLUMNS) + 3))})", rows
+            )
+        logging.debug(f"Recorded run `{run_id}` ({len(rows)} steps) in ``{self.path}``")
+        return len(rows)
+
+    def latest_run(self) -> Optional[Dict[str, Any]]:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM runs ORDER BY finished_at DESC LIMIT 1").fetchone()
+        return dict(row) if row else None
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return dict(row) if row else None
+
+    def compare(
+        self,
+        run_id: Optional[str] = None,
+        window: int = 5,
+        threshold: float = 0.25,
+        min_wall_s: float = 0.5,
+        min_memory_mb: float = 16.0,
+    ) -> List[StepComparison]:
+        """
+        Compares each step of a run (default the latest) with its rolling baseline.
+        A step regresses when its time or memory exceeds the baseline median by
+        more than `threshold` (relative) and the floor (absolute).
+        """
+        run = self.get_run(run_id) if run_id else self.latest_run()
+        if run is None:
+            raise ValueError(f"No run `{run_id}` in ``{self.path}``" if run_id else "Run history is empty.")
+        with closing(self._connect()) as conn:
+            latest = conn.execute(
+                "SELECT * FROM steps WHERE run_id = ? AND status = 'ok' ORDER BY rowid", (run["run_id"],)
+            ).fetchall()
+            comparisons = []
+            for step in latest:
+                # The window counts runs, not rows: a run may record a label more than once
+                baseline = conn.execute(
+                    """
+                    WITH recent AS (
+                        SELECT DISTINCT run_id, runs.finished_at FROM steps JOIN runs USING (run_id)
+                        WHERE steps.label = ? AND steps.status = 'ok' AND runs.status = 'ok'
+                          AND runs.finished_at < ?
+                        ORDER BY runs.finished_at DESC LIMIT ?
+                    )
+                    SELECT steps.* FROM steps JOIN recent USING (run_id)
+                    WHERE steps.label = ? AND steps.status = 'ok'
+                    """,
+                    (step["label"], run["finished_at"], window, step["label"]),
+                ).fetchall()
+                comparisons.append(self._compare_step(step, baseline, threshold, min_wall_s, min_memory_mb))
+        return comparisons
+
+    def format_report(self, comparisons: List[StepComparison], run_id: str) -> str:
+        """Plain-text table of a comparison, regressions marked and summarised last."""
+        header = f"{'step':<48} {'wall s':>9} {'base s':>9} {'mem MB':>9} {'base MB':>9} {'rows':>10} {'base rows':>10}  flags"
+        lines = [f"Run `{run_id}` against its rolling baseline", header, "-" * len(header)]
+        for c in comparisons:
+            lines.append(
+                f"{c.label[:48]:<48} {self._fmt(c.wall_s):>9} {self._fmt(c.baseline_wall_s):>9} "
+                f"{self._fmt(c.memory_mb):>9} {self._fmt(c.baseline_memory_mb):>9} "
+                f"{self._fmt(c.rows, 0):>10} {self._fmt(c.baseline_rows, 0):>10}  "
+                f"{', '.join(c.regressions) if c.regressions else ('no baseline' if not c.baseline_runs else '')}"
+            )
+        regressed = [c.label for c in comparisons if c.regressions]
+        lines.append(f"\n{len(regressed)} regressed step(s){': ' + ', '.join(regressed) if regressed else ''}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _compare_step(
+        step: sqlite3.Row,
+        baseline: List[sqlite3.Row],
+        threshold: float,
+        min_wall_s: float,
+        min_memory_mb: float,
+    ) -> StepComparison:
+        traced = step["traced_peak_mb"] is not None and all(b["traced_peak_mb"] is not None for b in baseline)
+        memory_field = "traced_peak_mb" if traced else "max_rss_delta_mb"
+
+        def median(field: str) -> Optional[float]:
+            values = [b[field] for b in baseline if b[field] is not None]
+            return statistics.median(values) if values else None
+
+        comparison = StepComparison(
+            label=step["label"],
+            wall_s=step["wall_s"],
+            baseline_wall_s=median("wall_s"),
+            memory_mb=step[memory_field],
+            baseline_memory_mb=median(memory_field),
+            rows=step["input_rows"],
+            baseline_rows=median("input_rows"),
+            baseline_runs=len({b["run_id"] for b in baseline}),
+        )
+        checks = (
+            ("time", comparison.wall_s, comparison.baseline_wall_s, min_wall_s),
+            ("memory", comparison.memory_mb, comparison.baseline_memory_mb, min_memory_mb),
+        )
+        for metric, value, base, floor in checks:
+            if value is None or base is None:
+                continue
+            if value - base > max(floor, threshold * base):
+                comparison.regressions.append(f"{metric} +{(value - base) / base:.0%}" if base else f"{metric} up")
+        return comparison
+
+    @staticmethod
+    def _artifact_bytes(outputs: Optional[List[str]]) -> Optional[int]:
+        if not outputs:
+            return None
+        paths = [Path(p) for p in outputs]
+        return sum(p.stat().st_size for p in paths if p.is_file())
+
+    @staticmethod
+    def _fmt(value: Optional[float], digits: int = 2) -> str:
+        return "-" if value is None else f"{value:,.{digits}f}"
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from utils.memory_utils import approx_nbytes
+from utils.memory_utils import row_count
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class RunMetrics:
+    """
+    Summary
+    ----------
+    Structured per-step resource records, one JSON line per instrumented call
+    Configured once per process by the project setup; records are appended to
+    the run metrics file and tagged with a run id shared by worker processes.
+
+    Extended Summary
+    ----------
+    - Wall and process CPU seconds
+    - Peak RSS of the process at exit and its growth during the call
+    - Peak traced allocations when ``PIPELINE_TRACEMALLOC=1`` (adds overhead).
+      Peaks of nested calls are folded into their callers
+    - Approximate input/output object sizes and row counts
+    - Checkpoint paths a step writes, sized by the run history once persisted
+
+    CPU time, RSS and traced allocations are process-wide, so steps running
+    concurrently in threads share them.
+    """
+    path: Optional[Path] = None
+    run_id: Optional[str] = None
+    trace_allocations: bool = False
+    offset: int = 0
+    # Called with each record emitted in this process, e.g. to stream step status
+    listeners: List[Callable[[Dict[str, Any]], None]] = []
+    _lock = threading.Lock()
+    _frames = threading.local()
+
+    @classmethod
+    def configure(cls, path: Path):
+        cls.path = Path(path)
+        cls.path.parent.mkdir(parents=True, exist_ok=True)
+        # Records of this run start here; earlier runs need not be re-read
+        cls.offset = cls.path.stat().st_size if cls.path.exists() else 0
+        # Inherited by spawned workers, so their records join the parent's run
+        cls.run_id = os.environ.setdefault("PIPELINE_RUN_ID", uuid.uuid4().hex[:12])
+        cls.trace_allocations = os.getenv("PIPELINE_TRACEMALLOC", "0") == "1"
+        if cls.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @classmethod
+    def new_run(cls) -> str:
+        """Starts a new run id in a long-lived process; later records belong to it."""
+        cls.run_id = os.environ["PIPELINE_RUN_ID"] = uuid.uuid4().hex[:12]
+        cls.offset = cls.path.stat().st_size if cls.path is not None and cls.path.exists() else 0
+        return cls.run_id
+
+    @classmethod
+    def start(cls) -> Dict[str, Any]:
+        """Snapshot taken when an instrumented call begins."""
+        frame = {
+            "wall": time.perf_counter(),
+            "cpu": time.process_time(),
+            "max_rss": cls.max_rss_bytes(),
+            "traced_peak": 0,
+        }
+        if cls.trace_allocations and tracemalloc.is_tracing():
+            stack = cls._stack()
+            if stack:
+                stack[-1]["traced_peak"] = max(stack[-1]["traced_peak"], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            stack.append(frame)
+        return frame
+
+    @classmethod
+    def finish(
+        cls,
+        frame: Dict[str, Any],
+        name: str,
+        step: Optional[str] = None,
+        input_data: Any = None,
+        result: Any = None,
+        status: str = "ok",
+        outputs: Optional[List[Path]] = None,
+        label: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Completes the record for a call and appends it to the metrics file."""
+        max_rss = cls.max_rss_bytes()
+        record = {
+            "run_id": cls.run_id,
+            "ts": time.time(),
+            "pid": os.getpid(),
+            "name": name,
+            "step": step,
+            "label": label,
+            "status": status,
+            "wall_s": round(time.perf_counter() - frame["wall"], 4),
+            "cpu_s": round(time.process_time() - frame["cpu"], 4),
+            "max_rss_mb": round(max_rss / 2**20, 2),
+            "max_rss_delta_mb": round((max_rss - frame["max_rss"]) / 2**20, 2),
+            "traced_peak_mb": None,
+            "input_mb": round(approx_nbytes(input_data) / 2**20, 3) if input_data is not None else None,
+            "output_mb": round(approx_nbytes(result) / 2**20, 3) if result is not None else None,
+            "input_rows": row_count(input_data),
+            "output_rows": row_count(result),
+            "outputs": [str(path) for path in outputs] if outputs else None,
+        }
+        if cls.trace_allocations and tracemalloc.is_tracing():
+            stack = cls._stack()
+            if stack and stack[-1] is frame:
+                stack.pop()
+            peak = max(frame["traced_peak"], tracemalloc.get_traced_memory()[1])
+            if stack:
+                stack[-1]["traced_peak"] = max(stack[-1]["traced_peak"], peak)
+            record["traced_peak_mb"] = round(peak / 2**20, 2)
+        cls.emit(record)
+        return record
+
+    @classmethod
+    def emit(cls, record: Dict[str, Any]):
+        for listener in list(cls.listeners):
+            listener(record)
+        if cls.path is None:
+            return
+        line = json.dumps(record, default=str)
+        with cls._lock:
+            with open(cls.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    @classmethod
+    def records(cls, run_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Records of a run (default the current one) written since `configure`."""
+        run_id = run_id or cls.run_id
+        if cls.path is None or not cls.path.exists():
+            return
+        with open(cls.path, "r", encoding="utf-8") as f:
+            f.seek(cls.offset)
+            for line in f:
+                record = json.loads(line)
+                if record.get("run_id") == run_id:
+                    yield record
+
+    @staticmethod
+    def max_rss_bytes() -> int:
+        if resource is None:
+            return 0
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Reported in bytes on macOS, kilobytes elsewhere
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+    @classmethod
+    def _stack(cls) -> list:
+        if not hasattr(cls._frames, "stack"):
+            cls._frames.stack = []
+        return cls._frames.stack
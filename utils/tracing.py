@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from contextlib import nullcontext
+from functools import wraps
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+
+class Tracer:
+    """
+    Summary
+    ----------
+    Opt-in span tracer and sampling profiler for a pipeline run
+    Spans are exported as a Chrome trace-event file (chrome://tracing, Perfetto);
+    samples as collapsed stacks per step (flamegraph.pl, speedscope).
+
+    Extended Summary
+    ----------
+    - Enabled with ``PIPELINE_TRACE=1`` / ``PIPELINE_PROFILE=1`` or the
+      ``--trace`` / ``--profile`` flags of ``main.py``
+    - Spans nest per thread; timestamps are wall-clock so spans from worker
+      processes line up with the parent's
+    - Worker processes flush their events to part files after each step,
+      merged into the parent's output when it exits
+    - The profiler samples every thread's stack and attributes it to the
+      innermost step span running on that thread
+    """
+    trace_path: Optional[Path] = None
+    profile_path: Optional[Path] = None
+    run_id: Optional[str] = None
+    tracing: bool = False
+    profiling: bool = False
+    sample_interval: float = 0.005
+    _events: List[Dict[str, Any]] = []
+    _samples: Counter = Counter()
+    _lock = threading.Lock()
+    _local = threading.local()
+    _active_steps: Dict[int, str] = {}
+    _sampler: Optional[threading.Thread] = None
+
+    @classmethod
+    def configure(cls, trace_path: Path, profile_path: Path):
+        cls.tracing = os.getenv("PIPELINE_TRACE", "0") == "1"
+        cls.profiling = os.getenv("PIPELINE_PROFILE", "0") == "1"
+        if not (cls.tracing or cls.profiling):
+            return
+        cls.trace_path, cls.profile_path = Path(trace_path), Path(profile_path)
+        cls.trace_path.parent.mkdir(parents=True, exist_ok=True)
+        cls.run_id = os.environ.setdefault("PIPELINE_RUN_ID", uuid.uuid4().hex[:12])
+        if cls.profiling and cls._sampler is None:
+            cls._sampler = threading.Thread(target=cls._sample_loop, name="profiler", daemon=True)
+            cls._sampler.start()
+        if multiprocessing.current_process().name == "MainProcess":
+            atexit.register(cls.write)
+
+    @classmethod
+    def span(cls, name: str, cat: str = "pipeline", step: Optional[str] = None, **args):
+        """Context manager recording a complete event. `step` attributes profiler samples."""
+        if not (cls.tracing or cls.profiling):
+            return nullcontext()
+        return cls._span(name, cat, step, args)
+
+    @classmethod
+    @contextmanager
+    def _span(cls, name: str, cat: str, step: Optional[str], args: Dict[str, Any]):
+        thread_id = threading.get_ident()
+        previous_step = cls._active_steps.get(thread_id)
+        if step is not None:
+            cls._active_steps[thread_id] = step
+        start_us = time.time_ns() // 1000
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration_us = (time.perf_counter_ns() - start) // 1000
+            if step is not None:
+                if previous_step is None:
+                    cls._active_steps.pop(thread_id, None)
+                else:
+                    cls._active_steps[thread_id] = previous_step
+            if cls.tracing:
+                cls._name_thread()
+                event = {
+                    "name": name,
+                    "cat": cat,
+                    "ph": "X",
+                    "ts": start_us,
+                    "dur": duration_us,
+                    "pid": os.getpid(),
+                    "tid": threading.get_native_id(),
+                    "args": {k: str(v) for k, v in args.items()},
+                }
+                with cls._lock:
+                    cls._events.append(event)
+
+    @classmethod
+    def flush_part(cls):
+        """Worker side: writes this process's events and samples to part files."""
+        if not (cls.tracing or cls.profiling):
+            return
+        with cls._lock:
+            events, samples = list(cls._events), dict(cls._samples)
+        if cls.tracing:
+            cls._part_path(cls.trace_path, os.getpid()).write_text(json.dumps(events))
+        if cls.profiling:
+            cls._part_path(cls.profile_path, os.getpid()).write_text(json.dumps(samples))
+
+    @classmethod
+    def write(cls):
+        """Parent side: merges worker part files and writes the trace and profile."""
+        if cls.tracing:
+            with cls._lock:
+                events = list(cls._events)
+            for part in cls._parts(cls.trace_path):
+                events.extend(json.loads(part.read_text()))
+                part.unlink()
+            cls.trace_path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+            logging.info(f"Trace written to ``{cls.trace_path}`` ({len(events)} events)")
+        if cls.profiling:
+            with cls._lock:
+                samples = Counter(cls._samples)
+            for part in cls._parts(cls.profile_path):
+                samples.update(json.loads(part.read_text()))
+                part.unlink()
+            with open(cls.profile_path, "w", encoding="utf-8") as f:
+                for stack, count in samples.most_common():
+                    f.write(f"{stack} {count}\n")
+            logging.info(f"Collapsed stacks written to ``{cls.profile_path}`` ({sum(samples.values())} samples)")
+
+    @classmethod
+    def _sample_loop(cls):
+        own_id = threading.get_ident()
+        while True:
+            time.sleep(cls.sample_interval)
+            frames = sys._current_frames()
+            stacks = []
+            for thread_id, frame in frames.items():
+                if thread_id == own_id:
+                    continue
+                step = cls._active_steps.get(thread_id)
+                if step is None:
+                    continue
+                names = []
+                while frame is not None:
+                    code = frame.f_code
+                    names.append(f"{Path(code.co_filename).stem}.{code.co_name}")
+                    frame = frame.f_back
+                stacks.append(";".join([step] + names[::-1]))
+            del frames
+            if stacks:
+                with cls._lock:
+                    cls._samples.update(stacks)
+
+    @classmethod
+    def _name_thread(cls):
+        """Labels the thread in the trace viewer the first time it records a span."""
+        if getattr(cls._local, "named", False):
+            return
+        cls._local.named = True
+        event = {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+            "args": {"name": threading.current_thread().name},
+        }
+        with cls._lock:
+            cls._events.append(event)
+
+    @classmethod
+    def _part_path(cls, path: Path, pid: int) -> Path:
+        return path.with_name(f".{path.stem}.{cls.run_id}.{pid}.part")
+
+    @classmethod
+    def _parts(cls, path: Path) -> List[Path]:
+        return sorted(path.parent.glob(f".{path.stem}.{cls.run_id}.*.part"))
+
+
+def trace_span(name: str, cat: str = "pipeline", step: Optional[str] = None, **args):
+    """Shorthand for `Tracer.span`."""
+    return Tracer.span(name, cat=cat, step=step, **args)
+
+
+def traced(name: Optional[str] = None, cat: str = "pipeline"):
+    """Decorator recording each call as a span named after the function."""
+    def decorator(func: Callable):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with trace_span(name or func.__qualname__, cat=cat):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator